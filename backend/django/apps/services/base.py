@@ -1,29 +1,54 @@
 import httpx
+from functools import wraps
 from django.conf import settings
 from typing import Dict, Any, Optional
+from .http import get_http_client, on_persistent_loop, run_on_pool_loop
+from .resilience import ResiliencePolicy, get_resilience_policy
+
+def on_pool_loop(method):
+    """
+    Run a service coroutine on a loop that keeps its pooled client, which
+    under WSGI is not the request's own (see ``apps.services.http``)
+    """
+    @wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if self._client is not None or on_persistent_loop():
+            return await method(self, *args, **kwargs)
+        return await run_on_pool_loop(method(self, *args, **kwargs))
+    return wrapper
 
 class BaseService:
-    def __init__(self):
+    _client: Optional[httpx.AsyncClient] = None
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None, policy: Optional[ResiliencePolicy] = None):
         self.fastapi_base_url = settings.FASTAPI_BASE_URL
-        self.client = httpx.AsyncClient(base_url=self.fastapi_base_url)
-    
-    async def make_request(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        self._client = client
+        self._policy = policy
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Injected client, or the process-wide pooled client for the running loop
+        """
+        return self._client or get_http_client()
+
+    @property
+    def policy(self) -> ResiliencePolicy:
         """
-        Make a request to FastAPI with error handling
+        Injected policy, or the process-wide one (see ``FASTAPI_RESILIENCE``)
         """
-        try:
-            response = await self.client.request(
-                method=method,
-                url=endpoint,
-                json=data
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            raise Exception(f"Error communicating with FastAPI: {str(e)}")
+        return self._policy or get_resilience_policy()
     
-    async def close(self):
+    @on_pool_loop
+    async def make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Any] = None,
+        idempotent: Optional[bool] = None
+    ) -> Any:
         """
-        Close the HTTP client
+        Make a request to FastAPI with timeouts, retries and circuit breaking.
+        Only GETs are retried unless ``idempotent`` says otherwise.
         """
-        await self.client.aclose() 
\ No newline at end of file
+        return await self.policy.request(self.client, method, endpoint, data, idempotent=idempotent)
@@ -0,0 +1,75 @@
+"""
+Process-level emission factor table.
+
+Active ``EmissionFactor`` rows are loaded once per process into an immutable
+mapping keyed by ``(transport_mode, vehicle_type, fuel_type)``. Writes through
+the ORM fire ``post_save``/``post_delete`` (see ``apps.suppliers.signals``),
+which drop the local copy. Other workers notice the change on their next
+version check: the version is the row count and latest ``updated_at`` of the
+factor table itself, so it is shared by every process using the database.
+Queryset ``update()`` does not touch ``updated_at``; set it explicitly and
+call ``invalidate_factor_table`` after such updates.
+"""
+import threading
+import time
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional, Tuple
+from django.conf import settings
+from django.db.models import Count, Max
+
+FactorKey = Tuple[str, Optional[str], Optional[str]]
+
+class Factor(NamedTuple):
+    base_emission_factor: float
+    volume_factor: float
+    load_factor_impact: float
+
+_lock = threading.Lock()
+_table: Optional[Mapping[FactorKey, Factor]] = None
+_version: Optional[tuple] = None
+_checked_at = 0.0
+
+def _shared_version() -> tuple:
+    from apps.suppliers.models import EmissionFactor
+    version = EmissionFactor.objects.aggregate(rows=Count('pk'), updated_at=Max('updated_at'))
+    return version['rows'], version['updated_at']
+
+def get_factor_table() -> Mapping[FactorKey, Factor]:
+    """
+    Return the active factor table, reloading it only when invalidated locally
+    or when the shared version has moved since the last check
+    """
+    global _table, _version, _checked_at
+    now = time.monotonic()
+    table = _table
+    if table is not None and now - _checked_at < settings.TRANSPORTATION_SETTINGS['FACTOR_VERSION_CHECK_INTERVAL']:
+        return table
+
+    with _lock:
+        if _table is None or _shared_version() != _version:
+            from apps.suppliers.models import EmissionFactor
+            rows = list(EmissionFactor.objects.values_list(
+                'transport_mode',
+                'vehicle_type',
+                'fuel_type',
+                'base_emission_factor',
+                'volume_factor',
+                'load_factor_impact',
+                'is_active',
+                'updated_at'
+            ))
+            _table = MappingProxyType({
+                (transport_mode, vehicle_type, fuel_type): Factor(base, volume, load)
+                for transport_mode, vehicle_type, fuel_type, base, volume, load, is_active, _ in rows
+                if is_active
+            })
+            # The version of the rows just read, not of a separate query
+            _version = (len(rows), max((row[-1] for row in rows), default=None))
+        _checked_at = now
+        return _table
+
+def invalidate_factor_table() -> None:
+    """Drop this process's table; it is reloaded on next use."""
+    global _table
+    with _lock:
+        _table = None
@@ -0,0 +1,99 @@
+"""
+Shared HTTP client pool for Django -> FastAPI calls.
+
+An ``httpx.AsyncClient`` is bound to the event loop it first runs on, so the
+pool keeps one client per running loop. Under ASGI that is a single client
+per worker process, reused by every request; ``config.asgi`` marks the server
+loop with ``mark_persistent_loop`` and calls ``close_http_clients`` on
+lifespan shutdown.
+
+Under WSGI every async view runs on its own short-lived ``async_to_sync``
+loop, whose client would be used once and never closed. Calls made there are
+handed to one background loop per process instead (``run_on_pool_loop``),
+so its client, and the batchers keyed on it, outlive the request. That
+loop's thread is a daemon; its connections go away with the process.
+"""
+import asyncio
+import contextvars
+import threading
+import weakref
+from typing import Any, Awaitable, Optional
+import httpx
+from django.conf import settings
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_persistent_loops: "weakref.WeakSet[asyncio.AbstractEventLoop]" = weakref.WeakSet()
+_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+_pool_loop_lock = threading.Lock()
+
+def build_http_client() -> httpx.AsyncClient:
+    config = settings.FASTAPI_HTTP_CLIENT
+    return httpx.AsyncClient(
+        base_url=settings.FASTAPI_BASE_URL,
+        # HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+        http2=config['HTTP2'],
+        limits=httpx.Limits(
+            max_connections=config['MAX_CONNECTIONS'],
+            max_keepalive_connections=config['MAX_KEEPALIVE_CONNECTIONS'],
+            keepalive_expiry=config['KEEPALIVE_EXPIRY'],
+        ),
+        timeout=httpx.Timeout(
+            connect=config['CONNECT_TIMEOUT'],
+            read=config['READ_TIMEOUT'],
+            write=config['WRITE_TIMEOUT'],
+            pool=config['POOL_TIMEOUT'],
+        ),
+    )
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the pooled client for the running event loop, creating it on first use
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = _clients[loop] = build_http_client()
+    return client
+
+async def close_http_clients() -> None:
+    """
+    Close the pooled client owned by the running event loop
+    """
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+def mark_persistent_loop() -> None:
+    """
+    Declare the running loop long-lived (an ASGI server's), so calls made on
+    it use its own pooled client
+    """
+    _persistent_loops.add(asyncio.get_running_loop())
+
+def on_persistent_loop() -> bool:
+    loop = asyncio.get_running_loop()
+    return loop is _pool_loop or loop in _persistent_loops
+
+def _get_pool_loop() -> asyncio.AbstractEventLoop:
+    global _pool_loop
+    with _pool_loop_lock:
+        if _pool_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='fastapi-http-pool', daemon=True).start()
+            _pool_loop = loop
+        return _pool_loop
+
+async def _run_in_context(context: contextvars.Context, coro: Awaitable[Any]) -> Any:
+    # Carry the caller's context variables (e.g. a request deadline) across loops
+    return await context.run(asyncio.ensure_future, coro)
+
+async def run_on_pool_loop(coro: Awaitable[Any]) -> Any:
+    """
+    Await ``coro`` on the process's background loop; cancelling the caller
+    cancels it there too
+    """
+    future = asyncio.run_coroutine_threadsafe(
+        _run_in_context(contextvars.copy_context(), coro),
+        _get_pool_loop()
+    )
+    return await asyncio.wrap_future(future)
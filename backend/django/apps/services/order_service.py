@@ -0,0 +1,167 @@
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from typing import Dict, Any, List, Optional, Tuple
+from django.conf import settings
+from django.db import transaction
+from django.utils.dateparse import parse_date
+from ..suppliers.models import Supplier, Material, Order, OrderItem
+from ..suppliers.rollups import rebuild_snapshots
+from .base import BaseService
+
+CENT = Decimal('0.01')
+# OrderItem.quantity / unit_price are DecimalField(max_digits=10, decimal_places=2)
+MAX_ITEM_VALUE = Decimal('99999999.99')
+# OrderItem.total_price / Order.total_amount are DecimalField(max_digits=12, decimal_places=2)
+MAX_TOTAL = Decimal('9999999999.99')
+ORDER_STATUSES = {status for status, _ in Order.STATUS_CHOICES}
+
+def line_total(quantity: Decimal, unit_price: Decimal) -> Decimal:
+    return (quantity * unit_price).quantize(CENT, rounding=ROUND_HALF_UP)
+
+def _decimal(value: Any, name: str, errors: List[str]) -> Optional[Decimal]:
+    if value is None or value == '':
+        errors.append(f"{name} is required")
+        return None
+    try:
+        # str() keeps JSON floats such as 0.1 from turning into binary noise
+        number = Decimal(str(value)).quantize(CENT, rounding=ROUND_HALF_UP)
+    except (InvalidOperation, ValueError):
+        errors.append(f"{name} must be a number")
+        return None
+    if not 0 <= number <= MAX_ITEM_VALUE:
+        errors.append(f"{name} must be between 0 and {MAX_ITEM_VALUE}")
+        return None
+    return number
+
+def _parse_order(row: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+    """Coerce one order object with nested items into model fields."""
+    errors = []
+
+    supplier_id = row.get('supplier_id', row.get('supplier'))
+    try:
+        supplier_id = int(supplier_id)
+    except (TypeError, ValueError):
+        errors.append("supplier is required" if supplier_id in (None, '') else "supplier must be an id")
+
+    try:
+        expected_delivery_date = parse_date(str(row.get('expected_delivery_date') or ''))
+    except ValueError:
+        expected_delivery_date = None
+    if expected_delivery_date is None:
+        errors.append("expected_delivery_date must be an ISO 8601 date")
+
+    status = row.get('status') or 'pending'
+    if status not in ORDER_STATUSES:
+        errors.append(f"status must be one of: {', '.join(sorted(ORDER_STATUSES))}")
+
+    items = []
+    raw_items = row.get('items')
+    if not isinstance(raw_items, list) or not raw_items:
+        errors.append("items must be a non-empty list")
+        raw_items = []
+    for position, item in enumerate(raw_items):
+        item_errors = []
+        if not isinstance(item, dict):
+            errors.append(f"items[{position}]: must be an object")
+            continue
+        material_id = item.get('material_id', item.get('material'))
+        try:
+            material_id = int(material_id)
+        except (TypeError, ValueError):
+            item_errors.append("material must be an id")
+        quantity = _decimal(item.get('quantity'), 'quantity', item_errors)
+        unit_price = _decimal(item.get('unit_price'), 'unit_price', item_errors)
+        errors.extend(f"items[{position}]: {error}" for error in item_errors)
+        if not item_errors:
+            items.append({
+                'material_id': material_id,
+                'quantity': quantity,
+                'unit_price': unit_price,
+                'total_price': line_total(quantity, unit_price),
+                'notes': item.get('notes') or ''
+            })
+
+    total_amount = sum((item['total_price'] for item in items), Decimal('0'))
+    if total_amount > MAX_TOTAL:
+        errors.append(f"order total must not exceed {MAX_TOTAL}")
+
+    order = {
+        'supplier_id': supplier_id,
+        'expected_delivery_date': expected_delivery_date,
+        'status': status,
+        'notes': row.get('notes') or '',
+        'total_amount': total_amount,
+        'items': items
+    }
+    return order, errors
+
+class OrderService(BaseService):
+    def bulk_create_orders(self, rows: List[Dict[str, Any]], created_by=None) -> Dict[str, Any]:
+        """
+        Validate and store many orders with their items at once.
+
+        Suppliers and materials are resolved with one query each, line and
+        order totals are computed in memory with Decimal, and orders and items
+        are inserted with chunked bulk_create inside a single transaction.
+        Invalid orders are skipped and reported by their index in ``rows``.
+        """
+        batch_size = settings.ORDER_SETTINGS['BULK_CREATE_BATCH_SIZE']
+        errors = {}
+
+        parsed = []
+        for index, row in enumerate(rows):
+            order, row_errors = _parse_order(row)
+            if row_errors:
+                errors[index] = row_errors
+            else:
+                parsed.append((index, order))
+
+        existing_suppliers = set(
+            Supplier.objects.filter(
+                id__in={order['supplier_id'] for _, order in parsed}
+            ).values_list('id', flat=True)
+        )
+        existing_materials = set(
+            Material.objects.filter(
+                id__in={item['material_id'] for _, order in parsed for item in order['items']}
+            ).values_list('id', flat=True)
+        )
+
+        orders, items, created = [], [], []
+        for index, order in parsed:
+            row_errors = []
+            if order['supplier_id'] not in existing_suppliers:
+                row_errors.append(f"Supplier {order['supplier_id']} not found")
+            row_errors.extend(
+                f"items[{position}]: Material {item['material_id']} not found"
+                for position, item in enumerate(order['items'])
+                if item['material_id'] not in existing_materials
+            )
+            if row_errors:
+                errors[index] = row_errors
+                continue
+
+            order_items = order.pop('items')
+            instance = Order(**order, created_by=created_by)
+            orders.append(instance)
+            items.extend(OrderItem(order=instance, **item) for item in order_items)
+            created.append({"row": index, "order_id": str(instance.order_id)})
+
+        if orders:
+            with transaction.atomic():
+                Order.objects.bulk_create(orders, batch_size=batch_size)
+                OrderItem.objects.bulk_create(items, batch_size=batch_size)
+                # bulk_create sends no post_save, so refresh the affected rollups here
+                rebuild_snapshots(supplier_ids={order.supplier_id for order in orders})
+
+        return {
+            "success": True,
+            "data": {
+                "total_rows": len(rows),
+                "created": len(orders),
+                "orders": created,
+                "errors": [
+                    {"row": index, "errors": row_errors}
+                    for index, row_errors in sorted(errors.items())
+                ]
+            }
+        }
@@ -0,0 +1,345 @@
+"""
+Failure handling for Django -> FastAPI calls.
+
+Every request made through ``BaseService.make_request`` goes through a
+``ResiliencePolicy``:
+
+* a timeout per endpoint (``ENDPOINT_TIMEOUTS`` glob patterns, else
+  ``DEFAULT_TIMEOUT``), shortened to what is left of an enclosing
+  ``request_deadline``
+* retries with full jitter for idempotent requests that failed on transport
+  errors or 502/503/504, limited by a ``RetryBudget`` shared by all requests so
+  retries cannot multiply the load on an already struggling FastAPI
+* a ``CircuitBreaker`` that rejects calls outright after consecutive failures
+  (transport errors, timeouts and 5xx answers) and lets a single probe
+  through once ``BREAKER_RESET_TIMEOUT`` has passed
+* optional hedging of GETs: when no answer has arrived after ``HEDGE_DELAY``
+  a second identical request is sent and the first good answer wins
+
+The policy for the configured FastAPI URL is shared by the whole process;
+``ResiliencePolicy.stats`` counts what it did and is served by
+``apps.services.views.FastAPIHealthView``.
+"""
+import asyncio
+import contextvars
+import functools
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from fnmatch import fnmatchcase
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional
+import httpx
+from django.conf import settings
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+logger = logging.getLogger(__name__)
+
+# Upstream answers worth retrying; any other 5xx still counts against the breaker
+RETRY_STATUSES = {502, 503, 504}
+
+# Absolute time.monotonic() by which the current task needs its answer
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar('fastapi_deadline', default=None)
+
+@contextmanager
+def request_deadline(seconds: float) -> Iterator[None]:
+    """
+    Bound every FastAPI call made inside the block, retries and backoff
+    included, to ``seconds`` from now
+    """
+    deadline = time.monotonic() + seconds
+    outer = _deadline.get()
+    token = _deadline.set(deadline if outer is None else min(outer, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+def _time_left() -> Optional[float]:
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+class FastAPIError(APIException):
+    status_code = status.HTTP_502_BAD_GATEWAY
+    default_code = 'fastapi_error'
+
+class CircuitOpenError(FastAPIError):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_code = 'fastapi_unavailable'
+
+class FastAPITimeout(FastAPIError):
+    status_code = status.HTTP_504_GATEWAY_TIMEOUT
+    default_code = 'fastapi_timeout'
+
+class RetryBudget:
+    """
+    Token bucket that earns ``ratio`` of a retry per request, starting from
+    (and capped at) ``reserve`` tokens; each retry or hedge spends one.
+    """
+
+    def __init__(self, ratio: float, reserve: float):
+        self.ratio = ratio
+        self.reserve = reserve
+        self._tokens = reserve
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.reserve, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+class CircuitBreaker:
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+    def __init__(self, failure_threshold: int, reset_timeout: float, on_change: Callable[[str], None]):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._on_change = on_change
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            if self.state == self.OPEN and now - self._opened_at >= self.reset_timeout:
+                self._set(self.HALF_OPEN)
+            if self.state == self.CLOSED:
+                return True
+            # A probe that never reported back is given up after reset_timeout
+            if self.state == self.HALF_OPEN and (
+                not self._probing or now - self._probe_started >= self.reset_timeout
+            ):
+                self._probing = True
+                self._probe_started = now
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._probing = False
+            if self.state != self.CLOSED:
+                self._set(self.CLOSED)
+
+    def release_probe(self) -> None:
+        """Let another probe through when this one ended without an answer"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if self.state == self.HALF_OPEN or (
+                self.state == self.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._opened_at = time.monotonic()
+                self._set(self.OPEN)
+
+    def _set(self, state: str) -> None:
+        self.state = state
+        self._on_change(state)
+
+class ResiliencePolicy:
+    def __init__(
+        self,
+        default_timeout: float = 5.0,
+        endpoint_timeouts: Optional[Dict[str, float]] = None,
+        max_retries: int = 2,
+        backoff: float = 0.1,
+        max_backoff: float = 1.0,
+        retry_budget_ratio: float = 0.2,
+        retry_budget_reserve: float = 10,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        hedge_delay: Optional[float] = None
+    ):
+        self.default_timeout = default_timeout
+        self.endpoint_timeouts = endpoint_timeouts or {}
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.hedge_delay = hedge_delay
+        self.budget = RetryBudget(retry_budget_ratio, retry_budget_reserve)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout, self._breaker_changed)
+        self.stats: Counter = Counter()
+
+    @classmethod
+    def from_settings(cls) -> 'ResiliencePolicy':
+        config = settings.FASTAPI_RESILIENCE
+        return cls(
+            default_timeout=config['DEFAULT_TIMEOUT'],
+            endpoint_timeouts=config['ENDPOINT_TIMEOUTS'],
+            max_retries=config['MAX_RETRIES'],
+            backoff=config['RETRY_BACKOFF'],
+            max_backoff=config['RETRY_BACKOFF_MAX'],
+            retry_budget_ratio=config['RETRY_BUDGET_RATIO'],
+            retry_budget_reserve=config['RETRY_BUDGET_RESERVE'],
+            failure_threshold=config['BREAKER_FAILURE_THRESHOLD'],
+            reset_timeout=config['BREAKER_RESET_TIMEOUT'],
+            hedge_delay=config['HEDGE_DELAY']
+        )
+
+    def timeout_for(self, endpoint: str) -> float:
+        for pattern, timeout in self.endpoint_timeouts.items():
+            if fnmatchcase(endpoint, pattern):
+                return timeout
+        return self.default_timeout
+
+    async def request(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        endpoint: str,
+        data: Optional[Any] = None,
+        idempotent: Optional[bool] = None
+    ) -> Any:
+        """
+        Send the request under this policy and return the decoded JSON body
+        """
+        idempotent = method == 'GET' if idempotent is None else idempotent
+        self.stats['requests'] += 1
+        self.budget.deposit()
+
+        attempt = 0
+        while True:
+            time_left = _time_left()
+            if time_left is not None and time_left <= 0:
+                self.stats['timeouts'] += 1
+                raise FastAPITimeout(f"No time left to call {endpoint}")
+            if not self.breaker.allow():
+                self.stats['circuit_rejections'] += 1
+                raise CircuitOpenError(f"FastAPI is unavailable, not calling {endpoint}")
+
+            timeout = self.timeout_for(endpoint)
+            if time_left is not None:
+                timeout = min(timeout, time_left)
+            send = functools.partial(self._send, client, method, endpoint, data, timeout)
+            try:
+                if self.hedge_delay is not None and method == 'GET':
+                    response = await self._hedged(send)
+                else:
+                    response = await send()
+                if response.status_code >= 500:
+                    response.raise_for_status()
+            except httpx.HTTPError as e:
+                self.stats['failures'] += 1
+                self.breaker.record_failure()
+                error = FastAPIError
+                if isinstance(e, httpx.TimeoutException):
+                    self.stats['timeouts'] += 1
+                    error = FastAPITimeout
+                retryable = not isinstance(e, httpx.HTTPStatusError) or e.response.status_code in RETRY_STATUSES
+                if not idempotent or not retryable or attempt >= self.max_retries:
+                    raise error(f"Error communicating with FastAPI: {str(e)}")
+                if not self.budget.withdraw():
+                    self.stats['retry_budget_exhausted'] += 1
+                    raise error(f"Error communicating with FastAPI: {str(e)}")
+                attempt += 1
+                # Full jitter keeps retrying clients from arriving in waves
+                delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+                time_left = _time_left()
+                if time_left is not None and delay >= time_left:
+                    raise error(f"Error communicating with FastAPI: {str(e)}")
+                self.stats['retries'] += 1
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                # Cancelled by the caller or a client disconnect, or failed outside
+                # httpx: says nothing about FastAPI, but a half-open probe must be
+                # handed back or the breaker would wait for it forever
+                self.stats['abandoned'] += 1
+                self.breaker.release_probe()
+                raise
+
+            # FastAPI answered, so it is healthy even if it rejected the request
+            self.breaker.record_success()
+            try:
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                raise FastAPIError(f"Error communicating with FastAPI: {str(e)}")
+            self.stats['successes'] += 1
+            return response.json()
+
+    @staticmethod
+    async def _send(
+        client: httpx.AsyncClient,
+        method: str,
+        endpoint: str,
+        data: Optional[Any],
+        timeout: float
+    ) -> httpx.Response:
+        # A deadline for the whole exchange, not just for each read
+        try:
+            return await asyncio.wait_for(client.request(method, endpoint, json=data), timeout)
+        except asyncio.TimeoutError:
+            raise httpx.TimeoutException(f"No response from {endpoint} within {timeout:g}s")
+
+    async def _hedged(self, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        tasks = [asyncio.ensure_future(send())]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay)
+            if done or not self.budget.withdraw():
+                return await tasks[0]
+
+            self.stats['hedges'] += 1
+            tasks.append(asyncio.ensure_future(send()))
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                good = [
+                    task for task in done
+                    if task.exception() is None and task.result().status_code < 500
+                ]
+                if good:
+                    if good[0] is tasks[1]:
+                        self.stats['hedge_wins'] += 1
+                    return good[0].result()
+                if not pending:
+                    # Both attempts failed; surface the last one
+                    return done.pop().result()
+        finally:
+            # The losing attempt, or both when the caller gave up
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def _breaker_changed(self, state: str) -> None:
+        self.stats[f'circuit_{state}'] += 1
+        log = logger.warning if state == CircuitBreaker.OPEN else logger.info
+        log("FastAPI circuit breaker is now %s; counters: %s", state, dict(self.stats))
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {**self.stats, 'circuit_state': self.breaker.state}
+
+_policy: Optional[ResiliencePolicy] = None
+_policy_lock = threading.Lock()
+
+def get_resilience_policy() -> ResiliencePolicy:
+    """
+    Return the process-wide policy for the configured FastAPI service
+    """
+    global _policy
+    with _policy_lock:
+        if _policy is None:
+            _policy = ResiliencePolicy.from_settings()
+        return _policy
+
+def reset_resilience_policy() -> None:
+    global _policy
+    with _policy_lock:
+        _policy = None
@@ -1,15 +1,79 @@
+import asyncio
+import weakref
+import httpx
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.db.models import Prefetch
+from rest_framework.exceptions import ValidationError
 from typing import Dict, Any, Optional, List
 from apps.suppliers.models import Supplier, Order, OrderItem
 from apps.suppliers.serializers import OrderSerializer, OrderCreateSerializer, SupplierSerializer
-from .base import BaseService
+from .base import BaseService, on_pool_loop
+from .batching import MicroBatcher
+from .resilience import FastAPITimeout, ResiliencePolicy, request_deadline
+
+# One batcher per client, and so per event loop (see apps.services.http)
+_order_metrics_batchers: "weakref.WeakKeyDictionary[httpx.AsyncClient, MicroBatcher]" = weakref.WeakKeyDictionary()
+
+def order_calculation_payload(order_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce an order (serialized or create input) to the fields FastAPI calculates with
+    """
+    return {
+        'supplier_id': order_data.get('supplier_id', order_data.get('supplier')),
+        'expected_delivery_date': order_data.get('expected_delivery_date'),
+        'items': [
+            {
+                'material': item.get('material'),
+                'quantity': item.get('quantity'),
+                'unit_price': item.get('unit_price')
+            }
+            for item in order_data.get('items', [])
+        ]
+    }
+
+async def _calculate_order_batch(service: BaseService, payloads: List[Dict[str, Any]]) -> List[Any]:
+    """
+    One batch request; each order yields its metrics, or the ValidationError
+    for that order alone, since FastAPI validates every order separately
+    """
+    entries = await service.make_request('POST', '/api/orders/calculate/batch', payloads, idempotent=True)
+    return [
+        ValidationError({'order_metrics': entry['errors']}) if entry['errors'] else entry['result']
+        for entry in entries
+    ]
 
 class SupplierService(BaseService):
+    @on_pool_loop
     async def calculate_order_metrics(self, order_data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Send order data to FastAPI for calculations and get results
+        Send order data to FastAPI for calculations and get results. Concurrent
+        calls are coalesced into one batch request (see ``FASTAPI_ORDER_METRICS_BATCH``).
+        """
+        return await self._order_metrics_batcher().submit(order_calculation_payload(order_data))
+
+    async def calculate_order_metrics_batch(self, orders: List[Dict[str, Any]]) -> List[Any]:
         """
-        return await self.make_request('POST', '/api/orders/calculate', order_data)
+        Calculate metrics for many orders in one request; results follow the
+        input order, with a ValidationError in place of each rejected order
+        """
+        return await _calculate_order_batch(
+            self, [order_calculation_payload(order_data) for order_data in orders]
+        )
+
+    def _order_metrics_batcher(self) -> MicroBatcher:
+        client = self.client
+        batcher = _order_metrics_batchers.get(client)
+        if batcher is None:
+            config = settings.FASTAPI_ORDER_METRICS_BATCH
+            # A weak reference, since the batcher is the value kept for this client key
+            client_ref = weakref.ref(client)
+            batcher = _order_metrics_batchers[client] = MicroBatcher(
+                lambda payloads: _calculate_order_batch(BaseService(client_ref(), self._policy), payloads),
+                window=config['WINDOW'],
+                max_batch_size=config['MAX_BATCH_SIZE']
+            )
+        return batcher
     
     async def get_supplier_analytics(self, supplier_id: int) -> Dict[str, Any]:
         """
@@ -17,7 +81,7 @@ class SupplierService(BaseService):
         """
         return await self.make_request('GET', f'/api/suppliers/{supplier_id}/analytics')
     
-    async def create_order(self, order_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def create_order(self, order_data: Dict[str, Any], created_by=None) -> Dict[str, Any]:
         """
         Create an order with calculations from FastAPI
         """
@@ -27,10 +91,13 @@ class SupplierService(BaseService):
         # Add calculated metrics to order data
         order_data.update(metrics)
         
-        # Create order in Django
+        # DRF serializers validate and save through the sync ORM
+        return await sync_to_async(self._save_order)(order_data, created_by)
+    
+    def _save_order(self, order_data: Dict[str, Any], created_by=None) -> Dict[str, Any]:
         serializer = OrderCreateSerializer(data=order_data)
         if serializer.is_valid():
-            order = serializer.save()
+            order = serializer.save(created_by=created_by)
             return OrderSerializer(order).data
         raise Exception(f"Error creating order: {serializer.errors}")
     
@@ -38,18 +105,26 @@ class SupplierService(BaseService):
         """
         Get order history with analytics from FastAPI
         """
-        # Get orders from Django
-        orders = Order.objects.filter(supplier_id=supplier_id)
-        order_data = OrderSerializer(orders, many=True).data
-        
-        # Get analytics from FastAPI
-        analytics = await self.get_supplier_analytics(supplier_id)
+        # The orders query and the FastAPI call run concurrently
+        order_data, analytics = await asyncio.gather(
+            self._get_orders(supplier_id),
+            self.get_supplier_analytics(supplier_id)
+        )
         
         return {
             "orders": order_data,
             "analytics": analytics
         }
     
+    async def _get_orders(self, supplier_id: int) -> List[Dict[str, Any]]:
+        queryset = Order.objects.filter(supplier_id=supplier_id).select_related(
+            'supplier', 'created_by'
+        ).prefetch_related(
+            Prefetch('items', queryset=OrderItem.objects.select_related('material'))
+        )
+        # Everything the serializer reads is loaded up front, so no sync queries follow
+        return OrderSerializer([order async for order in queryset], many=True).data
+    
     async def get_supplier_performance(self, supplier_id: int) -> Dict[str, Any]:
         """
         Get detailed supplier performance metrics
@@ -103,7 +178,9 @@ class SupplierAnalyticsService(BaseService):
         """
         Calculate sustainability score using FastAPI
         """
-        result = await self.make_request('POST', '/api/suppliers/calculate-sustainability', supplier_data)
+        result = await self.make_request(
+            'POST', '/api/suppliers/calculate-sustainability', supplier_data, idempotent=True
+        )
         return result["score"]
     
     async def get_carbon_footprint_trend(self, supplier_id: int) -> Dict[str, Any]:
@@ -146,4 +223,71 @@ class SupplierAnalyticsService(BaseService):
         """
         Get list of green initiatives and their impact
         """
-        return await self.make_request('GET', f'/api/suppliers/{supplier_id}/green-initiatives') 
\ No newline at end of file
+        return await self.make_request('GET', f'/api/suppliers/{supplier_id}/green-initiatives') 
+
+class SupplierOverviewService(BaseService):
+    """
+    Everything the supplier detail page shows, fetched from FastAPI concurrently.
+    Each section has its own deadline, retries included; a section that fails
+    or times out is reported under ``errors`` and the others are still returned.
+    """
+    # Section name -> (service attribute, method), named after the SupplierViewSet actions
+    SECTIONS = {
+        'performance_metrics': ('supplier_service', 'get_supplier_performance'),
+        'risk_assessment': ('supplier_service', 'calculate_supplier_risk'),
+        'capacity_analysis': ('supplier_service', 'get_supplier_capacity'),
+        'compliance_status': ('supplier_service', 'get_supplier_compliance'),
+        'quality_metrics': ('supplier_service', 'get_supplier_quality_metrics'),
+        'financial_health': ('supplier_service', 'get_supplier_financial_health'),
+        'recommendations': ('supplier_service', 'get_supplier_recommendations'),
+        'environmental_impact': ('analytics_service', 'get_environmental_impact'),
+        'carbon_footprint': ('analytics_service', 'get_carbon_footprint_trend'),
+        'energy_consumption': ('analytics_service', 'get_energy_consumption_analysis'),
+        'waste_management': ('analytics_service', 'get_waste_management_metrics'),
+        'water_usage': ('analytics_service', 'get_water_usage_analysis'),
+        'sustainability_goals': ('analytics_service', 'get_sustainability_goals_progress'),
+        'environmental_compliance': ('analytics_service', 'get_environmental_compliance_status'),
+        'green_initiatives': ('analytics_service', 'get_green_initiatives'),
+    }
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None, policy: Optional[ResiliencePolicy] = None):
+        super().__init__(client, policy)
+        self.supplier_service = SupplierService(client, policy)
+        self.analytics_service = SupplierAnalyticsService(client, policy)
+
+    async def get_supplier_overview(
+        self,
+        supplier_id: int,
+        sections: Optional[List[str]] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch the named sections (all when none are given) in parallel
+        """
+        names = list(sections or self.SECTIONS)
+        timeout = timeout if timeout is not None else settings.SUPPLIER_OVERVIEW['SECTION_TIMEOUT']
+        results = await asyncio.gather(
+            *(self._fetch_section(name, supplier_id, timeout) for name in names),
+            return_exceptions=True
+        )
+
+        data, errors = {}, {}
+        for name, result in zip(names, results):
+            if isinstance(result, FastAPITimeout):
+                errors[name] = f"Timed out after {timeout}s"
+            elif isinstance(result, Exception):
+                errors[name] = str(result)
+            else:
+                data[name] = result
+        return {
+            "supplier_id": supplier_id,
+            "sections": data,
+            "errors": errors
+        }
+
+    async def _fetch_section(self, name: str, supplier_id: int, timeout: float) -> Any:
+        service, method = self.SECTIONS[name]
+        # A deadline rather than a cancellation from outside, so the resilience
+        # policy still sees and counts a section that times out
+        with request_deadline(timeout):
+            return await getattr(getattr(self, service), method)(supplier_id)
@@ -1,94 +1,148 @@
-from typing import Dict, Any, List, Optional
-from django.db.models import Avg, Sum
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 from ..suppliers.models import (
     TransportationEmission,
-    EmissionFactor,
     TransportMode,
     VehicleType,
-    FuelType
+    FuelType,
+    Recommendation
 )
 from ..suppliers.models import Supplier
+from ..suppliers.rollups import add_emissions
 from .base import BaseService
+from .emission_factors import get_factor_table
 
-class TransportationService(BaseService):
-    def __init__(self):
-        self._emission_factors_cache = None
-
-    def get_emission_factors(self):
-        if self._emission_factors_cache is None:
-            self._emission_factors_cache = self._initialize_emission_factors()
-        return self._emission_factors_cache
-
-    def _initialize_emission_factors(self):
-        # Default emission factors if not found in database
-        default_factors = {
-            'truck': {
-                'small_truck': {
-                    'diesel': {'base': 0.2, 'volume': 0.1, 'load': 0.05},
-                    'petrol': {'base': 0.22, 'volume': 0.1, 'load': 0.05},
-                    'electric': {'base': 0.1, 'volume': 0.1, 'load': 0.05},
-                    'hybrid': {'base': 0.15, 'volume': 0.1, 'load': 0.05},
-                    'biodiesel': {'base': 0.18, 'volume': 0.1, 'load': 0.05},
-                    'cng': {'base': 0.16, 'volume': 0.1, 'load': 0.05}
-                },
-                'medium_truck': {
-                    'diesel': {'base': 0.3, 'volume': 0.15, 'load': 0.08},
-                    'petrol': {'base': 0.32, 'volume': 0.15, 'load': 0.08},
-                    'electric': {'base': 0.15, 'volume': 0.15, 'load': 0.08},
-                    'hybrid': {'base': 0.2, 'volume': 0.15, 'load': 0.08},
-                    'biodiesel': {'base': 0.25, 'volume': 0.15, 'load': 0.08},
-                    'cng': {'base': 0.22, 'volume': 0.15, 'load': 0.08}
-                },
-                'large_truck': {
-                    'diesel': {'base': 0.4, 'volume': 0.2, 'load': 0.1},
-                    'petrol': {'base': 0.42, 'volume': 0.2, 'load': 0.1},
-                    'electric': {'base': 0.2, 'volume': 0.2, 'load': 0.1},
-                    'hybrid': {'base': 0.25, 'volume': 0.2, 'load': 0.1},
-                    'biodiesel': {'base': 0.35, 'volume': 0.2, 'load': 0.1},
-                    'cng': {'base': 0.3, 'volume': 0.2, 'load': 0.1}
-                }
-            },
-            'train': {
-                None: {
-                    'diesel': {'base': 0.1, 'volume': 0.05, 'load': 0.02},
-                    'electric': {'base': 0.05, 'volume': 0.05, 'load': 0.02}
-                }
-            },
-            'ship': {
-                None: {
-                    'diesel': {'base': 0.15, 'volume': 0.1, 'load': 0.05},
-                    'biodiesel': {'base': 0.12, 'volume': 0.1, 'load': 0.05}
-                }
-            },
-            'plane': {
-                None: {
-                    'jet_fuel': {'base': 0.5, 'volume': 0.3, 'load': 0.15}
-                }
-            }
-        }
-        
-        # Try to get emission factors from database, fallback to defaults if not found
+# Optional secondary dimensions for the emissions summary
+SUMMARY_GROUP_BY = {
+    'vehicle_type': F('vehicle_type'),
+    'fuel_type': F('fuel_type'),
+    'day': TruncDate('created_at'),
+}
+
+TRUE_VALUES = {'1', 'true', 'yes', 'y', 't'}
+
+def compute_emission_metrics(distance, volume, load_factor, return_trip, base_emission_factor, load_factor_impact):
+    """
+    Emission metrics for one shipment leg, or for many at once when given
+    numpy arrays. Returns (total_emissions, emissions_per_km,
+    emissions_per_volume, efficiency_score).
+    """
+    # Base emissions, raised for partially loaded vehicles
+    total_emissions = distance * base_emission_factor * volume
+    total_emissions = total_emissions * (1 + (1 - load_factor) * load_factor_impact)
+    total_emissions = np.where(return_trip, total_emissions * 2, total_emissions)
+
+    emissions_per_km = total_emissions / distance
+    emissions_per_volume = total_emissions / volume
+
+    # Normalize metrics to 0-100 scale and take the weighted average
+    km_score = np.maximum(0, 100 * (1 - emissions_per_km / 2))  # Assuming 2 kg/km as max
+    volume_score = np.maximum(0, 100 * (1 - emissions_per_volume / 5))  # Assuming 5 kg/m3 as max
+    load_score = load_factor * 100
+    efficiency_score = km_score * 0.4 + volume_score * 0.4 + load_score * 0.2
+
+    return total_emissions, emissions_per_km, emissions_per_volume, efficiency_score
+
+def _parse_shipment(row: Dict[str, Any], default_load_factor: float) -> Tuple[Dict[str, Any], List[str]]:
+    """Coerce one JSON object or CSV record into shipment fields."""
+    errors = []
+
+    def number(name, cast=float, default=None):
+        value = row.get(name)
+        if value is None or value == '':
+            if default is None:
+                errors.append(f"{name} is required")
+            return default
         try:
-            from apps.suppliers.models import EmissionFactor
-            for transport_mode, vehicle_types in default_factors.items():
-                for vehicle_type, fuel_types in vehicle_types.items():
-                    for fuel_type, factors in fuel_types.items():
-                        EmissionFactor.objects.get_or_create(
-                            transport_mode=transport_mode,
-                            vehicle_type=vehicle_type,
-                            fuel_type=fuel_type,
-                            defaults={
-                                'base_emission_factor': factors['base'],
-                                'volume_factor': factors['volume'],
-                                'load_factor_impact': factors['load']
-                            }
-                        )
-            return {ef.transport_mode: {ef.vehicle_type: {ef.fuel_type: ef} for ef in EmissionFactor.objects.filter(transport_mode=transport_mode)} for transport_mode in default_factors.keys()}
-        except Exception as e:
-            print(f"Error initializing emission factors: {e}")
-            return default_factors
+            return cast(value)
+        except (TypeError, ValueError):
+            errors.append(f"{name} must be a number")
+            return default
+
+    def choice(name, choices):
+        value = row.get(name) or None
+        if value is not None and value not in choices:
+            errors.append(f"{name} must be one of: {', '.join(choices)}")
+        return value
+
+    shipment = {
+        'supplier_id': number('supplier_id' if 'supplier_id' in row else 'supplier', cast=int),
+        'distance': number('distance'),
+        'volume': number('volume'),
+        'load_factor': number('load_factor', default=default_load_factor),
+        'transport_mode': choice('transport_mode', TransportMode.values),
+        'vehicle_type': choice('vehicle_type', VehicleType.values),
+        'fuel_type': choice('fuel_type', FuelType.values),
+        'return_trip': str(row.get('return_trip', False)).strip().lower() in TRUE_VALUES
+    }
+
+    if shipment['transport_mode'] is None:
+        errors.append("transport_mode is required")
+    if shipment['distance'] is not None and shipment['distance'] <= 0:
+        errors.append("distance must be greater than zero")
+    if shipment['volume'] is not None and shipment['volume'] <= 0:
+        errors.append("volume must be greater than zero")
+    if shipment['load_factor'] is not None and not 0 <= shipment['load_factor'] <= 1:
+        errors.append("load_factor must be between 0 and 1")
+    if shipment['transport_mode'] == TransportMode.TRUCK and not (shipment['vehicle_type'] and shipment['fuel_type']):
+        errors.append("Vehicle type and fuel type are required for road transport")
+
+    return shipment, errors
+
+def recommendation_flags(
+    efficiency_score,
+    transport_mode,
+    vehicle_type,
+    fuel_type,
+    load_factor,
+    emissions_per_km,
+    emissions_per_volume
+):
+    """
+    Recommendation bitmask for one shipment leg, or for many at once when
+    given numpy arrays.
+    """
+    transport_mode, vehicle_type, fuel_type = (
+        np.asarray(value, dtype=object) for value in (transport_mode, vehicle_type, fuel_type)
+    )
+    is_truck = transport_mode == TransportMode.TRUCK
+    smaller_truck = (vehicle_type == VehicleType.SMALL_TRUCK) | (vehicle_type == VehicleType.MEDIUM_TRUCK)
+    fossil_fuel = (fuel_type == FuelType.DIESEL) | (fuel_type == FuelType.PETROL)
 
+    flags = (
+        np.where(is_truck & smaller_truck, int(Recommendation.LARGER_TRUCK), 0)
+        | np.where(is_truck & fossil_fuel, int(Recommendation.CLEANER_FUEL), 0)
+        | np.where(np.asarray(load_factor) < 0.8, int(Recommendation.LOAD_FACTOR), 0)
+        | np.where(np.asarray(emissions_per_km) > 1.5, int(Recommendation.ALTERNATIVE_MODE), 0)
+        | np.where(np.asarray(emissions_per_volume) > 3, int(Recommendation.PACKAGING), 0)
+    )
+    # Only poorly scoring shipments get recommendations
+    return np.where(np.asarray(efficiency_score) < 70, flags, 0)
+
+def emission_recommendation_flags(emission: TransportationEmission) -> int:
+    return int(recommendation_flags(
+        emission.transport_efficiency_score,
+        emission.transport_mode,
+        emission.vehicle_type,
+        emission.fuel_type,
+        emission.load_factor,
+        emission.emissions_per_km,
+        emission.emissions_per_volume
+    ))
+
+def generate_recommendations(emission: TransportationEmission) -> List[str]:
+    """Recommendation messages, from the stored flags once they are computed."""
+    flags = emission.recommendation_flags
+    if flags is None:
+        flags = emission_recommendation_flags(emission)
+    return [str(recommendation.label) for recommendation in Recommendation if flags & recommendation]
+
+class TransportationService(BaseService):
     def calculate_emissions(
         self,
         supplier_id: str,
@@ -105,40 +159,34 @@ class TransportationService(BaseService):
             # Validate supplier
             supplier = Supplier.objects.get(id=supplier_id)
 
-            # Get emission factors
-            emission_factors = self.get_emission_factors()
-            emission_factor = emission_factors[transport_mode][vehicle_type][fuel_type]
-            
-            # Calculate base emissions
-            base_emissions = distance * emission_factor.base_emission_factor * volume
-            
-            # Apply vehicle and fuel multipliers if applicable
-            if transport_mode == TransportMode.TRUCK:
-                if not vehicle_type or not fuel_type:
-                    raise ValueError("Vehicle type and fuel type are required for road transport")
-                
-                vehicle_multiplier = emission_factors[transport_mode][vehicle_type][None].base_emission_factor
-                fuel_multiplier = emission_factors[transport_mode][None][fuel_type].base_emission_factor
-                adjusted_emissions = base_emissions * vehicle_multiplier * fuel_multiplier
-            else:
-                adjusted_emissions = base_emissions
+            if transport_mode == TransportMode.TRUCK and (not vehicle_type or not fuel_type):
+                raise ValueError("Vehicle type and fuel type are required for road transport")
 
-            # Apply load factor impact
-            load_factor_impact = 1 + (1 - load_factor) * emission_factor.load_factor_impact
-            total_emissions = adjusted_emissions * load_factor_impact
+            # The (mode, vehicle, fuel) factor already reflects vehicle and fuel
+            emission_factor = get_factor_table().get((transport_mode, vehicle_type, fuel_type))
+            if emission_factor is None:
+                raise ValueError(f"No active emission factor for {transport_mode}/{vehicle_type}/{fuel_type}")
 
-            # Include return trip if specified
-            if return_trip:
-                total_emissions *= 2
+            total_emissions, emissions_per_km, emissions_per_volume, efficiency_score = (
+                float(value) for value in compute_emission_metrics(
+                    distance,
+                    volume,
+                    load_factor,
+                    return_trip,
+                    emission_factor.base_emission_factor,
+                    emission_factor.load_factor_impact
+                )
+            )
 
-            # Calculate efficiency metrics
-            emissions_per_km = total_emissions / distance
-            emissions_per_volume = total_emissions / volume
-            efficiency_score = self._calculate_efficiency_score(
+            flags = int(recommendation_flags(
+                efficiency_score,
+                transport_mode,
+                vehicle_type,
+                fuel_type,
+                load_factor,
                 emissions_per_km,
-                emissions_per_volume,
-                load_factor
-            )
+                emissions_per_volume
+            ))
 
             # Store the calculation
             emission = TransportationEmission.objects.create(
@@ -153,7 +201,8 @@ class TransportationService(BaseService):
                 total_emissions=total_emissions,
                 emissions_per_km=emissions_per_km,
                 emissions_per_volume=emissions_per_volume,
-                transport_efficiency_score=efficiency_score
+                transport_efficiency_score=efficiency_score,
+                recommendation_flags=flags
             )
 
             return {
@@ -164,7 +213,7 @@ class TransportationService(BaseService):
                     "emissions_per_km": emissions_per_km,
                     "emissions_per_volume": emissions_per_volume,
                     "efficiency_score": efficiency_score,
-                    "recommendations": self._generate_recommendations(emission)
+                    "recommendations": generate_recommendations(emission)
                 }
             }
 
@@ -173,51 +222,117 @@ class TransportationService(BaseService):
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def _calculate_efficiency_score(
-        self,
-        emissions_per_km: float,
-        emissions_per_volume: float,
-        load_factor: float
-    ) -> float:
-        """Calculate transport efficiency score (0-100)."""
-        # Normalize metrics to 0-100 scale
-        km_score = max(0, 100 * (1 - emissions_per_km / 2))  # Assuming 2 kg/km as max
-        volume_score = max(0, 100 * (1 - emissions_per_volume / 5))  # Assuming 5 kg/m3 as max
-        load_score = load_factor * 100
-
-        # Weighted average
-        return (km_score * 0.4 + volume_score * 0.4 + load_score * 0.2)
-
-    def _generate_recommendations(self, emission: TransportationEmission) -> List[str]:
-        """Generate recommendations for improving transportation efficiency."""
-        recommendations = []
-
-        if emission.transport_efficiency_score < 70:
-            if emission.transport_mode == TransportMode.TRUCK:
-                if emission.vehicle_type in [VehicleType.SMALL_TRUCK, VehicleType.MEDIUM_TRUCK]:
-                    recommendations.append("Consider using larger trucks for better efficiency")
-                if emission.fuel_type in [FuelType.DIESEL, FuelType.PETROL]:
-                    recommendations.append("Consider switching to electric or hybrid vehicles")
-            
-            if emission.load_factor < 0.8:
-                recommendations.append("Optimize load factor to reduce empty space")
-            
-            if emission.emissions_per_km > 1.5:
-                recommendations.append("Consider alternative transport modes for long distances")
-            
-            if emission.emissions_per_volume > 3:
-                recommendations.append("Optimize packaging to reduce volume requirements")
+    def bulk_create_emissions(self, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Validate, calculate and store many shipment legs at once.
 
-        return recommendations
+        Suppliers and emission factors are resolved with one query each, the
+        metrics are computed in one vectorized pass and valid rows are
+        inserted with bulk_create in chunks inside a single transaction.
+        Invalid rows are skipped and reported by their index in ``rows``.
+        """
+        config = settings.TRANSPORTATION_SETTINGS
+        errors = {}
+
+        parsed = []
+        for index, row in enumerate(rows):
+            shipment, row_errors = _parse_shipment(row, config['DEFAULT_LOAD_FACTOR'])
+            if row_errors:
+                errors[index] = row_errors
+            else:
+                parsed.append((index, shipment))
+
+        supplier_ids = {shipment['supplier_id'] for _, shipment in parsed}
+        existing_suppliers = set(
+            Supplier.objects.filter(id__in=supplier_ids).values_list('id', flat=True)
+        )
+        factor_table = get_factor_table()
+
+        valid, factors = [], []
+        for index, shipment in parsed:
+            key = (shipment['transport_mode'], shipment['vehicle_type'], shipment['fuel_type'])
+            row_errors = []
+            if shipment['supplier_id'] not in existing_suppliers:
+                row_errors.append(f"Supplier {shipment['supplier_id']} not found")
+            if key not in factor_table:
+                row_errors.append(f"No active emission factor for {'/'.join(str(part) for part in key)}")
+            if row_errors:
+                errors[index] = row_errors
+            else:
+                valid.append(shipment)
+                factors.append(factor_table[key])
+
+        created = 0
+        if valid:
+            column = lambda name, dtype=float: np.array([shipment[name] for shipment in valid], dtype=dtype)
+            load_factor = column('load_factor')
+            total, per_km, per_volume, efficiency = compute_emission_metrics(
+                column('distance'),
+                column('volume'),
+                load_factor,
+                column('return_trip', dtype=bool),
+                np.array([factor.base_emission_factor for factor in factors]),
+                np.array([factor.load_factor_impact for factor in factors])
+            )
+            flags = recommendation_flags(
+                efficiency,
+                column('transport_mode', dtype=object),
+                column('vehicle_type', dtype=object),
+                column('fuel_type', dtype=object),
+                load_factor,
+                per_km,
+                per_volume
+            )
+            emissions = [
+                TransportationEmission(
+                    **shipment,
+                    total_emissions=row_total,
+                    emissions_per_km=row_per_km,
+                    emissions_per_volume=row_per_volume,
+                    transport_efficiency_score=row_efficiency,
+                    recommendation_flags=row_flags
+                )
+                for shipment, row_total, row_per_km, row_per_volume, row_efficiency, row_flags in zip(
+                    valid, *(values.tolist() for values in (total, per_km, per_volume, efficiency, flags))
+                )
+            ]
+            with transaction.atomic():
+                created = len(TransportationEmission.objects.bulk_create(
+                    emissions,
+                    batch_size=config['BULK_CREATE_BATCH_SIZE']
+                ))
+                # bulk_create sends no post_save, so roll the rows up here
+                add_emissions(emissions)
+
+        return {
+            "success": True,
+            "data": {
+                "total_rows": len(rows),
+                "created": created,
+                "errors": [
+                    {"row": index, "errors": row_errors}
+                    for index, row_errors in sorted(errors.items())
+                ]
+            }
+        }
 
     def get_supplier_emissions(
         self,
         supplier_id: str,
         start_date: Optional[timezone.datetime] = None,
-        end_date: Optional[timezone.datetime] = None
+        end_date: Optional[timezone.datetime] = None,
+        group_by: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Get transportation emissions for a supplier within a date range."""
+        """
+        Get transportation emissions for a supplier within a date range.
+
+        Totals, per-mode figures and the optional ``group_by`` breakdown
+        (vehicle_type, fuel_type or day) all come from a single grouped query.
+        """
         try:
+            if group_by is not None and group_by not in SUMMARY_GROUP_BY:
+                raise ValueError(f"group_by must be one of: {', '.join(SUMMARY_GROUP_BY)}")
+
             query = TransportationEmission.objects.filter(supplier_id=supplier_id)
             
             if start_date:
@@ -225,33 +340,68 @@ class TransportationService(BaseService):
             if end_date:
                 query = query.filter(created_at__lte=end_date)
 
-            emissions = query.aggregate(
+            group_fields = {'group_key': SUMMARY_GROUP_BY[group_by]} if group_by else {}
+            rows = query.values('transport_mode', **group_fields).annotate(
                 total_emissions=Sum('total_emissions'),
-                avg_efficiency=Avg('transport_efficiency_score'),
+                efficiency_sum=Sum('transport_efficiency_score'),
                 total_distance=Sum('distance'),
-                total_volume=Sum('volume')
-            )
+                total_volume=Sum('volume'),
+                shipment_count=Count('id')
+            ).order_by('transport_mode')
+
+            totals = _empty_bucket()
+            by_mode = {mode: _empty_bucket() for mode in TransportMode.values}
+            groups = {}
+            for row in rows:
+                buckets = [totals, by_mode.setdefault(row['transport_mode'], _empty_bucket())]
+                if group_by:
+                    buckets.append(groups.setdefault(row['group_key'], _empty_bucket()))
+                for bucket in buckets:
+                    for field in bucket:
+                        bucket[field] += row[field] or 0
+
+            data = {
+                **_finish_bucket(totals),
+                "emissions_by_mode": {
+                    mode: bucket['total_emissions'] for mode, bucket in by_mode.items()
+                },
+                "efficiency_by_mode": {
+                    mode: _finish_bucket(bucket)['average_efficiency'] for mode, bucket in by_mode.items()
+                }
+            }
+            if group_by:
+                data["group_by"] = group_by
+                data["breakdown"] = [
+                    {group_by: _group_label(key), **_finish_bucket(bucket)}
+                    for key, bucket in sorted(groups.items(), key=lambda item: (item[0] is None, str(item[0])))
+                ]
 
             return {
                 "success": True,
-                "data": {
-                    "total_emissions": emissions['total_emissions'] or 0,
-                    "average_efficiency": emissions['avg_efficiency'] or 0,
-                    "total_distance": emissions['total_distance'] or 0,
-                    "total_volume": emissions['total_volume'] or 0,
-                    "emissions_by_mode": self._get_emissions_by_mode(query)
-                }
+                "data": data
             }
 
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def _get_emissions_by_mode(self, query) -> Dict[str, float]:
-        """Get emissions breakdown by transport mode."""
-        emissions_by_mode = {}
-        for mode in TransportMode.values:
-            total = query.filter(transport_mode=mode).aggregate(
-                total=Sum('total_emissions')
-            )['total'] or 0
-            emissions_by_mode[mode] = total
-        return emissions_by_mode 
\ No newline at end of file
+def _empty_bucket() -> Dict[str, float]:
+    return {
+        'total_emissions': 0.0,
+        'efficiency_sum': 0.0,
+        'total_distance': 0.0,
+        'total_volume': 0.0,
+        'shipment_count': 0
+    }
+
+def _finish_bucket(bucket: Dict[str, float]) -> Dict[str, Any]:
+    count = bucket['shipment_count']
+    return {
+        "total_emissions": bucket['total_emissions'],
+        "average_efficiency": bucket['efficiency_sum'] / count if count else 0,
+        "total_distance": bucket['total_distance'],
+        "total_volume": bucket['total_volume'],
+        "shipment_count": count
+    }
+
+def _group_label(key):
+    return key.isoformat() if hasattr(key, 'isoformat') else key
@@ -0,0 +1,13 @@
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from .resilience import get_resilience_policy
+
+class FastAPIHealthView(APIView):
+    """
+    Circuit breaker state and request counters of this worker's FastAPI policy
+    """
+    permission_classes = [IsAuthenticated, IsAdminUser]
+
+    def get(self, request):
+        return Response(get_resilience_policy().snapshot())
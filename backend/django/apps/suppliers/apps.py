@@ -2,4 +2,7 @@ from django.apps import AppConfig
 
 class SuppliersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.suppliers' 
\ No newline at end of file
+    name = 'apps.suppliers'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,193 @@
+"""
+Streaming CSV/NDJSON exports.
+
+Rows are read with ``values_list(...).iterator(chunk_size=...)`` (a server-side
+cursor on PostgreSQL) and written out chunk by chunk through a
+``StreamingHttpResponse``, so memory stays flat however many rows match.
+Under ASGI, Django buffers sync iterators in full, so the same chunks are
+fetched through ``sync_to_async`` and streamed from an async generator instead.
+"""
+import csv
+import json
+from datetime import datetime
+from itertools import islice
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, Sequence, Tuple
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import BaseRenderer
+
+class CSVRenderer(BaseRenderer):
+    media_type = 'text/csv'
+    format = 'csv'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        # Only error bodies are rendered here; exports stream their own rows
+        writer = csv.writer(_Echo())
+        if isinstance(data, dict):
+            return writer.writerow(data.keys()) + writer.writerow(data.values())
+        return writer.writerow([data])
+
+class NDJSONRenderer(BaseRenderer):
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data, cls=DjangoJSONEncoder) + '\n'
+
+EXPORT_RENDERERS = [CSVRenderer, NDJSONRenderer]
+
+EMISSION_EXPORT_COLUMNS = (
+    ('id', 'id'),
+    ('supplier_id', 'supplier_id'),
+    ('supplier_name', 'supplier__name'),
+    ('transport_mode', 'transport_mode'),
+    ('vehicle_type', 'vehicle_type'),
+    ('fuel_type', 'fuel_type'),
+    ('distance', 'distance'),
+    ('volume', 'volume'),
+    ('load_factor', 'load_factor'),
+    ('return_trip', 'return_trip'),
+    ('total_emissions', 'total_emissions'),
+    ('emissions_per_km', 'emissions_per_km'),
+    ('emissions_per_volume', 'emissions_per_volume'),
+    ('transport_efficiency_score', 'transport_efficiency_score'),
+    ('created_at', 'created_at'),
+)
+
+# One row per order item; orders without items export once with empty item columns
+ORDER_EXPORT_COLUMNS = (
+    ('order_id', 'order_id'),
+    ('supplier_id', 'supplier_id'),
+    ('supplier_name', 'supplier__name'),
+    ('order_date', 'order_date'),
+    ('expected_delivery_date', 'expected_delivery_date'),
+    ('actual_delivery_date', 'actual_delivery_date'),
+    ('status', 'status'),
+    ('total_amount', 'total_amount'),
+    ('item_id', 'items__id'),
+    ('material_id', 'items__material_id'),
+    ('material_name', 'items__material__name'),
+    ('quantity', 'items__quantity'),
+    ('unit_price', 'items__unit_price'),
+    ('item_total_price', 'items__total_price'),
+)
+
+class _Echo:
+    """File-like object whose write() hands the formatted line back."""
+    def write(self, value):
+        return value
+
+def _parse_boundary(name: str, value: str):
+    try:
+        parsed = parse_date(value) or parse_datetime(value)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValidationError({name: 'Use an ISO 8601 date or datetime'})
+    if isinstance(parsed, datetime) and timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+def filter_export(queryset, request, date_field: str):
+    """Apply the shared ``supplier_id``, ``start_date`` and ``end_date`` filters."""
+    params = request.query_params
+    if params.get('supplier_id'):
+        try:
+            supplier_id = int(params['supplier_id'])
+        except ValueError:
+            raise ValidationError({'supplier_id': 'Must be an integer'})
+        queryset = queryset.filter(supplier_id=supplier_id)
+    for name, lookup in (('start_date', 'gte'), ('end_date', 'lte')):
+        if params.get(name):
+            boundary = _parse_boundary(name, params[name])
+            # A bare date covers the whole day
+            if not isinstance(boundary, datetime):
+                lookup = f'date__{lookup}'
+            queryset = queryset.filter(**{f'{date_field}__{lookup}': boundary})
+    return queryset
+
+def is_asgi_request(request) -> bool:
+    return isinstance(getattr(request, '_request', request), ASGIRequest)
+
+def _csv_format(header: Sequence[str]) -> Tuple[str, Callable[[tuple], str]]:
+    writer = csv.writer(_Echo())
+    return writer.writerow(header), writer.writerow
+
+def _ndjson_format(header: Sequence[str]) -> Tuple[str, Callable[[tuple], str]]:
+    encoder = DjangoJSONEncoder()
+    return '', lambda row: encoder.encode(dict(zip(header, row))) + '\n'
+
+def _chunks(preamble: str, format_row, rows: Iterable[tuple], chunk_size: int) -> Iterator[str]:
+    if preamble:
+        yield preamble
+    lines = []
+    for row in rows:
+        lines.append(format_row(row))
+        if len(lines) >= chunk_size:
+            yield ''.join(lines)
+            lines = []
+    if lines:
+        yield ''.join(lines)
+
+async def _aiterate(rows: Iterator[tuple], chunk_size: int) -> AsyncIterator[tuple]:
+    # QuerySet.aiterator() runs values_list() queries on the event loop thread,
+    # so pull each chunk from the sync iterator in the ORM's thread instead
+    fetch = sync_to_async(lambda: list(islice(rows, chunk_size)))
+    while True:
+        chunk = await fetch()
+        if not chunk:
+            return
+        for row in chunk:
+            yield row
+
+async def _achunks(preamble: str, format_row, rows: AsyncIterable[tuple], chunk_size: int) -> AsyncIterator[str]:
+    if preamble:
+        yield preamble
+    lines = []
+    async for row in rows:
+        lines.append(format_row(row))
+        if len(lines) >= chunk_size:
+            yield ''.join(lines)
+            lines = []
+    if lines:
+        yield ''.join(lines)
+
+def export_response(
+    queryset,
+    columns: Sequence[Tuple[str, str]],
+    export_format: str,
+    filename: str,
+    asynchronous: bool = False
+) -> StreamingHttpResponse:
+    """
+    Stream ``queryset`` as CSV or NDJSON. ``columns`` pairs each output column
+    name with the ORM lookup it is read from. Pass ``asynchronous=True`` when
+    serving over ASGI (see ``is_asgi_request``).
+    """
+    chunk_size = settings.EXPORT_CHUNK_SIZE
+    header = [name for name, _ in columns]
+    rows = queryset.values_list(*(lookup for _, lookup in columns)).iterator(chunk_size=chunk_size)
+
+    if export_format == NDJSONRenderer.format:
+        (preamble, format_row), renderer = _ndjson_format(header), NDJSONRenderer
+    else:
+        (preamble, format_row), renderer = _csv_format(header), CSVRenderer
+    if asynchronous:
+        content = _achunks(preamble, format_row, _aiterate(rows, chunk_size), chunk_size)
+    else:
+        content = _chunks(preamble, format_row, rows, chunk_size)
+
+    response = StreamingHttpResponse(
+        content,
+        content_type=f'{renderer.media_type}; charset={renderer.charset}'
+    )
+    response['Content-Disposition'] = f'attachment; filename="{filename}.{renderer.format}"'
+    return response
@@ -0,0 +1,56 @@
+import numpy as np
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.services.transportation_service import recommendation_flags
+from apps.suppliers.models import TransportationEmission
+
+FIELDS = (
+    'transport_efficiency_score',
+    'transport_mode',
+    'vehicle_type',
+    'fuel_type',
+    'load_factor',
+    'emissions_per_km',
+    'emissions_per_volume'
+)
+CATEGORICAL = {'transport_mode', 'vehicle_type', 'fuel_type'}
+
+class Command(BaseCommand):
+    help = 'Compute stored recommendation flags for transportation emissions in chunks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Recompute every row, not only rows without flags'
+        )
+
+    def handle(self, *args, **options):
+        queryset = TransportationEmission.objects.order_by('pk')
+        if not options['all']:
+            queryset = queryset.filter(recommendation_flags__isnull=True)
+
+        updated, last_pk = 0, 0
+        while True:
+            rows = list(queryset.filter(pk__gt=last_pk).values_list('pk', *FIELDS)[:options['batch_size']])
+            if not rows:
+                break
+            pks, *columns = zip(*rows)
+            flags = recommendation_flags(*(
+                np.array(column, dtype=object if name in CATEGORICAL else float)
+                for name, column in zip(FIELDS, columns)
+            ))
+            with transaction.atomic():
+                TransportationEmission.objects.bulk_update(
+                    [
+                        TransportationEmission(pk=pk, recommendation_flags=row_flags)
+                        for pk, row_flags in zip(pks, flags.tolist())
+                    ],
+                    ['recommendation_flags']
+                )
+            updated += len(pks)
+            last_pk = pks[-1]
+            self.stdout.write(f'Updated {updated} emissions')
+
+        self.stdout.write(self.style.SUCCESS(f'Backfilled recommendation flags for {updated} emissions'))
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from apps.suppliers.rollups import rebuild_snapshots
+
+class Command(BaseCommand):
+    help = 'Recompute every SupplierMetricsSnapshot from orders, emissions and assessments'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument(
+            '--supplier',
+            type=int,
+            action='append',
+            dest='suppliers',
+            help='Only rebuild this supplier id (repeatable)'
+        )
+
+    def handle(self, *args, **options):
+        rebuilt = rebuild_snapshots(batch_size=options['batch_size'], supplier_ids=options['suppliers'])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt metrics snapshots for {rebuilt} suppliers'))
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('suppliers', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['supplier', 'order_date'], name='order_supplier_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['status'], name='order_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='supplier',
+            index=models.Index(fields=['created_at', 'id'], name='supplier_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='supplierassessment',
+            index=models.Index(fields=['supplier', 'assessment_date'], name='assessment_supplier_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transportationemission',
+            index=models.Index(fields=['supplier', 'created_at'], name='emission_supplier_created_idx'),
+        ),
+    ]
@@ -0,0 +1,53 @@
+from django.db import migrations
+
+# (transport_mode, vehicle_type, fuel_type): (base, volume, load factor impact)
+DEFAULT_FACTORS = {
+    ('truck', 'small_truck', 'diesel'): (0.2, 0.1, 0.05),
+    ('truck', 'small_truck', 'petrol'): (0.22, 0.1, 0.05),
+    ('truck', 'small_truck', 'electric'): (0.1, 0.1, 0.05),
+    ('truck', 'small_truck', 'hybrid'): (0.15, 0.1, 0.05),
+    ('truck', 'small_truck', 'biodiesel'): (0.18, 0.1, 0.05),
+    ('truck', 'small_truck', 'cng'): (0.16, 0.1, 0.05),
+    ('truck', 'medium_truck', 'diesel'): (0.3, 0.15, 0.08),
+    ('truck', 'medium_truck', 'petrol'): (0.32, 0.15, 0.08),
+    ('truck', 'medium_truck', 'electric'): (0.15, 0.15, 0.08),
+    ('truck', 'medium_truck', 'hybrid'): (0.2, 0.15, 0.08),
+    ('truck', 'medium_truck', 'biodiesel'): (0.25, 0.15, 0.08),
+    ('truck', 'medium_truck', 'cng'): (0.22, 0.15, 0.08),
+    ('truck', 'large_truck', 'diesel'): (0.4, 0.2, 0.1),
+    ('truck', 'large_truck', 'petrol'): (0.42, 0.2, 0.1),
+    ('truck', 'large_truck', 'electric'): (0.2, 0.2, 0.1),
+    ('truck', 'large_truck', 'hybrid'): (0.25, 0.2, 0.1),
+    ('truck', 'large_truck', 'biodiesel'): (0.35, 0.2, 0.1),
+    ('truck', 'large_truck', 'cng'): (0.3, 0.2, 0.1),
+    ('train', None, 'diesel'): (0.1, 0.05, 0.02),
+    ('train', None, 'electric'): (0.05, 0.05, 0.02),
+    ('ship', None, 'diesel'): (0.15, 0.1, 0.05),
+    ('ship', None, 'biodiesel'): (0.12, 0.1, 0.05),
+    ('plane', None, 'jet_fuel'): (0.5, 0.3, 0.15),
+}
+
+def seed_emission_factors(apps, schema_editor):
+    EmissionFactor = apps.get_model('suppliers', 'EmissionFactor')
+    for (transport_mode, vehicle_type, fuel_type), (base, volume, load) in DEFAULT_FACTORS.items():
+        EmissionFactor.objects.get_or_create(
+            transport_mode=transport_mode,
+            vehicle_type=vehicle_type,
+            fuel_type=fuel_type,
+            defaults={
+                'base_emission_factor': base,
+                'volume_factor': volume,
+                'load_factor_impact': load
+            }
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('suppliers', '0002_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_emission_factors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('suppliers', '0003_seed_emission_factors'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transportationemission',
+            name='recommendation_flags',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='Bitmask of Recommendation codes; null until computed', null=True),
+        ),
+    ]
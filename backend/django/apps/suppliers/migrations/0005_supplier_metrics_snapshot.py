@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('suppliers', '0004_emission_recommendation_flags'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SupplierMetricsSnapshot',
+            fields=[
+                ('supplier', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='metrics_snapshot', serialize=False, to='suppliers.supplier')),
+                ('order_count', models.PositiveIntegerField(default=0)),
+                ('total_spend', models.DecimalField(decimal_places=2, default=0, help_text='Sum of order item totals, excluding cancelled orders', max_digits=14)),
+                ('delivered_order_count', models.PositiveIntegerField(default=0)),
+                ('on_time_order_count', models.PositiveIntegerField(default=0)),
+                ('emission_count', models.PositiveIntegerField(default=0)),
+                ('total_emissions', models.FloatField(default=0, help_text='Total emissions in kg CO2e')),
+                ('efficiency_score_sum', models.FloatField(default=0)),
+                ('latest_assessment_score', models.DecimalField(blank=True, decimal_places=2, max_digits=5, null=True)),
+                ('latest_assessment_date', models.DateField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Supplier Metrics Snapshot',
+                'verbose_name_plural': 'Supplier Metrics Snapshots',
+            },
+        ),
+    ]
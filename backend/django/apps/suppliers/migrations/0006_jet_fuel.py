@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('suppliers', '0005_supplier_metrics_snapshot'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='emissionfactor',
+            name='fuel_type',
+            field=models.CharField(blank=True, choices=[('diesel', 'Diesel'), ('petrol', 'Petrol'), ('electric', 'Electric'), ('hybrid', 'Hybrid'), ('biodiesel', 'Biodiesel'), ('cng', 'Compressed Natural Gas'), ('jet_fuel', 'Jet Fuel')], help_text='Type of fuel used', max_length=20, null=True),
+        ),
+        migrations.AlterField(
+            model_name='transportationemission',
+            name='fuel_type',
+            field=models.CharField(blank=True, choices=[('diesel', 'Diesel'), ('petrol', 'Petrol'), ('electric', 'Electric'), ('hybrid', 'Hybrid'), ('biodiesel', 'Biodiesel'), ('cng', 'Compressed Natural Gas'), ('jet_fuel', 'Jet Fuel')], help_text='Type of fuel used', max_length=20, null=True),
+        ),
+    ]
@@ -0,0 +1,82 @@
+from django.db import migrations
+from django.db.models import Count, F, OuterRef, Q, Subquery, Sum
+
+BATCH_SIZE = 500
+
+
+def backfill_snapshots(apps, schema_editor):
+    """
+    Create the snapshots of suppliers that predate them. This repeats the
+    grouped queries of ``apps.suppliers.rollups`` on the historical models,
+    so later schema changes cannot break it.
+    """
+    Supplier = apps.get_model('suppliers', 'Supplier')
+    SupplierAssessment = apps.get_model('suppliers', 'SupplierAssessment')
+    Order = apps.get_model('suppliers', 'Order')
+    OrderItem = apps.get_model('suppliers', 'OrderItem')
+    TransportationEmission = apps.get_model('suppliers', 'TransportationEmission')
+    SupplierMetricsSnapshot = apps.get_model('suppliers', 'SupplierMetricsSnapshot')
+
+    missing = Supplier.objects.filter(metrics_snapshot__isnull=True).order_by('id').values_list('id', flat=True)
+    delivered = Q(actual_delivery_date__isnull=False) & ~Q(status='cancelled')
+    latest = SupplierAssessment.objects.filter(
+        supplier=OuterRef('pk'),
+        score__isnull=False
+    ).order_by('-assessment_date', '-created_at')
+
+    last_id = 0
+    while True:
+        chunk = list(missing.filter(id__gt=last_id)[:BATCH_SIZE])
+        if not chunk:
+            return
+        snapshots = {supplier_id: SupplierMetricsSnapshot(supplier_id=supplier_id) for supplier_id in chunk}
+
+        for row in Order.objects.filter(supplier_id__in=chunk).values('supplier_id').annotate(
+            order_count=Count('order_id'),
+            delivered_order_count=Count('order_id', filter=delivered),
+            on_time_order_count=Count(
+                'order_id',
+                filter=delivered & Q(actual_delivery_date__lte=F('expected_delivery_date'))
+            )
+        ).order_by():
+            snapshot = snapshots[row['supplier_id']]
+            snapshot.order_count = row['order_count']
+            snapshot.delivered_order_count = row['delivered_order_count']
+            snapshot.on_time_order_count = row['on_time_order_count']
+
+        for row in OrderItem.objects.filter(order__supplier_id__in=chunk).exclude(
+            order__status='cancelled'
+        ).values('order__supplier_id').annotate(total_spend=Sum('total_price')).order_by():
+            snapshots[row['order__supplier_id']].total_spend = row['total_spend'] or 0
+
+        for row in TransportationEmission.objects.filter(supplier_id__in=chunk).values('supplier_id').annotate(
+            emission_count=Count('id'),
+            total_emissions=Sum('total_emissions'),
+            efficiency_score_sum=Sum('transport_efficiency_score')
+        ).order_by():
+            snapshot = snapshots[row['supplier_id']]
+            snapshot.emission_count = row['emission_count']
+            snapshot.total_emissions = row['total_emissions'] or 0
+            snapshot.efficiency_score_sum = row['efficiency_score_sum'] or 0
+
+        for row in Supplier.objects.filter(id__in=chunk).annotate(
+            latest_assessment_score=Subquery(latest.values('score')[:1]),
+            latest_assessment_date=Subquery(latest.values('assessment_date')[:1])
+        ).values('id', 'latest_assessment_score', 'latest_assessment_date'):
+            snapshot = snapshots[row['id']]
+            snapshot.latest_assessment_score = row['latest_assessment_score']
+            snapshot.latest_assessment_date = row['latest_assessment_date']
+
+        SupplierMetricsSnapshot.objects.bulk_create(snapshots.values(), ignore_conflicts=True)
+        last_id = chunk[-1]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('suppliers', '0006_jet_fuel'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_snapshots, migrations.RunPython.noop),
+    ]
@@ -119,13 +119,20 @@ class Supplier(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Cursor pagination key for the supplier list
+            models.Index(fields=['created_at', 'id'], name='supplier_created_idx'),
+        ]
         
     def __str__(self):
         return self.name 
     
     @property
     def total_orders(self):
-        return self.orders.count()
+        try:
+            return self.metrics_snapshot.order_count
+        except models.ObjectDoesNotExist:
+            return self.orders.count()
     
     @property
     def order_history(self):
@@ -196,12 +203,17 @@ class Order(models.Model):
     
     class Meta:
         ordering = ['-order_date']
+        indexes = [
+            models.Index(fields=['supplier', 'order_date'], name='order_supplier_date_idx'),
+            models.Index(fields=['status'], name='order_status_idx'),
+        ]
     
     def __str__(self):
         return f"Order {self.order_id} - {self.supplier.name}"
     
     def save(self, *args, **kwargs):
-        if not self.total_amount:
+        # A new order has no stored items yet; creators pass total_amount
+        if not self.total_amount and not self._state.adding:
             self.total_amount = sum(item.total_price for item in self.items.all())
         super().save(*args, **kwargs)
 
@@ -283,6 +295,9 @@ class SupplierAssessment(models.Model):
     
     class Meta:
         ordering = ['-assessment_date', '-created_at']
+        indexes = [
+            models.Index(fields=['supplier', 'assessment_date'], name='assessment_supplier_date_idx'),
+        ]
         
     def __str__(self):
         return f"{self.title} - {self.supplier.name}"
@@ -307,6 +322,15 @@ class FuelType(models.TextChoices):
     HYBRID = 'hybrid', _('Hybrid')
     BIODIESEL = 'biodiesel', _('Biodiesel')
     CNG = 'cng', _('Compressed Natural Gas')
+    JET_FUEL = 'jet_fuel', _('Jet Fuel')
+
+class Recommendation(models.IntegerChoices):
+    """Efficiency recommendations, stored as bit flags on TransportationEmission"""
+    LARGER_TRUCK = 1, _('Consider using larger trucks for better efficiency')
+    CLEANER_FUEL = 2, _('Consider switching to electric or hybrid vehicles')
+    LOAD_FACTOR = 4, _('Optimize load factor to reduce empty space')
+    ALTERNATIVE_MODE = 8, _('Consider alternative transport modes for long distances')
+    PACKAGING = 16, _('Optimize packaging to reduce volume requirements')
 
 class TransportationEmission(models.Model):
     supplier = models.ForeignKey(
@@ -365,11 +389,19 @@ class TransportationEmission(models.Model):
         validators=[MinValueValidator(0), MaxValueValidator(100)],
         help_text=_('Transport efficiency score (0-100)')
     )
+    recommendation_flags = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        help_text=_('Bitmask of Recommendation codes; null until computed')
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['supplier', 'created_at'], name='emission_supplier_created_idx'),
+        ]
         verbose_name = _('Transportation Emission')
         verbose_name_plural = _('Transportation Emissions')
 
@@ -419,4 +451,49 @@ class EmissionFactor(models.Model):
         verbose_name_plural = _('Emission Factors')
 
     def __str__(self):
-        return f"{self.transport_mode} - {self.vehicle_type or 'N/A'} - {self.fuel_type or 'N/A'}" 
\ No newline at end of file
+        return f"{self.transport_mode} - {self.vehicle_type or 'N/A'} - {self.fuel_type or 'N/A'}" 
+class SupplierMetricsSnapshot(models.Model):
+    """
+    Per-supplier rollup kept current by the signals in ``apps.suppliers.signals``
+    and rebuilt in full by ``manage.py rebuild_supplier_metrics``
+    """
+    supplier = models.OneToOneField(
+        Supplier,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='metrics_snapshot'
+    )
+    order_count = models.PositiveIntegerField(default=0)
+    total_spend = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        help_text=_('Sum of order item totals, excluding cancelled orders')
+    )
+    delivered_order_count = models.PositiveIntegerField(default=0)
+    on_time_order_count = models.PositiveIntegerField(default=0)
+    emission_count = models.PositiveIntegerField(default=0)
+    total_emissions = models.FloatField(default=0, help_text=_('Total emissions in kg CO2e'))
+    efficiency_score_sum = models.FloatField(default=0)
+    latest_assessment_score = models.DecimalField(max_digits=5, decimal_places=2, null=True, blank=True)
+    latest_assessment_date = models.DateField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _('Supplier Metrics Snapshot')
+        verbose_name_plural = _('Supplier Metrics Snapshots')
+
+    def __str__(self):
+        return f"Metrics - {self.supplier_id}"
+
+    @property
+    def on_time_delivery_rate(self):
+        if not self.delivered_order_count:
+            return None
+        return self.on_time_order_count / self.delivered_order_count
+
+    @property
+    def average_efficiency(self):
+        if not self.emission_count:
+            return None
+        return self.efficiency_score_sum / self.emission_count
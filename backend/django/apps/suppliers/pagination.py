@@ -0,0 +1,21 @@
+from rest_framework.pagination import CursorPagination
+
+class StandardCursorPagination(CursorPagination):
+    """
+    Keyset pagination: pages are fetched with a WHERE on the ordering key, so
+    deep pages cost the same as the first and no COUNT query is issued
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+    # Trailing unique field keeps the ordering total for rows sharing a timestamp
+    ordering = ('-created_at', '-id')
+
+class OrderCursorPagination(StandardCursorPagination):
+    ordering = ('-order_date', '-order_id')
+
+class SupplierAssessmentCursorPagination(StandardCursorPagination):
+    ordering = ('-assessment_date', '-created_at', '-id')
+
+class SupplierMetricsCursorPagination(StandardCursorPagination):
+    ordering = ('supplier_id',)
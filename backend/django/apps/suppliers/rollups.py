@@ -0,0 +1,149 @@
+"""
+Maintenance of ``SupplierMetricsSnapshot`` rows.
+
+Each group of snapshot columns is recomputed from its source table for a
+single supplier when one of that supplier's rows changes. New emissions,
+the hot insert path, are added as deltas instead. ``rebuild_snapshots``
+recomputes every supplier in chunks with grouped queries.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Sequence
+from django.db.models import Count, F, OuterRef, Q, Subquery, Sum
+from django.utils import timezone
+from .models import (
+    Supplier,
+    SupplierAssessment,
+    Order,
+    OrderItem,
+    TransportationEmission,
+    SupplierMetricsSnapshot
+)
+
+def _order_metrics(supplier_ids: Sequence[int]) -> Dict[int, dict]:
+    metrics = defaultdict(dict)
+    delivered = Q(actual_delivery_date__isnull=False) & ~Q(status='cancelled')
+    for row in Order.objects.filter(supplier_id__in=supplier_ids).values('supplier_id').annotate(
+        order_count=Count('order_id'),
+        delivered_order_count=Count('order_id', filter=delivered),
+        on_time_order_count=Count(
+            'order_id',
+            filter=delivered & Q(actual_delivery_date__lte=F('expected_delivery_date'))
+        )
+    ).order_by():
+        metrics[row.pop('supplier_id')].update(row)
+    for row in OrderItem.objects.filter(order__supplier_id__in=supplier_ids).exclude(
+        order__status='cancelled'
+    ).values('order__supplier_id').annotate(total_spend=Sum('total_price')).order_by():
+        metrics[row['order__supplier_id']]['total_spend'] = row['total_spend']
+    return {
+        supplier_id: {
+            'order_count': metrics[supplier_id].get('order_count', 0),
+            'delivered_order_count': metrics[supplier_id].get('delivered_order_count', 0),
+            'on_time_order_count': metrics[supplier_id].get('on_time_order_count', 0),
+            'total_spend': metrics[supplier_id].get('total_spend') or 0
+        }
+        for supplier_id in supplier_ids
+    }
+
+def _emission_metrics(supplier_ids: Sequence[int]) -> Dict[int, dict]:
+    rows = {
+        row.pop('supplier_id'): row
+        for row in TransportationEmission.objects.filter(supplier_id__in=supplier_ids).values(
+            'supplier_id'
+        ).annotate(
+            emission_count=Count('id'),
+            total_emissions=Sum('total_emissions'),
+            efficiency_score_sum=Sum('transport_efficiency_score')
+        ).order_by()
+    }
+    empty = {'emission_count': 0, 'total_emissions': 0.0, 'efficiency_score_sum': 0.0}
+    return {supplier_id: rows.get(supplier_id, empty) for supplier_id in supplier_ids}
+
+def _assessment_metrics(supplier_ids: Sequence[int]) -> Dict[int, dict]:
+    latest = SupplierAssessment.objects.filter(
+        supplier=OuterRef('pk'),
+        score__isnull=False
+    ).order_by('-assessment_date', '-created_at')
+    return {
+        row.pop('id'): row
+        for row in Supplier.objects.filter(id__in=supplier_ids).annotate(
+            latest_assessment_score=Subquery(latest.values('score')[:1]),
+            latest_assessment_date=Subquery(latest.values('assessment_date')[:1])
+        ).values('id', 'latest_assessment_score', 'latest_assessment_date')
+    }
+
+# Snapshot column groups and the source query that fills each one
+METRIC_GROUPS = {
+    'orders': _order_metrics,
+    'emissions': _emission_metrics,
+    'assessments': _assessment_metrics,
+}
+
+def _compute(supplier_id: int, groups: Iterable[str]) -> dict:
+    values = {}
+    for group in groups:
+        values.update(METRIC_GROUPS[group]([supplier_id]).get(supplier_id, {}))
+    return values
+
+def refresh_snapshot(supplier_id: int, *groups: str, create: bool = True) -> None:
+    """
+    Recompute the given column groups (all when none are named) for one
+    supplier. With ``create=False`` a missing snapshot is left missing, which
+    keeps cascading supplier deletes from re-inserting it.
+    """
+    values = _compute(supplier_id, groups or METRIC_GROUPS)
+    updated = SupplierMetricsSnapshot.objects.filter(supplier_id=supplier_id).update(
+        updated_at=timezone.now(),
+        **values
+    )
+    if not updated and create:
+        # First snapshot for this supplier: fill every group, not only the changed one
+        SupplierMetricsSnapshot.objects.update_or_create(
+            supplier_id=supplier_id,
+            defaults=_compute(supplier_id, METRIC_GROUPS)
+        )
+
+def add_emissions(emissions: Iterable[TransportationEmission]) -> None:
+    """Add newly inserted emissions to their suppliers' snapshots."""
+    deltas = defaultdict(lambda: [0, 0.0, 0.0])
+    for emission in emissions:
+        delta = deltas[emission.supplier_id]
+        delta[0] += 1
+        delta[1] += emission.total_emissions
+        delta[2] += emission.transport_efficiency_score
+
+    for supplier_id, (count, total, efficiency) in deltas.items():
+        updated = SupplierMetricsSnapshot.objects.filter(supplier_id=supplier_id).update(
+            emission_count=F('emission_count') + count,
+            total_emissions=F('total_emissions') + total,
+            efficiency_score_sum=F('efficiency_score_sum') + efficiency,
+            updated_at=timezone.now()
+        )
+        if not updated:
+            # No snapshot yet: the full recompute already includes the new rows
+            refresh_snapshot(supplier_id)
+
+def rebuild_snapshots(batch_size: int = 500, supplier_ids: Optional[Iterable[int]] = None) -> int:
+    """Recompute every snapshot from the source tables; returns the supplier count."""
+    queryset = Supplier.objects.order_by('id').values_list('id', flat=True)
+    if supplier_ids is not None:
+        queryset = queryset.filter(id__in=list(supplier_ids))
+    fields = [field.name for field in SupplierMetricsSnapshot._meta.concrete_fields if not field.primary_key]
+
+    rebuilt, last_id = 0, 0
+    while True:
+        chunk = list(queryset.filter(id__gt=last_id)[:batch_size])
+        if not chunk:
+            return rebuilt
+        values = {supplier_id: {} for supplier_id in chunk}
+        for compute in METRIC_GROUPS.values():
+            for supplier_id, group_values in compute(chunk).items():
+                values[supplier_id].update(group_values)
+        SupplierMetricsSnapshot.objects.bulk_create(
+            [SupplierMetricsSnapshot(supplier_id=supplier_id, **row) for supplier_id, row in values.items()],
+            update_conflicts=True,
+            unique_fields=['supplier'],
+            update_fields=fields
+        )
+        rebuilt += len(chunk)
+        last_id = chunk[-1]
@@ -1,3 +1,5 @@
+from decimal import Decimal
+from django.db import transaction
 from rest_framework import serializers
 from .models import (
     Supplier,
@@ -7,9 +9,32 @@ from .models import (
     Order,
     OrderItem,
     TransportationEmission,
-    EmissionFactor
+    EmissionFactor,
+    SupplierMetricsSnapshot
 )
 
+def requested_fields(request):
+    """
+    Field names from a comma-separated ``?fields=`` query parameter, or None
+    """
+    if request is None:
+        return None
+    fields = request.query_params.get('fields')
+    if not fields:
+        return None
+    return {name.strip() for name in fields.split(',') if name.strip()}
+
+class SparseFieldsetMixin:
+    """
+    Drop every field not listed in ``?fields=``; unknown names are ignored
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fields = requested_fields(self.context.get('request'))
+        if fields is not None:
+            for name in set(self.fields) - fields:
+                self.fields.pop(name)
+
 class MaterialSerializer(serializers.ModelSerializer):
     class Meta:
         model = Material
@@ -37,7 +62,19 @@ class OrderItemSerializer(serializers.ModelSerializer):
                  'created_at', 'updated_at']
         read_only_fields = ['created_at', 'updated_at', 'total_price']
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    created_by_name = serializers.CharField(source='created_by.get_full_name', read_only=True)
+    supplier_name = serializers.CharField(source='supplier.name', read_only=True)
+    
+    class Meta:
+        model = Order
+        fields = ['order_id', 'supplier', 'supplier_name', 'order_date',
+                 'expected_delivery_date', 'actual_delivery_date', 'status',
+                 'total_amount', 'created_by', 'created_by_name',
+                 'created_at', 'updated_at']
+        read_only_fields = fields
+
+class OrderSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     items = OrderItemSerializer(many=True, read_only=True)
     created_by_name = serializers.CharField(source='created_by.get_full_name', read_only=True)
     supplier_name = serializers.CharField(source='supplier.name', read_only=True)
@@ -58,15 +95,28 @@ class OrderCreateSerializer(serializers.ModelSerializer):
         fields = ['supplier', 'expected_delivery_date', 'notes', 'items']
     
     def create(self, validated_data):
-        items_data = validated_data.pop('items')
-        order = Order.objects.create(**validated_data)
-        
-        for item_data in items_data:
-            OrderItem.objects.create(order=order, **item_data)
+        from ..services.order_service import line_total
+        from .rollups import refresh_snapshot
+
+        items = [
+            OrderItem(**item_data, total_price=line_total(item_data['quantity'], item_data['unit_price']))
+            for item_data in validated_data.pop('items')
+        ]
+        validated_data['total_amount'] = sum((item.total_price for item in items), Decimal('0'))
+
+        order = Order(**validated_data)
+        for item in items:
+            item.order = order
+        with transaction.atomic():
+            # bulk_create sends no post_save for the order or its items, so the
+            # supplier's order rollup is refreshed once, after both are inserted
+            Order.objects.bulk_create([order])
+            OrderItem.objects.bulk_create(items)
+            refresh_snapshot(order.supplier_id, 'orders')
         
         return order
 
-class SupplierAssessmentSerializer(serializers.ModelSerializer):
+class SupplierAssessmentSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     created_by_name = serializers.CharField(source='created_by.get_full_name', read_only=True)
     
     class Meta:
@@ -76,11 +126,26 @@ class SupplierAssessmentSerializer(serializers.ModelSerializer):
                  'updated_at', 'created_by', 'created_by_name']
         read_only_fields = ['created_at', 'updated_at', 'created_by']
 
-class SupplierSerializer(serializers.ModelSerializer):
+class SupplierListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    total_orders = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = Supplier
+        fields = ['id', 'name', 'contact_person', 'email', 'phone',
+                 'min_supply_capacity', 'max_supply_capacity', 'current_capacity',
+                 'transportation_mode', 'environmental_certification', 'carbon_footprint',
+                 'renewable_energy_usage', 'total_orders', 'created_at', 'updated_at', 'created_by']
+        read_only_fields = fields
+    
+    def get_total_orders(self, obj) -> int:
+        # Read from the metrics snapshot that SupplierViewSet.get_queryset joins in
+        return obj.total_orders
+
+class SupplierSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     materials = SupplierMaterialSerializer(source='suppliermaterial_set', many=True, read_only=True)
-    assessments = SupplierAssessmentSerializer(many=True, read_only=True)
+    assessments = SupplierAssessmentSerializer(source='supplier_assessments', many=True, read_only=True)
     orders = OrderSerializer(many=True, read_only=True)
-    total_orders = serializers.IntegerField(read_only=True)
+    total_orders = serializers.SerializerMethodField()
     
     class Meta:
         model = Supplier
@@ -91,6 +156,10 @@ class SupplierSerializer(serializers.ModelSerializer):
                  'waste_management_policy', 'environmental_impact_report', 'sustainability_goals',
                  'assessments', 'orders', 'total_orders', 'created_at', 'updated_at', 'created_by']
         read_only_fields = ['created_at', 'updated_at', 'created_by']
+    
+    def get_total_orders(self, obj) -> int:
+        # Read from the metrics snapshot that SupplierViewSet.get_queryset joins in
+        return obj.total_orders
 
 class SupplierCreateSerializer(serializers.ModelSerializer):
     materials_data = serializers.ListField(
@@ -122,7 +191,7 @@ class SupplierCreateSerializer(serializers.ModelSerializer):
         
         return supplier
 
-class TransportationEmissionSerializer(serializers.ModelSerializer):
+class TransportationEmissionSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     supplier_name = serializers.CharField(source='supplier.name', read_only=True)
     recommendations = serializers.SerializerMethodField()
 
@@ -155,9 +224,32 @@ class TransportationEmissionSerializer(serializers.ModelSerializer):
         ]
 
     def get_recommendations(self, obj):
-        from ..services.transportation_service import TransportationService
-        service = TransportationService()
-        return service._generate_recommendations(obj)
+        from ..services.transportation_service import generate_recommendations
+        return generate_recommendations(obj)
+
+class SupplierMetricsSnapshotSerializer(serializers.ModelSerializer):
+    supplier_name = serializers.CharField(source='supplier.name', read_only=True)
+    on_time_delivery_rate = serializers.FloatField(read_only=True)
+    average_efficiency = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = SupplierMetricsSnapshot
+        fields = [
+            'supplier',
+            'supplier_name',
+            'order_count',
+            'total_spend',
+            'delivered_order_count',
+            'on_time_order_count',
+            'on_time_delivery_rate',
+            'emission_count',
+            'total_emissions',
+            'average_efficiency',
+            'latest_assessment_score',
+            'latest_assessment_date',
+            'updated_at'
+        ]
+        read_only_fields = fields
 
 class EmissionFactorSerializer(serializers.ModelSerializer):
     class Meta:
@@ -176,9 +268,23 @@ class EmissionFactorSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at', 'updated_at']
 
+class TransportationEmissionBreakdownSerializer(serializers.Serializer):
+    vehicle_type = serializers.CharField(required=False, allow_null=True)
+    fuel_type = serializers.CharField(required=False, allow_null=True)
+    day = serializers.DateField(required=False)
+    total_emissions = serializers.FloatField()
+    average_efficiency = serializers.FloatField()
+    total_distance = serializers.FloatField()
+    total_volume = serializers.FloatField()
+    shipment_count = serializers.IntegerField()
+
 class TransportationEmissionSummarySerializer(serializers.Serializer):
     total_emissions = serializers.FloatField()
     average_efficiency = serializers.FloatField()
     total_distance = serializers.FloatField()
     total_volume = serializers.FloatField()
-    emissions_by_mode = serializers.DictField(child=serializers.FloatField()) 
\ No newline at end of file
+    shipment_count = serializers.IntegerField()
+    emissions_by_mode = serializers.DictField(child=serializers.FloatField())
+    efficiency_by_mode = serializers.DictField(child=serializers.FloatField())
+    group_by = serializers.CharField(required=False)
+    breakdown = TransportationEmissionBreakdownSerializer(many=True, required=False) 
\ No newline at end of file
@@ -3,12 +3,9 @@ from django.conf import settings
 from typing import Dict, Any, Optional
 from .models import Supplier, Order, OrderItem
 from .serializers import OrderSerializer, OrderCreateSerializer
+from apps.services.base import BaseService
 
-class SupplierService:
-    def __init__(self):
-        self.fastapi_base_url = settings.FASTAPI_BASE_URL
-        self.client = httpx.AsyncClient(base_url=self.fastapi_base_url)
-    
+class SupplierService(BaseService):
     async def calculate_order_metrics(self, order_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Send order data to FastAPI for calculations and get results
@@ -68,18 +65,8 @@ class SupplierService:
             "orders": order_data,
             "analytics": analytics
         }
-    
-    async def close(self):
-        """
-        Close the HTTP client
-        """
-        await self.client.aclose()
 
-class SupplierAnalyticsService:
-    def __init__(self):
-        self.fastapi_base_url = settings.FASTAPI_BASE_URL
-        self.client = httpx.AsyncClient(base_url=self.fastapi_base_url)
-    
+class SupplierAnalyticsService(BaseService):
     async def get_environmental_impact(self, supplier_id: int) -> Dict[str, Any]:
         """
         Get environmental impact analysis from FastAPI
@@ -106,9 +93,3 @@ class SupplierAnalyticsService:
             return response.json()["score"]
         except httpx.HTTPError as e:
             raise Exception(f"Error calculating sustainability score: {str(e)}")
-    
-    async def close(self):
-        """
-        Close the HTTP client
-        """
-        await self.client.aclose() 
\ No newline at end of file
@@ -0,0 +1,62 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from ..services.emission_factors import invalidate_factor_table
+from .models import (
+    Supplier,
+    SupplierAssessment,
+    Order,
+    OrderItem,
+    TransportationEmission,
+    EmissionFactor,
+    SupplierMetricsSnapshot
+)
+from .rollups import add_emissions, refresh_snapshot
+
+@receiver(post_save, sender=EmissionFactor)
+@receiver(post_delete, sender=EmissionFactor)
+def emission_factor_changed(sender, **kwargs):
+    # Invalidate now and again on commit, so no thread of this process keeps
+    # a table reloaded from the pre-commit rows
+    invalidate_factor_table()
+    transaction.on_commit(invalidate_factor_table)
+
+@receiver(post_save, sender=Supplier)
+def supplier_created(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        SupplierMetricsSnapshot.objects.get_or_create(supplier=instance)
+
+@receiver(post_save, sender=Order)
+@receiver(post_delete, sender=Order)
+def order_changed(sender, instance, signal, raw=False, **kwargs):
+    if not raw:
+        refresh_snapshot(instance.supplier_id, 'orders', create=signal is post_save)
+
+@receiver(post_save, sender=OrderItem)
+@receiver(post_delete, sender=OrderItem)
+def order_item_changed(sender, instance, signal, raw=False, **kwargs):
+    if raw:
+        return
+    supplier_id = Order.objects.filter(pk=instance.order_id).values_list('supplier_id', flat=True).first()
+    # The order is already gone when both are removed by a supplier delete
+    if supplier_id is not None:
+        refresh_snapshot(supplier_id, 'orders', create=signal is post_save)
+
+@receiver(post_save, sender=TransportationEmission)
+def emission_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        add_emissions([instance])
+    else:
+        refresh_snapshot(instance.supplier_id, 'emissions')
+
+@receiver(post_delete, sender=TransportationEmission)
+def emission_deleted(sender, instance, **kwargs):
+    refresh_snapshot(instance.supplier_id, 'emissions', create=False)
+
+@receiver(post_save, sender=SupplierAssessment)
+@receiver(post_delete, sender=SupplierAssessment)
+def assessment_changed(sender, instance, signal, raw=False, **kwargs):
+    if not raw:
+        refresh_snapshot(instance.supplier_id, 'assessments', create=signal is post_save)
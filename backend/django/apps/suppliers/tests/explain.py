@@ -0,0 +1,13 @@
+from django.db import connection, transaction
+
+def explain(queryset) -> str:
+    """
+    Return the database's query plan for a queryset. On PostgreSQL sequential
+    scans are disabled for the statement, since the planner would otherwise
+    prefer them on the near-empty test tables.
+    """
+    if connection.vendor == 'postgresql':
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            return queryset.explain()
+    return queryset.explain()
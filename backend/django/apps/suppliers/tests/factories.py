@@ -0,0 +1,94 @@
+from datetime import date
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from apps.suppliers.models import (
+    Supplier,
+    Material,
+    SupplierMaterial,
+    SupplierAssessment,
+    Order,
+    OrderItem,
+    TransportationEmission
+)
+
+def create_user(username='analyst'):
+    return get_user_model().objects.create_user(
+        username=username,
+        email=f'{username}@example.com',
+        password='password',
+        staff_id=f'staff-{username}',
+        first_name='Test',
+        last_name='User',
+        security_question_1='q1',
+        security_answer_1='a1',
+        security_question_2='q2',
+        security_answer_2='a2'
+    )
+
+def create_supplier(user, name='Supplier', materials=(), orders=1, items_per_order=2, assessments=1):
+    """
+    Create a supplier with material links, assessments and orders with items
+    """
+    supplier = Supplier.objects.create(
+        name=name,
+        contact_person='Contact',
+        email='supplier@example.com',
+        phone='555-0100',
+        address='1 Main St',
+        min_supply_capacity=Decimal('10'),
+        max_supply_capacity=Decimal('1000'),
+        current_capacity=Decimal('500'),
+        created_by=user
+    )
+    for material in materials:
+        SupplierMaterial.objects.create(
+            supplier=supplier,
+            material=material,
+            cost_per_unit=Decimal('2.50'),
+            lead_time=5
+        )
+    for i in range(assessments):
+        SupplierAssessment.objects.create(
+            supplier=supplier,
+            title=f'Assessment {i}',
+            description='Annual review',
+            assessment_date=date(2024, 1, 1),
+            created_by=user
+        )
+    for _ in range(orders):
+        order = Order.objects.create(
+            supplier=supplier,
+            expected_delivery_date=date(2024, 2, 1),
+            total_amount=Decimal('100'),
+            created_by=user
+        )
+        for material in list(materials)[:items_per_order]:
+            OrderItem.objects.create(
+                order=order,
+                material=material,
+                quantity=Decimal('10'),
+                unit_price=Decimal('5')
+            )
+    return supplier
+
+def create_materials(count=2):
+    return [
+        Material.objects.create(name=f'Material {i}', unit='kg')
+        for i in range(count)
+    ]
+
+def create_emission(supplier, transport_mode='truck', vehicle_type='small_truck', fuel_type='diesel',
+                    total_emissions=100.0, distance=100.0, volume=10.0, efficiency=50.0, load_factor=0.8):
+    return TransportationEmission.objects.create(
+        supplier=supplier,
+        distance=distance,
+        volume=volume,
+        transport_mode=transport_mode,
+        vehicle_type=vehicle_type,
+        fuel_type=fuel_type,
+        load_factor=load_factor,
+        total_emissions=total_emissions,
+        emissions_per_km=total_emissions / distance,
+        emissions_per_volume=total_emissions / volume,
+        transport_efficiency_score=efficiency
+    )
@@ -0,0 +1,68 @@
+import json
+from unittest import mock
+import httpx
+from django.test import TestCase
+from django.urls import reverse
+from apps.suppliers.models import Order
+from .factories import create_user, create_supplier, create_materials
+
+def fastapi_client():
+    """FastAPI stand-in for the order calculation and supplier analytics endpoints"""
+    def handler(request):
+        if request.url.path == '/api/orders/calculate/batch':
+            return httpx.Response(200, json=[
+                {'index': index, 'result': {'total_amount': len(order['items']), 'risk_score': 0.5}, 'errors': []}
+                for index, order in enumerate(json.loads(request.content))
+            ])
+        return httpx.Response(200, json={'path': request.url.path})
+
+    return httpx.AsyncClient(base_url='http://fastapi', transport=httpx.MockTransport(handler))
+
+class AsyncSupplierActionTests(TestCase):
+    """The FastAPI-backed actions run natively on the event loop"""
+
+    def setUp(self):
+        self.user = create_user()
+        self.async_client.force_login(self.user)
+        self.materials = create_materials(2)
+        self.supplier = create_supplier(self.user, materials=self.materials, orders=2)
+
+    async def request(self, method, url, data=None):
+        async with fastapi_client() as client:
+            with mock.patch('apps.services.base.get_http_client', return_value=client):
+                if method == 'get':
+                    return await self.async_client.get(url, data)
+                return await self.async_client.post(url, data or {}, content_type='application/json')
+
+    async def test_order_history_reads_orders_with_the_async_orm(self):
+        response = await self.request('get', reverse('suppliers:supplier-orders', args=[self.supplier.id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['orders']), 2)
+        self.assertEqual(len(response.data['orders'][0]['items']), 2)
+        self.assertEqual(response.data['analytics'], {'path': f'/api/suppliers/{self.supplier.id}/analytics'})
+
+    async def test_create_order(self):
+        response = await self.request('post', reverse('suppliers:supplier-create-order', args=[self.supplier.id]), {
+            'expected_delivery_date': '2024-03-01',
+            'items': [{'material': self.materials[0].id, 'quantity': '2.00', 'unit_price': '3.50'}]
+        })
+
+        self.assertEqual(response.status_code, 201)
+        order = await Order.objects.select_related('created_by').aget(order_id=response.data['order_id'])
+        self.assertEqual(order.supplier_id, self.supplier.id)
+        self.assertEqual(order.created_by, self.user)
+        self.assertEqual(str(order.total_amount), '7.00')
+
+    async def test_order_analytics(self):
+        order = await Order.objects.filter(supplier=self.supplier).afirst()
+        response = await self.request('get', reverse('suppliers:order-analytics', args=[order.order_id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {'total_amount': 2, 'risk_score': 0.5})
+
+    async def test_missing_supplier(self):
+        response = await self.request('get', reverse('suppliers:supplier-performance-metrics', args=[1]))
+        self.assertEqual(response.status_code, 200)
+        response = await self.request('post', reverse('suppliers:supplier-sustainability-score', args=[999999]))
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,134 @@
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.services.emission_factors import get_factor_table
+from apps.services.transportation_service import TransportationService
+from apps.suppliers.models import EmissionFactor, TransportationEmission
+from .factories import create_user, create_supplier
+
+class BulkEmissionIngestionTests(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.supplier = create_supplier(self.user, orders=0)
+        EmissionFactor.objects.update_or_create(
+            transport_mode='truck', vehicle_type='small_truck', fuel_type='diesel',
+            defaults={'base_emission_factor': 0.2, 'volume_factor': 0.1, 'load_factor_impact': 0.05}
+        )
+        EmissionFactor.objects.update_or_create(
+            transport_mode='train', vehicle_type=None, fuel_type='electric',
+            defaults={'base_emission_factor': 0.05, 'volume_factor': 0.05, 'load_factor_impact': 0.02}
+        )
+        self.url = reverse('suppliers:transportationemission-bulk')
+
+    def shipment(self, **overrides):
+        return {
+            'supplier': self.supplier.id,
+            'distance': 120,
+            'volume': 3,
+            'transport_mode': 'truck',
+            'vehicle_type': 'small_truck',
+            'fuel_type': 'diesel',
+            'load_factor': 0.6,
+            **overrides
+        }
+
+    def test_valid_rows_are_stored_and_invalid_rows_reported(self):
+        response = self.client.post(self.url, [
+            self.shipment(),
+            self.shipment(supplier=999999),
+            self.shipment(transport_mode='train', vehicle_type=None, fuel_type='electric', return_trip=True),
+            self.shipment(distance=-5, load_factor=2),
+            self.shipment(transport_mode='plane', vehicle_type=None, fuel_type='diesel')
+        ], format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['total_rows'], 5)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual([error['row'] for error in response.data['errors']], [1, 3, 4])
+        self.assertIn('Supplier 999999 not found', response.data['errors'][0]['errors'])
+        self.assertEqual(len(response.data['errors'][1]['errors']), 2)
+        self.assertEqual(TransportationEmission.objects.count(), 2)
+
+    def test_bulk_matches_single_row_calculation(self):
+        self.client.post(self.url, [self.shipment(return_trip=True)], format='json')
+        bulk = TransportationEmission.objects.get()
+
+        single = TransportationService().calculate_emissions(
+            supplier_id=self.supplier.id,
+            distance=120,
+            volume=3,
+            transport_mode='truck',
+            vehicle_type='small_truck',
+            fuel_type='diesel',
+            load_factor=0.6,
+            return_trip=True
+        )
+        self.assertTrue(single['success'], single.get('error'))
+        self.assertAlmostEqual(bulk.total_emissions, single['data']['total_emissions'])
+        self.assertAlmostEqual(bulk.transport_efficiency_score, single['data']['efficiency_score'])
+        self.assertAlmostEqual(bulk.total_emissions, 120 * 0.2 * 3 * (1 + 0.4 * 0.05) * 2)
+
+    def test_plane_leg_uses_the_seeded_jet_fuel_factor(self):
+        response = self.client.post(self.url, [
+            self.shipment(transport_mode='plane', vehicle_type=None, fuel_type='jet_fuel', distance=800)
+        ], format='json')
+
+        self.assertEqual(response.data['created'], 1, response.data['errors'])
+        leg = TransportationEmission.objects.get()
+        self.assertAlmostEqual(leg.total_emissions, 800 * 0.5 * 3 * (1 + 0.4 * 0.15))
+
+        single = TransportationService().calculate_emissions(
+            supplier_id=self.supplier.id,
+            distance=800,
+            volume=3,
+            transport_mode='plane',
+            fuel_type='jet_fuel',
+            load_factor=0.6
+        )
+        self.assertTrue(single['success'], single.get('error'))
+        self.assertAlmostEqual(single['data']['total_emissions'], leg.total_emissions)
+
+    def test_lookups_are_constant_and_inserts_are_chunked(self):
+        fields = [field for field in TransportationEmission._meta.concrete_fields if not field.primary_key]
+        get_factor_table()
+        for size in (10, 200):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(self.url, [self.shipment()] * size, format='json')
+            self.assertEqual(response.data['created'], size)
+
+            statements = [query['sql'].lstrip().upper() for query in queries]
+            batch_size = min(
+                settings.TRANSPORTATION_SETTINGS['BULK_CREATE_BATCH_SIZE'],
+                connection.ops.bulk_batch_size(fields, [None] * size) or size
+            )
+            # One supplier lookup (factors come from the process table), then one INSERT per chunk
+            self.assertEqual(sum(sql.startswith('SELECT') for sql in statements), 1)
+            self.assertEqual(sum(sql.startswith('INSERT') for sql in statements), -(-size // batch_size))
+
+    def test_csv_upload(self):
+        csv_file = SimpleUploadedFile(
+            'legs.csv',
+            (
+                'supplier,distance,volume,transport_mode,vehicle_type,fuel_type,load_factor,return_trip\n'
+                f'{self.supplier.id},120,3,truck,small_truck,diesel,0.6,true\n'
+                f'{self.supplier.id},80,2,train,,electric,,false\n'
+                f'{self.supplier.id},abc,2,train,,electric,,false\n'
+            ).encode(),
+            content_type='text/csv'
+        )
+        response = self.client.post(self.url, {'file': csv_file}, format='multipart')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(response.data['errors'], [{'row': 2, 'errors': ['distance must be a number']}])
+        self.assertTrue(TransportationEmission.objects.filter(return_trip=True, transport_mode='truck').exists())
+        self.assertEqual(TransportationEmission.objects.get(transport_mode='train').load_factor, 0.8)
+
+    def test_rejects_empty_payload(self):
+        self.assertEqual(self.client.post(self.url, [], format='json').status_code, 400)
@@ -0,0 +1,87 @@
+from decimal import Decimal
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.suppliers.models import Order, OrderItem, SupplierMetricsSnapshot
+from .factories import create_user, create_supplier, create_materials
+
+class BulkOrderCreationTests(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.supplier = create_supplier(self.user, orders=0)
+        self.materials = create_materials(2)
+        self.url = reverse('suppliers:order-bulk')
+
+    def order(self, **overrides):
+        return {
+            'supplier': self.supplier.id,
+            'expected_delivery_date': '2024-03-01',
+            'items': [
+                {'material': self.materials[0].id, 'quantity': 3, 'unit_price': 0.1},
+                {'material': self.materials[1].id, 'quantity': '2.5', 'unit_price': '4.99'}
+            ],
+            **overrides
+        }
+
+    def test_valid_orders_are_stored_and_invalid_rows_reported(self):
+        response = self.client.post(self.url, [
+            self.order(),
+            self.order(supplier=999999),
+            self.order(items=[]),
+            self.order(expected_delivery_date='2024-02-30', status='lost'),
+            self.order(items=[{'material': 999999, 'quantity': 1, 'unit_price': 1}]),
+            self.order(items=[{'material': self.materials[0].id, 'quantity': -1, 'unit_price': 'abc'}])
+        ], format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['total_rows'], 6)
+        self.assertEqual(response.data['created'], 1)
+        self.assertEqual([error['row'] for error in response.data['errors']], [1, 2, 3, 4, 5])
+        self.assertEqual(len(response.data['errors'][2]['errors']), 2)
+        self.assertEqual(len(response.data['errors'][4]['errors']), 2)
+
+        order = Order.objects.get()
+        self.assertEqual(str(order.order_id), response.data['orders'][0]['order_id'])
+        self.assertEqual(order.created_by, self.user)
+        # 3 x 0.10 + 2.50 x 4.99 = 0.30 + 12.48 (12.475 rounded half up)
+        self.assertEqual(order.total_amount, Decimal('12.78'))
+        self.assertEqual(
+            sorted(order.items.values_list('total_price', flat=True)),
+            [Decimal('0.30'), Decimal('12.48')]
+        )
+        snapshot = SupplierMetricsSnapshot.objects.get(supplier=self.supplier)
+        self.assertEqual(snapshot.order_count, 1)
+        self.assertEqual(snapshot.total_spend, Decimal('12.78'))
+
+    def test_query_count_does_not_grow_with_orders(self):
+        counts = []
+        for size in (5, 40):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(self.url, [self.order()] * size, format='json')
+            self.assertEqual(response.data['created'], size)
+            counts.append(len(queries))
+
+        self.assertEqual(counts[0], counts[1])
+        self.assertEqual(OrderItem.objects.count(), 90)
+
+    def test_single_order_creates_items_in_one_insert(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse('suppliers:order-list'), self.order(), format='json')
+
+        self.assertEqual(response.status_code, 201)
+        inserts = [query['sql'] for query in queries if query['sql'].startswith('INSERT INTO "suppliers_orderitem"')]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(Order.objects.get().total_amount, Decimal('12.78'))
+        # The order rollup is recomputed once, with the items already in place
+        rollups = [query['sql'] for query in queries if query['sql'].startswith('UPDATE "suppliers_suppliermetricssnapshot"')]
+        self.assertEqual(len(rollups), 1)
+        snapshot = SupplierMetricsSnapshot.objects.get(supplier=self.supplier)
+        self.assertEqual((snapshot.order_count, snapshot.total_spend), (1, Decimal('12.78')))
+
+    def test_rejects_empty_payload(self):
+        self.assertEqual(self.client.post(self.url, [], format='json').status_code, 400)
+        self.assertEqual(self.client.post(self.url, {'orders': ['x']}, format='json').status_code, 400)
@@ -0,0 +1,74 @@
+from django.conf import settings
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from apps.services.emission_factors import get_factor_table, invalidate_factor_table
+from apps.suppliers.models import EmissionFactor
+from .factories import create_user, create_supplier, create_emission
+
+class EmissionFactorTableTests(TestCase):
+    def setUp(self):
+        invalidate_factor_table()
+
+    def test_seeded_table_is_loaded_once(self):
+        with self.assertNumQueries(1):
+            table = get_factor_table()
+        self.assertEqual(table[('truck', 'small_truck', 'diesel')].base_emission_factor, 0.2)
+        self.assertIn(('plane', None, 'jet_fuel'), table)
+        with self.assertRaises(TypeError):
+            table[('truck', 'small_truck', 'diesel')] = None
+
+        with self.assertNumQueries(0):
+            self.assertIs(get_factor_table(), table)
+
+    def test_writes_invalidate_the_table(self):
+        get_factor_table()
+        factor = EmissionFactor.objects.get(transport_mode='ship', vehicle_type=None, fuel_type='diesel')
+        factor.base_emission_factor = 0.9
+        factor.save()
+        self.assertEqual(get_factor_table()[('ship', None, 'diesel')].base_emission_factor, 0.9)
+
+        factor.delete()
+        self.assertNotIn(('ship', None, 'diesel'), get_factor_table())
+
+    def test_other_workers_reload_after_version_bump(self):
+        table = get_factor_table()
+        # Another worker's write: no signal reaches this process
+        EmissionFactor.objects.filter(transport_mode='ship', fuel_type='diesel').update(
+            base_emission_factor=0.9, updated_at=timezone.now()
+        )
+
+        with self.assertNumQueries(0):
+            self.assertIs(get_factor_table(), table)
+
+        transportation = {**settings.TRANSPORTATION_SETTINGS, 'FACTOR_VERSION_CHECK_INTERVAL': 0}
+        with override_settings(TRANSPORTATION_SETTINGS=transportation):
+            # Version check, then the reload
+            with self.assertNumQueries(2):
+                table = get_factor_table()
+            self.assertEqual(table[('ship', None, 'diesel')].base_emission_factor, 0.9)
+
+            with self.assertNumQueries(1):
+                self.assertIs(get_factor_table(), table)
+
+    def test_emission_list_query_count_is_independent_of_rows(self):
+        user = create_user()
+        client = APIClient()
+        client.force_authenticate(user)
+        supplier = create_supplier(user, orders=0)
+        url = reverse('suppliers:transportationemission-list')
+
+        counts = []
+        for rows in (5, 45):
+            for _ in range(rows):
+                create_emission(supplier, efficiency=40, load_factor=0.5)
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(url)
+            self.assertTrue(response.data['results'][0]['recommendations'])
+            counts.append(len(queries))
+
+        self.assertEqual(len(response.data['results']), 50)
+        self.assertEqual(counts[0], counts[1])
@@ -0,0 +1,57 @@
+from django.test import TestCase
+from django.utils import timezone
+from django.urls import reverse
+from rest_framework.test import APIClient
+from .factories import create_user, create_supplier, create_emission
+
+class EmissionSummaryTests(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.supplier = create_supplier(self.user, orders=0)
+        create_emission(self.supplier, 'truck', 'small_truck', 'diesel', total_emissions=100, efficiency=40)
+        create_emission(self.supplier, 'truck', 'large_truck', 'electric', total_emissions=50, efficiency=80)
+        create_emission(self.supplier, 'train', None, 'electric', total_emissions=30, efficiency=90)
+        # Another supplier's shipments must not leak into the summary
+        create_emission(create_supplier(self.user, name='Other', orders=0), total_emissions=999)
+
+    def get_summary(self, **params):
+        return self.client.get(
+            reverse('suppliers:transportationemission-summary'),
+            {'supplier_id': self.supplier.id, **params}
+        )
+
+    def test_summary_is_a_single_query(self):
+        with self.assertNumQueries(1):
+            response = self.get_summary()
+        self.assertEqual(response.status_code, 200)
+
+        data = response.data
+        self.assertEqual(data['total_emissions'], 180)
+        self.assertEqual(data['shipment_count'], 3)
+        self.assertAlmostEqual(data['average_efficiency'], 70)
+        self.assertEqual(data['total_distance'], 300)
+        self.assertEqual(data['emissions_by_mode'], {'truck': 150, 'train': 30, 'ship': 0, 'plane': 0})
+        self.assertEqual(data['efficiency_by_mode']['truck'], 60)
+        self.assertNotIn('breakdown', data)
+
+    def test_group_by_fuel_type(self):
+        with self.assertNumQueries(1):
+            response = self.get_summary(group_by='fuel_type')
+
+        breakdown = {row['fuel_type']: row for row in response.data['breakdown']}
+        self.assertEqual(response.data['group_by'], 'fuel_type')
+        self.assertEqual(breakdown['electric']['total_emissions'], 80)
+        self.assertEqual(breakdown['electric']['shipment_count'], 2)
+        self.assertEqual(breakdown['diesel']['average_efficiency'], 40)
+
+    def test_group_by_day(self):
+        response = self.get_summary(group_by='day')
+
+        self.assertEqual(len(response.data['breakdown']), 1)
+        self.assertEqual(response.data['breakdown'][0]['day'], timezone.localdate().isoformat())
+        self.assertEqual(response.data['breakdown'][0]['shipment_count'], 3)
+
+    def test_invalid_group_by(self):
+        self.assertEqual(self.get_summary(group_by='supplier').status_code, 400)
@@ -0,0 +1,112 @@
+import csv
+import io
+import json
+from datetime import datetime
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from apps.suppliers.models import TransportationEmission
+from .factories import create_user, create_supplier, create_materials, create_emission
+
+class ExportTests(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.supplier = create_supplier(self.user, materials=create_materials(3), orders=2, items_per_order=3)
+        self.other = create_supplier(self.user, name='Other', orders=1)
+        for day in (1, 2, 3):
+            emission = create_emission(self.supplier)
+            TransportationEmission.objects.filter(pk=emission.pk).update(
+                created_at=timezone.make_aware(datetime(2024, 1, day, 12))
+            )
+        create_emission(self.other)
+
+    def export(self, name, **params):
+        response = self.client.get(reverse(f'suppliers:{name}-export'), params)
+        body = b''.join(response.streaming_content).decode() if response.streaming else None
+        return response, body
+
+    def test_emissions_csv_is_streamed_in_chunks(self):
+        with override_settings(EXPORT_CHUNK_SIZE=2):
+            response = self.client.get(reverse('suppliers:transportationemission-export'))
+            chunks = list(response.streaming_content)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/csv'))
+        self.assertIn('transportation_emissions.csv', response['Content-Disposition'])
+        # Header, then two chunks of two rows
+        self.assertEqual(len(chunks), 3)
+        rows = list(csv.DictReader(io.StringIO(b''.join(chunks).decode())))
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[0]['supplier_name'], 'Supplier')
+
+    def test_emissions_ndjson_filtered_by_supplier_and_dates(self):
+        response, body = self.export(
+            'transportationemission',
+            format='ndjson',
+            supplier_id=self.supplier.id,
+            start_date='2024-01-02',
+            end_date='2024-01-02'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('application/x-ndjson'))
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['supplier_id'], self.supplier.id)
+        self.assertTrue(rows[0]['created_at'].startswith('2024-01-02'))
+
+    def test_invalid_date_is_rejected(self):
+        response, _ = self.export('transportationemission', format='ndjson', start_date='yesterday')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('start_date', json.loads(response.content))
+
+    def test_invalid_supplier_id_is_rejected(self):
+        response, _ = self.export('order', format='ndjson', supplier_id='abc')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(json.loads(response.content), {'supplier_id': 'Must be an integer'})
+
+    def test_orders_export_one_row_per_item(self):
+        response, body = self.export('order', supplier_id=self.supplier.id)
+
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(len({row['order_id'] for row in rows}), 2)
+        self.assertTrue(all(row['material_name'] for row in rows))
+
+        # The other supplier's order has no items but is still exported
+        response, body = self.export('order', supplier_id=self.other.id)
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['item_id'], '')
+
+class AsyncExportTests(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.async_client.force_login(self.user)
+        self.supplier = create_supplier(self.user, materials=create_materials(2), orders=3)
+        for _ in range(3):
+            create_emission(self.supplier)
+
+    async def test_asgi_export_streams_from_an_async_iterator(self):
+        with override_settings(EXPORT_CHUNK_SIZE=2):
+            response = await self.async_client.get(reverse('suppliers:transportationemission-export'))
+            self.assertTrue(response.is_async)
+            chunks = [chunk async for chunk in response.streaming_content]
+
+        self.assertEqual(response.status_code, 200)
+        # Header, then chunks of two and one rows
+        self.assertEqual(len(chunks), 3)
+        rows = list(csv.DictReader(io.StringIO(b''.join(chunks).decode())))
+        self.assertEqual(len(rows), 3)
+
+    async def test_asgi_order_export_as_ndjson(self):
+        response = await self.async_client.get(reverse('suppliers:order-export'), {'format': 'ndjson'})
+        body = b''.join([chunk async for chunk in response.streaming_content]).decode()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(body.splitlines()), 6)
@@ -0,0 +1,32 @@
+from unittest import mock
+import httpx
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase
+from apps.services import http
+from apps.services.base import BaseService
+from apps.services.resilience import ResiliencePolicy
+
+class SyncWorkerClientPoolTests(SimpleTestCase):
+    """Under WSGI each async view gets its own async_to_sync loop"""
+
+    def setUp(self):
+        def build_http_client():
+            async def handler(request):
+                return httpx.Response(200, json={'path': request.url.path})
+            return httpx.AsyncClient(base_url='http://fastapi', transport=httpx.MockTransport(handler))
+
+        patcher = mock.patch('apps.services.http.build_http_client', side_effect=build_http_client)
+        self.build = patcher.start()
+        self.addCleanup(patcher.stop)
+        # Start from an empty pool, so the client below is built by this test
+        http._clients.clear()
+
+    def test_requests_share_one_long_lived_client(self):
+        policy = ResiliencePolicy()
+        for path in ('/a', '/b'):
+            result = async_to_sync(BaseService(policy=policy).make_request)('GET', path)
+            self.assertEqual(result, {'path': path})
+
+        self.assertEqual(self.build.call_count, 1)
+        client, = http._clients.values()
+        self.assertFalse(client.is_closed)
@@ -0,0 +1,78 @@
+from datetime import timedelta
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+from apps.suppliers.models import (
+    Supplier,
+    Order,
+    SupplierAssessment,
+    TransportationEmission,
+    EmissionFactor
+)
+from .explain import explain
+from .factories import create_user, create_supplier, create_materials
+
+class IndexUsageTests(TestCase):
+    """
+    Each hot filter/ordering path must be planned against its composite index
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        user = create_user()
+        cls.supplier = create_supplier(user, materials=create_materials(), orders=3)
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = explain(queryset)
+        self.assertIn(index_name, plan, f'{index_name} not used:\n{plan}')
+
+    def test_emissions_by_supplier_and_date_range(self):
+        now = timezone.now()
+        self.assertUsesIndex(
+            TransportationEmission.objects.filter(
+                supplier_id=self.supplier.id,
+                created_at__gte=now - timedelta(days=30),
+                created_at__lte=now
+            ),
+            'emission_supplier_created_idx'
+        )
+
+    def test_orders_by_supplier_newest_first(self):
+        self.assertUsesIndex(
+            Order.objects.filter(supplier_id=self.supplier.id).order_by('-order_date'),
+            'order_supplier_date_idx'
+        )
+
+    def test_orders_by_status(self):
+        self.assertUsesIndex(Order.objects.filter(status='pending'), 'order_status_idx')
+
+    def test_assessments_by_supplier_newest_first(self):
+        self.assertUsesIndex(
+            SupplierAssessment.objects.filter(supplier_id=self.supplier.id).order_by('-assessment_date'),
+            'assessment_supplier_date_idx'
+        )
+
+    def test_active_emission_factor_lookup(self):
+        # Served by the unique_together index; it matches at most one row, so
+        # a wider (..., is_active) index would only add write cost
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, EmissionFactor._meta.db_table)
+        unique_index = next(
+            name for name, constraint in constraints.items()
+            if constraint['unique'] and constraint['columns'] == ['transport_mode', 'vehicle_type', 'fuel_type']
+        )
+        self.assertUsesIndex(
+            EmissionFactor.objects.filter(
+                transport_mode='truck',
+                vehicle_type='small_truck',
+                fuel_type='diesel',
+                is_active=True
+            ),
+            unique_index
+        )
+
+    def test_supplier_cursor_page(self):
+        self.assertUsesIndex(
+            Supplier.objects.filter(created_at__lt=timezone.now()).order_by('-created_at', '-id')[:51],
+            'supplier_created_idx'
+        )
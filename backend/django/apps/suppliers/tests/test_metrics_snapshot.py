@@ -0,0 +1,137 @@
+from datetime import date
+from decimal import Decimal
+from importlib import import_module
+from io import StringIO
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.services.transportation_service import TransportationService
+from apps.suppliers.models import (
+    Supplier,
+    SupplierAssessment,
+    Order,
+    OrderItem,
+    TransportationEmission,
+    SupplierMetricsSnapshot
+)
+from .factories import create_user, create_supplier, create_materials, create_emission
+
+class SupplierMetricsSnapshotTests(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        # Two orders of two 10 x 5.00 items each
+        self.supplier = create_supplier(self.user, materials=create_materials(2), orders=2, assessments=0)
+
+    def snapshot(self):
+        return SupplierMetricsSnapshot.objects.get(supplier=self.supplier)
+
+    def test_orders_and_items_roll_up(self):
+        snapshot = self.snapshot()
+        self.assertEqual(snapshot.order_count, 2)
+        self.assertEqual(snapshot.total_spend, Decimal('200'))
+        self.assertIsNone(snapshot.on_time_delivery_rate)
+
+        on_time, late = self.supplier.orders.all()
+        on_time.actual_delivery_date = date(2024, 1, 30)
+        on_time.save()
+        late.actual_delivery_date = date(2024, 2, 5)
+        late.save()
+        self.assertEqual(self.snapshot().on_time_delivery_rate, 0.5)
+
+        late.status = 'cancelled'
+        late.save()
+        snapshot = self.snapshot()
+        self.assertEqual(snapshot.total_spend, Decimal('100'))
+        self.assertEqual(snapshot.on_time_delivery_rate, 1)
+
+        OrderItem.objects.filter(order=on_time).first().delete()
+        self.assertEqual(self.snapshot().total_spend, Decimal('50'))
+        self.assertEqual(Supplier.objects.get(pk=self.supplier.pk).total_orders, 2)
+
+    def test_emissions_roll_up_from_single_and_bulk_writes(self):
+        emission = create_emission(self.supplier, total_emissions=100, efficiency=40)
+        TransportationService().bulk_create_emissions([{
+            'supplier': self.supplier.id,
+            'distance': 100,
+            'volume': 2,
+            'transport_mode': 'train',
+            'fuel_type': 'electric'
+        }] * 3)
+        bulk_total = sum(
+            TransportationEmission.objects.exclude(pk=emission.pk).values_list('total_emissions', flat=True)
+        )
+
+        snapshot = self.snapshot()
+        self.assertEqual(snapshot.emission_count, 4)
+        self.assertAlmostEqual(snapshot.total_emissions, 100 + bulk_total)
+
+        emission.delete()
+        snapshot = self.snapshot()
+        self.assertEqual(snapshot.emission_count, 3)
+        self.assertAlmostEqual(snapshot.total_emissions, bulk_total)
+
+    def test_latest_scored_assessment(self):
+        for assessment_date, score in ((date(2024, 1, 1), 70), (date(2024, 6, 1), 85), (date(2024, 9, 1), None)):
+            SupplierAssessment.objects.create(
+                supplier=self.supplier,
+                title='Review',
+                description='Review',
+                assessment_date=assessment_date,
+                score=score,
+                created_by=self.user
+            )
+
+        snapshot = self.snapshot()
+        self.assertEqual(snapshot.latest_assessment_score, Decimal('85'))
+        self.assertEqual(snapshot.latest_assessment_date, date(2024, 6, 1))
+
+    def test_rebuild_command_repairs_drift(self):
+        expected = {
+            field: getattr(self.snapshot(), field)
+            for field in ('order_count', 'total_spend', 'emission_count', 'total_emissions')
+        }
+        SupplierMetricsSnapshot.objects.all().delete()
+        Order.objects.filter(supplier=self.supplier).update(total_amount=0)
+
+        out = StringIO()
+        call_command('rebuild_supplier_metrics', batch_size=1, stdout=out)
+
+        self.assertIn('for 1 suppliers', out.getvalue())
+        snapshot = self.snapshot()
+        for field, value in expected.items():
+            self.assertEqual(getattr(snapshot, field), value)
+
+    def test_migration_backfills_missing_snapshots(self):
+        create_emission(self.supplier)
+        fields = ['order_count', 'total_spend', 'delivered_order_count', 'emission_count',
+                  'total_emissions', 'efficiency_score_sum', 'latest_assessment_score']
+        expected = SupplierMetricsSnapshot.objects.values(*fields).get(supplier=self.supplier)
+        SupplierMetricsSnapshot.objects.all().delete()
+        migration = import_module('apps.suppliers.migrations.0007_backfill_supplier_metrics')
+        # The models as they were at that migration, not the current ones
+        state = MigrationExecutor(connection).loader.project_state(('suppliers', '0007_backfill_supplier_metrics'))
+
+        migration.backfill_snapshots(state.apps, None)
+
+        self.assertEqual(SupplierMetricsSnapshot.objects.values(*fields).get(supplier=self.supplier), expected)
+
+    def test_dashboard_reads_one_row_per_supplier(self):
+        create_supplier(self.user, name='Other', orders=3)
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        with self.assertNumQueries(1):
+            response = client.get(reverse('suppliers:suppliermetricssnapshot-list'))
+
+        rows = response.data['results']
+        self.assertEqual([row['order_count'] for row in rows], [2, 3])
+        self.assertEqual(rows[0]['supplier_name'], 'Supplier')
+
+    def test_supplier_delete_removes_snapshot(self):
+        create_emission(self.supplier)
+        Supplier.objects.filter(pk=self.supplier.pk).delete()
+
+        self.assertFalse(SupplierMetricsSnapshot.objects.exists())
@@ -0,0 +1,84 @@
+import asyncio
+import json
+import httpx
+from django.test import SimpleTestCase, override_settings
+from rest_framework.exceptions import ValidationError
+from apps.services.supplier_service import SupplierService
+
+def order(supplier_id, quantity='1.00'):
+    return {
+        'order_id': f'order-{supplier_id}',
+        'supplier': supplier_id,
+        'supplier_name': 'Acme',
+        'expected_delivery_date': '2024-03-01',
+        'items': [{'id': 1, 'material': 7, 'material_name': 'Oats', 'quantity': quantity, 'unit_price': '2.00'}]
+    }
+
+@override_settings(FASTAPI_ORDER_METRICS_BATCH={'WINDOW': 0.01, 'MAX_BATCH_SIZE': 3})
+class OrderMetricsBatchingTests(SimpleTestCase):
+    def service(self, status_code=200):
+        self.requests = []
+
+        def handler(request):
+            payload = json.loads(request.content)
+            self.requests.append((request.url.path, payload))
+            # FastAPI validates each order on its own
+            return httpx.Response(status_code, json=[
+                {'index': index, 'result': None, 'errors': ['items.0.quantity: must be a number']}
+                if row['items'][0]['quantity'] == 'bad' else
+                {'index': index, 'result': {'supplier_id': row['supplier_id']}, 'errors': []}
+                for index, row in enumerate(payload)
+            ])
+
+        return SupplierService(httpx.AsyncClient(base_url='http://fastapi', transport=httpx.MockTransport(handler)))
+
+    async def test_concurrent_calls_share_one_request(self):
+        service = self.service()
+        results = await asyncio.gather(*(service.calculate_order_metrics(order(i)) for i in range(2)))
+
+        self.assertEqual(results, [{'supplier_id': 0}, {'supplier_id': 1}])
+        self.assertEqual(len(self.requests), 1)
+        path, payload = self.requests[0]
+        self.assertEqual(path, '/api/orders/calculate/batch')
+        # Only the fields FastAPI calculates with are sent
+        self.assertEqual(payload[0], {
+            'supplier_id': 0,
+            'expected_delivery_date': '2024-03-01',
+            'items': [{'material': 7, 'quantity': '1.00', 'unit_price': '2.00'}]
+        })
+
+    async def test_full_batches_are_sent_without_waiting(self):
+        service = self.service()
+        results = await asyncio.gather(*(service.calculate_order_metrics(order(i)) for i in range(7)))
+
+        self.assertEqual([result['supplier_id'] for result in results], list(range(7)))
+        self.assertEqual([len(payload) for _, payload in self.requests], [3, 3, 1])
+
+    async def test_errors_reach_every_caller(self):
+        service = self.service(status_code=500)
+        results = await asyncio.gather(
+            *(service.calculate_order_metrics(order(i)) for i in range(2)),
+            return_exceptions=True
+        )
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertTrue(all(isinstance(result, Exception) for result in results))
+
+    async def test_invalid_order_only_fails_its_caller(self):
+        service = self.service()
+        results = await asyncio.gather(
+            service.calculate_order_metrics(order(1)),
+            service.calculate_order_metrics(order(2, quantity='bad')),
+            return_exceptions=True
+        )
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(results[0], {'supplier_id': 1})
+        self.assertIsInstance(results[1], ValidationError)
+
+    async def test_explicit_batch(self):
+        service = self.service()
+        results = await service.calculate_order_metrics_batch([order(4), order(5)])
+
+        self.assertEqual(results, [{'supplier_id': 4}, {'supplier_id': 5}])
+        self.assertEqual(len(self.requests), 1)
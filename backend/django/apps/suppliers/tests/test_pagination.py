@@ -0,0 +1,55 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.suppliers.models import Order
+from .factories import create_user, create_supplier, create_materials
+
+class CursorPaginationTests(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.materials = create_materials()
+        self.suppliers = [
+            create_supplier(self.user, name=f'Supplier {i}', materials=self.materials, orders=1)
+            for i in range(5)
+        ]
+
+    def collect_pages(self, url, params):
+        ids, pages = [], 0
+        while url:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, 200)
+            ids.extend(response.data['results'])
+            url, params, pages = response.data['next'], None, pages + 1
+        return ids, pages
+
+    def test_supplier_pages_cover_every_row_once(self):
+        results, pages = self.collect_pages(reverse('suppliers:supplier-list'), {'page_size': 2})
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(
+            sorted(row['id'] for row in results),
+            sorted(supplier.id for supplier in self.suppliers)
+        )
+        self.assertNotIn('count', self.client.get(reverse('suppliers:supplier-list')).data)
+
+    def test_supplier_list_is_slim(self):
+        row = self.client.get(reverse('suppliers:supplier-list')).data['results'][0]
+
+        self.assertNotIn('orders', row)
+        self.assertNotIn('materials', row)
+        self.assertEqual(row['total_orders'], 1)
+
+    def test_sparse_fieldset_on_list(self):
+        response = self.client.get(reverse('suppliers:supplier-list'), {'fields': 'id, name'})
+        for row in response.data['results']:
+            self.assertEqual(set(row), {'id', 'name'})
+
+    def test_order_list_omits_items_and_detail_keeps_them(self):
+        results, _ = self.collect_pages(reverse('suppliers:order-list'), {'page_size': 2})
+        self.assertEqual(len(results), Order.objects.count())
+        self.assertNotIn('items', results[0])
+
+        detail = self.client.get(reverse('suppliers:order-detail', args=[results[0]['order_id']]))
+        self.assertEqual(len(detail.data['items']), 2)
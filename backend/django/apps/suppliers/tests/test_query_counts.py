@@ -0,0 +1,63 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from .factories import create_user, create_supplier, create_materials
+
+# List: one page of suppliers with the annotated order count
+SUPPLIER_LIST_QUERIES = 1
+# Detail: supplier (with order count), supplier materials, assessments, orders, order items
+SUPPLIER_DETAIL_QUERIES = 5
+
+class SupplierQueryCountTests(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.materials = create_materials()
+
+    def create_suppliers(self, count):
+        return [
+            create_supplier(self.user, name=f'Supplier {i}', materials=self.materials, orders=2)
+            for i in range(count)
+        ]
+
+    def test_list_query_count_is_constant(self):
+        self.create_suppliers(2)
+        with self.assertNumQueries(SUPPLIER_LIST_QUERIES):
+            response = self.client.get(reverse('suppliers:supplier-list'))
+        self.assertEqual(len(response.data['results']), 2)
+
+        self.create_suppliers(10)
+        with self.assertNumQueries(SUPPLIER_LIST_QUERIES):
+            response = self.client.get(reverse('suppliers:supplier-list'))
+        self.assertEqual(len(response.data['results']), 12)
+
+    def test_detail_query_count(self):
+        supplier = self.create_suppliers(1)[0]
+        with self.assertNumQueries(SUPPLIER_DETAIL_QUERIES):
+            response = self.client.get(reverse('suppliers:supplier-detail', args=[supplier.id]))
+        self.assertEqual(response.status_code, 200)
+
+    def test_sparse_detail_skips_unrequested_relations(self):
+        supplier = self.create_suppliers(1)[0]
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                reverse('suppliers:supplier-detail', args=[supplier.id]),
+                {'fields': 'id,name,materials'}
+            )
+        self.assertEqual(set(response.data), {'id', 'name', 'materials'})
+
+    def test_nested_detail_payload(self):
+        supplier = self.create_suppliers(1)[0]
+        data = self.client.get(reverse('suppliers:supplier-detail', args=[supplier.id])).data
+
+        self.assertEqual(data['total_orders'], 2)
+        self.assertEqual(len(data['orders']), 2)
+        self.assertEqual(len(data['orders'][0]['items']), 2)
+        self.assertEqual(data['orders'][0]['created_by_name'], 'Test User')
+        self.assertEqual(data['orders'][0]['supplier_name'], 'Supplier 0')
+        self.assertEqual(
+            {material['material_name'] for material in data['materials']},
+            {'Material 0', 'Material 1'}
+        )
+        self.assertEqual(data['assessments'][0]['title'], 'Assessment 0')
@@ -0,0 +1,66 @@
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.suppliers.models import Recommendation, TransportationEmission
+from .factories import create_user, create_supplier, create_emission
+
+class StoredRecommendationTests(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.supplier = create_supplier(self.user, orders=0)
+        self.shipment = {
+            'supplier': self.supplier.id,
+            'distance': 10,
+            'volume': 1,
+            'transport_mode': 'truck',
+            'vehicle_type': 'small_truck',
+            'fuel_type': 'diesel',
+            'load_factor': 0.1
+        }
+
+    def test_single_and_bulk_ingestion_store_the_same_flags(self):
+        response = self.client.post(reverse('suppliers:transportationemission-list'), self.shipment, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.client.post(reverse('suppliers:transportationemission-bulk'), [self.shipment], format='json')
+
+        single, bulk = TransportationEmission.objects.order_by('id')
+        self.assertEqual(TransportationEmission.objects.count(), 2)
+        self.assertEqual(single.recommendation_flags, bulk.recommendation_flags)
+        self.assertEqual(
+            single.recommendation_flags,
+            Recommendation.LARGER_TRUCK | Recommendation.CLEANER_FUEL | Recommendation.LOAD_FACTOR
+        )
+        self.assertEqual(response.data['recommendations'], [
+            str(Recommendation.LARGER_TRUCK.label),
+            str(Recommendation.CLEANER_FUEL.label),
+            str(Recommendation.LOAD_FACTOR.label)
+        ])
+
+    def test_reads_serve_stored_flags(self):
+        emission = create_emission(self.supplier, efficiency=95)
+        TransportationEmission.objects.filter(pk=emission.pk).update(recommendation_flags=Recommendation.PACKAGING)
+
+        response = self.client.get(reverse('suppliers:transportationemission-detail', args=[emission.pk]))
+        self.assertEqual(response.data['recommendations'], [str(Recommendation.PACKAGING.label)])
+
+    def test_backfill_command_fills_missing_flags_in_chunks(self):
+        for _ in range(5):
+            create_emission(self.supplier, efficiency=40, load_factor=0.5)
+        create_emission(self.supplier, efficiency=95)
+        self.assertEqual(TransportationEmission.objects.filter(recommendation_flags__isnull=True).count(), 6)
+
+        out = StringIO()
+        call_command('backfill_recommendations', batch_size=2, stdout=out)
+
+        self.assertIn('for 6 emissions', out.getvalue())
+        self.assertEqual(out.getvalue().count('Updated'), 3)
+        flags = list(TransportationEmission.objects.order_by('id').values_list('recommendation_flags', flat=True))
+        expected = (
+            Recommendation.LARGER_TRUCK | Recommendation.CLEANER_FUEL |
+            Recommendation.LOAD_FACTOR | Recommendation.PACKAGING
+        )
+        self.assertEqual(flags, [expected] * 5 + [0])
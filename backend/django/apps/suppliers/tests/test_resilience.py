@@ -0,0 +1,252 @@
+import asyncio
+import json
+import time
+from collections import Counter
+from unittest import mock
+import httpx
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.conf import settings
+from django.urls import reverse
+from apps.services.base import BaseService
+from apps.services.supplier_service import SupplierOverviewService
+from apps.services.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    FastAPIError,
+    FastAPITimeout,
+    ResiliencePolicy,
+    get_resilience_policy,
+    request_deadline,
+    reset_resilience_policy
+)
+from .factories import create_user, create_supplier
+
+def stub_app(script, default=(0, 200)):
+    """
+    FastAPI stand-in: the n-th call to a path answers with the n-th
+    (latency, status) of its script, repeating the last one
+    """
+    calls = Counter()
+
+    async def app(scope, receive, send):
+        path = scope['path']
+        calls[path] += 1
+        answers = script.get(path, [default])
+        latency, status_code = answers[min(calls[path], len(answers)) - 1]
+        await asyncio.sleep(latency)
+        body = json.dumps({'path': path, 'call': calls[path]}).encode()
+        await send({'type': 'http.response.start', 'status': status_code,
+                    'headers': [(b'content-type', b'application/json')]})
+        await send({'type': 'http.response.body', 'body': body})
+
+    app.calls = calls
+    return app
+
+def stub_client(app):
+    return httpx.AsyncClient(base_url='http://fastapi', transport=httpx.ASGITransport(app=app))
+
+class ResiliencePolicyTests(SimpleTestCase):
+    async def request(self, app, policy, method, endpoint, **kwargs):
+        async with stub_client(app) as client:
+            return await BaseService(client, policy).make_request(method, endpoint, **kwargs)
+
+    async def test_transient_failure_is_retried(self):
+        app = stub_app({'/a': [(0, 503), (0, 200)]})
+        policy = ResiliencePolicy(backoff=0.01)
+
+        result = await self.request(app, policy, 'GET', '/a')
+
+        self.assertEqual(result['call'], 2)
+        self.assertEqual(policy.stats['retries'], 1)
+        self.assertEqual(policy.stats['successes'], 1)
+
+    async def test_post_is_only_retried_when_idempotent(self):
+        app = stub_app({'/calc': [(0, 503), (0, 503), (0, 200)]})
+        policy = ResiliencePolicy(backoff=0.01)
+
+        with self.assertRaises(FastAPIError):
+            await self.request(app, policy, 'POST', '/calc', data={})
+        self.assertEqual(app.calls['/calc'], 1)
+
+        result = await self.request(app, policy, 'POST', '/calc', data={}, idempotent=True)
+        self.assertEqual(result['call'], 3)
+
+    async def test_client_errors_are_not_retried(self):
+        app = stub_app({'/a': [(0, 404)]})
+        policy = ResiliencePolicy(backoff=0.01)
+
+        with self.assertRaises(FastAPIError):
+            await self.request(app, policy, 'GET', '/a')
+        self.assertEqual(app.calls['/a'], 1)
+        self.assertEqual(policy.breaker.state, CircuitBreaker.CLOSED)
+
+    async def test_retry_budget_limits_retries(self):
+        app = stub_app({'/a': [(0, 503)]})
+        policy = ResiliencePolicy(max_retries=5, backoff=0.01, retry_budget_ratio=0, retry_budget_reserve=1)
+
+        with self.assertRaises(FastAPIError):
+            await self.request(app, policy, 'GET', '/a')
+
+        # One retry from the reserve, then the budget is spent
+        self.assertEqual(app.calls['/a'], 2)
+        self.assertEqual(policy.stats['retry_budget_exhausted'], 1)
+
+    async def test_breaker_opens_and_recovers(self):
+        script = {'/a': [(0, 503)]}
+        app = stub_app(script)
+        policy = ResiliencePolicy(max_retries=0, failure_threshold=2, reset_timeout=0.1)
+
+        for _ in range(2):
+            with self.assertRaises(FastAPIError):
+                await self.request(app, policy, 'GET', '/a')
+        with self.assertRaises(CircuitOpenError):
+            await self.request(app, policy, 'GET', '/a')
+        self.assertEqual(app.calls['/a'], 2)
+        self.assertEqual(policy.breaker.state, CircuitBreaker.OPEN)
+
+        # After the reset timeout a probe goes through and closes the circuit
+        script['/a'] = [(0, 200)]
+        await asyncio.sleep(0.1)
+        await self.request(app, policy, 'GET', '/a')
+        self.assertEqual(policy.breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(policy.snapshot()['circuit_rejections'], 1)
+        self.assertEqual(
+            [policy.stats['circuit_open'], policy.stats['circuit_half_open'], policy.stats['circuit_closed']],
+            [1, 1, 1]
+        )
+
+    async def test_server_errors_count_against_the_breaker(self):
+        app = stub_app({'/a': [(0, 500)]})
+        policy = ResiliencePolicy(failure_threshold=1)
+
+        with self.assertRaises(FastAPIError):
+            await self.request(app, policy, 'GET', '/a')
+
+        # A 500 is not worth retrying, but FastAPI is unhealthy
+        self.assertEqual(app.calls['/a'], 1)
+        self.assertEqual(policy.breaker.state, CircuitBreaker.OPEN)
+
+    async def test_cancelled_probe_does_not_wedge_the_breaker(self):
+        app = stub_app({'/slow': [(1, 200)]})
+        policy = ResiliencePolicy(max_retries=0, failure_threshold=1, reset_timeout=0.05)
+        policy.breaker.record_failure()
+        await asyncio.sleep(0.05)
+
+        async with stub_client(app) as client:
+            probe = asyncio.ensure_future(BaseService(client, policy).make_request('GET', '/slow'))
+            await asyncio.sleep(0.01)
+            probe.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await probe
+
+        # The abandoned probe is handed back, not counted against FastAPI
+        self.assertEqual(policy.breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertEqual(policy.stats['abandoned'], 1)
+        await self.request(app, policy, 'GET', '/fast')
+        self.assertEqual(policy.breaker.state, CircuitBreaker.CLOSED)
+
+    async def test_cancelled_overview_leaves_the_breaker_closed(self):
+        app = stub_app({}, default=(1, 200))
+        policy = ResiliencePolicy(failure_threshold=1)
+
+        async with stub_client(app) as client:
+            overview = asyncio.ensure_future(
+                SupplierOverviewService(client, policy).get_supplier_overview(1)
+            )
+            # Every section is in flight when the client disconnects
+            await asyncio.sleep(0.05)
+            overview.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await overview
+
+        self.assertEqual(sum(app.calls.values()), len(SupplierOverviewService.SECTIONS))
+        self.assertEqual(policy.breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(policy.stats['failures'], 0)
+        self.assertEqual(policy.stats['abandoned'], len(SupplierOverviewService.SECTIONS))
+
+    def test_unanswered_probe_expires(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05, on_change=lambda state: None)
+        breaker.record_failure()
+        time.sleep(0.05)
+
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+        time.sleep(0.05)
+        self.assertTrue(breaker.allow())
+
+    async def test_deadline_bounds_retries_and_is_counted(self):
+        app = stub_app({'/slow': [(1, 200)]})
+        policy = ResiliencePolicy(backoff=0.01)
+
+        started = time.perf_counter()
+        with request_deadline(0.1):
+            with self.assertRaises(FastAPITimeout):
+                await self.request(app, policy, 'GET', '/slow')
+
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertGreaterEqual(policy.stats['timeouts'], 1)
+        self.assertEqual(policy.stats['failures'], app.calls['/slow'])
+
+    async def test_endpoint_timeout(self):
+        app = stub_app({'/slow/1': [(1, 200)]})
+        policy = ResiliencePolicy(max_retries=0, endpoint_timeouts={'/slow/*': 0.05})
+
+        started = time.perf_counter()
+        with self.assertRaisesMessage(FastAPIError, 'within 0.05s'):
+            await self.request(app, policy, 'GET', '/slow/1')
+
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertEqual(policy.stats['timeouts'], 1)
+        self.assertEqual(policy.timeout_for('/fast'), policy.default_timeout)
+
+    async def test_slow_get_is_hedged(self):
+        app = stub_app({'/a': [(1, 200), (0, 200)]})
+        policy = ResiliencePolicy(hedge_delay=0.05)
+
+        started = time.perf_counter()
+        result = await self.request(app, policy, 'GET', '/a')
+
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertEqual(result['call'], 2)
+        self.assertEqual(policy.stats['hedges'], 1)
+        self.assertEqual(policy.stats['hedge_wins'], 1)
+
+@override_settings(FASTAPI_RESILIENCE={
+    **settings.FASTAPI_RESILIENCE, 'MAX_RETRIES': 0, 'BREAKER_FAILURE_THRESHOLD': 1
+})
+class FastAPIOutageViewTests(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.async_client.force_login(self.user)
+        supplier = create_supplier(self.user, orders=0)
+        self.path = f'/api/suppliers/{supplier.id}/performance'
+        self.url = reverse('suppliers:supplier-performance-metrics', args=[supplier.id])
+        reset_resilience_policy()
+        self.addCleanup(reset_resilience_policy)
+
+    async def test_outage_is_a_bad_gateway_then_unavailable(self):
+        app = stub_app({self.path: [(0, 503)]})
+
+        async with stub_client(app) as client:
+            with mock.patch('apps.services.base.get_http_client', return_value=client):
+                first = await self.async_client.get(self.url)
+                second = await self.async_client.get(self.url)
+
+        self.assertEqual(first.status_code, 502)
+        # The breaker opened, so FastAPI is not called again
+        self.assertEqual(second.status_code, 503)
+        self.assertEqual(app.calls[self.path], 1)
+
+    def test_health_view_reports_counters(self):
+        url = reverse('fastapi-health')
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        self.user.is_staff = True
+        self.user.save()
+        get_resilience_policy().stats['requests'] += 1
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['circuit_state'], CircuitBreaker.CLOSED)
+        self.assertEqual(response.data['requests'], 1)
@@ -0,0 +1,80 @@
+import asyncio
+import time
+from unittest import mock
+import httpx
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from apps.services.resilience import ResiliencePolicy, reset_resilience_policy
+from apps.services.supplier_service import SupplierOverviewService
+from .factories import create_user, create_supplier
+
+LATENCY = 0.05
+
+def overview_client(failing=(), slow=()):
+    """FastAPI stand-in answering every section after LATENCY seconds"""
+    async def handler(request):
+        section = request.url.path.rsplit('/', 1)[-1]
+        await asyncio.sleep(1 if section in slow else LATENCY)
+        if section in failing:
+            return httpx.Response(503)
+        return httpx.Response(200, json={'section': section})
+
+    return httpx.AsyncClient(base_url='http://fastapi', transport=httpx.MockTransport(handler))
+
+class SupplierOverviewServiceTests(SimpleTestCase):
+    async def test_sections_are_fetched_concurrently(self):
+        started = time.perf_counter()
+        async with overview_client() as client:
+            overview = await SupplierOverviewService(client).get_supplier_overview(1)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(set(overview['sections']), set(SupplierOverviewService.SECTIONS))
+        self.assertEqual(overview['errors'], {})
+        self.assertEqual(overview['sections']['water_usage'], {'section': 'water-usage'})
+        # Fifteen serial round trips would take 15 * LATENCY
+        self.assertLess(elapsed, 5 * LATENCY)
+
+    async def test_failed_and_slow_sections_are_reported(self):
+        async with overview_client(failing={'risk-assessment'}, slow={'capacity'}) as client:
+            # No retries, so the section reports the 503 rather than a spent deadline
+            service = SupplierOverviewService(client, ResiliencePolicy(max_retries=0))
+            overview = await service.get_supplier_overview(1, timeout=0.2)
+
+        self.assertEqual(set(overview['errors']), {'risk_assessment', 'capacity_analysis'})
+        self.assertEqual(overview['errors']['capacity_analysis'], 'Timed out after 0.2s')
+        self.assertIn('503', overview['errors']['risk_assessment'])
+        self.assertEqual(len(overview['sections']), len(SupplierOverviewService.SECTIONS) - 2)
+
+class SupplierOverviewViewTests(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.async_client.force_login(self.user)
+        self.supplier = create_supplier(self.user, orders=0)
+        self.url = reverse('suppliers:supplier-supplier-overview', args=[self.supplier.id])
+        # Failures below count towards the shared circuit breaker
+        self.addCleanup(reset_resilience_policy)
+
+    async def get(self, url, **kwargs):
+        async with overview_client(**kwargs) as client:
+            with mock.patch('apps.services.base.get_http_client', return_value=client):
+                return await self.async_client.get(url)
+
+    async def test_selected_sections(self):
+        response = await self.get(f'{self.url}?sections=quality_metrics,green_initiatives')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['supplier_id'], self.supplier.id)
+        self.assertEqual(set(response.data['sections']), {'quality_metrics', 'green_initiatives'})
+
+    async def test_unknown_section_is_rejected(self):
+        self.assertEqual((await self.get(f'{self.url}?sections=quality_metrics,horoscope')).status_code, 400)
+
+    async def test_all_sections_failing_is_a_bad_gateway(self):
+        response = await self.get(f'{self.url}?sections=financial_health', failing={'financial-health'})
+
+        self.assertEqual(response.status_code, 502)
+        self.assertIn('financial_health', response.data['errors'])
+
+    async def test_unknown_supplier(self):
+        url = reverse('suppliers:supplier-supplier-overview', args=[999999])
+        self.assertEqual((await self.get(url)).status_code, 404)
@@ -7,7 +7,8 @@ from .views import (
     SupplierAssessmentViewSet,
     OrderViewSet,
     TransportationEmissionViewSet,
-    EmissionFactorViewSet
+    EmissionFactorViewSet,
+    SupplierMetricsSnapshotViewSet
 )
 
 router = DefaultRouter()
@@ -18,6 +19,7 @@ router.register(r'assessments', SupplierAssessmentViewSet)
 router.register(r'orders', OrderViewSet)
 router.register(r'transportation-emissions', TransportationEmissionViewSet)
 router.register(r'emission-factors', EmissionFactorViewSet)
+router.register(r'supplier-metrics', SupplierMetricsSnapshotViewSet)
 
 app_name = 'suppliers'
 
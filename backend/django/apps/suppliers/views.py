@@ -2,7 +2,11 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from adrf import viewsets as async_viewsets
+from asgiref.sync import sync_to_async
 from django.shortcuts import get_object_or_404
+from django.conf import settings
+from django.db.models import Prefetch
 from django.utils import timezone
 from datetime import timedelta
 from .models import (
@@ -13,38 +17,101 @@ from .models import (
     Order,
     OrderItem,
     TransportationEmission,
-    EmissionFactor
+    EmissionFactor,
+    SupplierMetricsSnapshot
 )
 from .serializers import (
+    requested_fields,
     SupplierSerializer,
+    SupplierListSerializer,
     MaterialSerializer,
     SupplierMaterialSerializer,
     SupplierAssessmentSerializer,
     SupplierCreateSerializer,
     OrderSerializer,
+    OrderListSerializer,
     OrderCreateSerializer,
     OrderItemSerializer,
     TransportationEmissionSerializer,
     EmissionFactorSerializer,
-    TransportationEmissionSummarySerializer
+    TransportationEmissionSummarySerializer,
+    SupplierMetricsSnapshotSerializer
 )
-from apps.services.supplier_service import SupplierService, SupplierAnalyticsService
-from ..services.transportation_service import TransportationService
+from .exports import (
+    EXPORT_RENDERERS,
+    EMISSION_EXPORT_COLUMNS,
+    ORDER_EXPORT_COLUMNS,
+    export_response,
+    is_asgi_request,
+    filter_export
+)
+from .pagination import (
+    SupplierMetricsCursorPagination,
+    StandardCursorPagination,
+    OrderCursorPagination,
+    SupplierAssessmentCursorPagination
+)
+from apps.services.supplier_service import SupplierService, SupplierAnalyticsService, SupplierOverviewService
+from ..services.order_service import OrderService
+from ..services.transportation_service import TransportationService, emission_recommendation_flags
 import asyncio
+import codecs
+import csv
 
-class SupplierViewSet(viewsets.ModelViewSet):
+class SupplierViewSet(async_viewsets.ModelViewSet):
+    """
+    Async view: the FastAPI-backed actions run on the event loop and use the
+    async ORM; the sync CRUD handlers are run in a thread by the dispatcher.
+    """
     queryset = Supplier.objects.all()
     serializer_class = SupplierSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = StandardCursorPagination
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.supplier_service = SupplierService()
         self.analytics_service = SupplierAnalyticsService()
     
+    def get_queryset(self):
+        """
+        Load every relation the serializer nests in a fixed number of queries,
+        independent of the number of suppliers returned. Relations left out by
+        the list serializer or by ``?fields=`` are not fetched at all.
+        """
+        fields = requested_fields(self.request)
+        queryset = Supplier.objects.all()
+        if fields is None or 'total_orders' in fields:
+            queryset = queryset.select_related('metrics_snapshot')
+        if self.action == 'list':
+            return queryset
+        
+        prefetches = {
+            'materials': Prefetch(
+                'suppliermaterial_set',
+                queryset=SupplierMaterial.objects.select_related('material')
+            ),
+            'assessments': Prefetch(
+                'supplier_assessments',
+                queryset=SupplierAssessment.objects.select_related('created_by')
+            ),
+            'orders': Prefetch(
+                'orders',
+                queryset=Order.objects.select_related('created_by').prefetch_related(
+                    Prefetch('items', queryset=OrderItem.objects.select_related('material'))
+                )
+            )
+        }
+        return queryset.prefetch_related(*(
+            prefetch for field, prefetch in prefetches.items()
+            if fields is None or field in fields
+        ))
+    
     def get_serializer_class(self):
         if self.action == 'create':
             return SupplierCreateSerializer
+        if self.action == 'list':
+            return SupplierListSerializer
         return SupplierSerializer
     
     def perform_create(self, serializer):
@@ -52,11 +119,35 @@ class SupplierViewSet(viewsets.ModelViewSet):
     
     @action(detail=True, methods=['post'])
     async def create_order(self, request, pk=None):
-        supplier = self.get_object()
-        request.data['supplier'] = supplier.id
-        order_data = await self.supplier_service.create_order(request.data)
+        supplier = await self.aget_object()
+        order_data = await self.supplier_service.create_order(
+            {**request.data, 'supplier': supplier.id},
+            created_by=request.user
+        )
         return Response(order_data, status=status.HTTP_201_CREATED)
     
+    @action(detail=True, methods=['get'])
+    async def supplier_overview(self, request, pk=None):
+        """
+        All detail page analytics in one response, fetched from FastAPI concurrently.
+        ``?sections=a,b`` limits the response to the named sections; sections
+        that fail or time out are listed under ``errors``.
+        """
+        supplier = await self.aget_object()
+        sections = [name for name in request.query_params.get('sections', '').split(',') if name]
+        unknown = sorted(set(sections) - set(SupplierOverviewService.SECTIONS))
+        if unknown:
+            return Response(
+                {'error': f"Unknown sections: {', '.join(unknown)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        overview = await SupplierOverviewService().get_supplier_overview(supplier.id, sections)
+        return Response(
+            overview,
+            status=status.HTTP_502_BAD_GATEWAY if not overview['sections'] else status.HTTP_200_OK
+        )
+    
     @action(detail=True, methods=['get'])
     async def orders(self, request, pk=None):
         order_history = await self.supplier_service.get_order_history(pk)
@@ -69,8 +160,9 @@ class SupplierViewSet(viewsets.ModelViewSet):
     
     @action(detail=True, methods=['post'])
     async def sustainability_score(self, request, pk=None):
-        supplier = self.get_object()
-        supplier_data = SupplierSerializer(supplier).data
+        supplier = await self.aget_object()
+        # The nested serializers read related managers, which is sync-only ORM
+        supplier_data = await sync_to_async(lambda: SupplierSerializer(supplier).data)()
         score = await self.analytics_service.calculate_sustainability_score(supplier_data)
         return Response({"score": score})
     
@@ -158,36 +250,45 @@ class SupplierAssessmentViewSet(viewsets.ModelViewSet):
     queryset = SupplierAssessment.objects.all()
     serializer_class = SupplierAssessmentSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = SupplierAssessmentCursorPagination
     
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
     
     def get_queryset(self):
-        queryset = SupplierAssessment.objects.all()
+        queryset = SupplierAssessment.objects.select_related('created_by')
         supplier_id = self.request.query_params.get('supplier_id', None)
         if supplier_id is not None:
             queryset = queryset.filter(supplier_id=supplier_id)
         return queryset
 
-class OrderViewSet(viewsets.ModelViewSet):
+class OrderViewSet(async_viewsets.ModelViewSet):
     queryset = Order.objects.all()
     serializer_class = OrderSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = OrderCursorPagination
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.supplier_service = SupplierService()
+        self.order_service = OrderService()
     
     def get_serializer_class(self):
         if self.action == 'create':
             return OrderCreateSerializer
+        if self.action == 'list':
+            return OrderListSerializer
         return OrderSerializer
     
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
     
     def get_queryset(self):
-        queryset = Order.objects.all()
+        queryset = Order.objects.select_related('supplier', 'created_by')
+        if self.action != 'list':
+            queryset = queryset.prefetch_related(
+                Prefetch('items', queryset=OrderItem.objects.select_related('material'))
+            )
         supplier_id = self.request.query_params.get('supplier_id', None)
         if supplier_id is not None:
             queryset = queryset.filter(supplier_id=supplier_id)
@@ -195,18 +296,65 @@ class OrderViewSet(viewsets.ModelViewSet):
     
     @action(detail=True, methods=['get'])
     async def analytics(self, request, pk=None):
-        order = self.get_object()
+        # get_queryset() preloads everything OrderSerializer reads
+        order = await self.aget_object()
         order_data = OrderSerializer(order).data
         metrics = await self.supplier_service.calculate_order_metrics(order_data)
         return Response(metrics)
 
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """
+        Create many orders with their items from a JSON array (or {"orders": [...]})
+        """
+        rows = request.data if isinstance(request.data, list) else request.data.get('orders')
+        if not isinstance(rows, list) or not rows:
+            return Response(
+                {'error': 'Provide a non-empty JSON array of orders'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        max_rows = settings.ORDER_SETTINGS['MAX_BULK_ORDERS']
+        if len(rows) > max_rows:
+            return Response(
+                {'error': f'At most {max_rows} orders per request'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not all(isinstance(row, dict) for row in rows):
+            return Response(
+                {'error': 'Each order must be an object'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        result = self.order_service.bulk_create_orders(rows, created_by=request.user)
+        report = result['data']
+        return Response(
+            report,
+            status=status.HTTP_201_CREATED if report['created'] else status.HTTP_400_BAD_REQUEST
+        )
+
+    @action(detail=False, methods=['get'], renderer_classes=EXPORT_RENDERERS)
+    def export(self, request):
+        """
+        Stream orders with their items as CSV (default) or NDJSON
+        (``?format=ndjson``), filtered by supplier_id, start_date and end_date
+        """
+        queryset = filter_export(Order.objects.all(), request, 'order_date')
+        return export_response(
+            queryset.order_by('order_date', 'order_id', 'items__id'),
+            ORDER_EXPORT_COLUMNS,
+            request.accepted_renderer.format,
+            'orders',
+            asynchronous=is_asgi_request(request)
+        )
+
 class TransportationEmissionViewSet(viewsets.ModelViewSet):
     queryset = TransportationEmission.objects.all()
     serializer_class = TransportationEmissionSerializer
+    pagination_class = StandardCursorPagination
     service = TransportationService()
 
     def get_queryset(self):
-        queryset = super().get_queryset()
+        queryset = super().get_queryset().select_related('supplier')
         supplier_id = self.request.query_params.get('supplier_id')
         if supplier_id:
             queryset = queryset.filter(supplier_id=supplier_id)
@@ -216,34 +364,88 @@ class TransportationEmissionViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
-        # Calculate emissions using the service
+        # The service calculates and stores the emission with its recommendations
         result = self.service.calculate_emissions(
             supplier_id=serializer.validated_data['supplier'].id,
             distance=serializer.validated_data['distance'],
             volume=serializer.validated_data['volume'],
             transport_mode=serializer.validated_data['transport_mode'],
-            vehicle_type=serializer.validated_data['vehicle_type'],
-            fuel_type=serializer.validated_data['fuel_type'],
+            vehicle_type=serializer.validated_data.get('vehicle_type'),
+            fuel_type=serializer.validated_data.get('fuel_type'),
             load_factor=serializer.validated_data.get('load_factor', 0.8),
             return_trip=serializer.validated_data.get('return_trip', False)
         )
-        
-        # Update serializer data with calculated values
-        serializer.validated_data.update({
-            'total_emissions': result['total_emissions'],
-            'emissions_per_km': result['emissions_per_km'],
-            'emissions_per_volume': result['emissions_per_volume'],
-            'transport_efficiency_score': result['efficiency_score']
-        })
-        
-        self.perform_create(serializer)
+        if not result['success']:
+            return Response({'error': result['error']}, status=status.HTTP_400_BAD_REQUEST)
+
+        emission = self.get_queryset().get(id=result['data']['emission_id'])
+        serializer = self.get_serializer(emission)
         headers = self.get_success_headers(serializer.data)
         return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
+    def perform_update(self, serializer):
+        emission = serializer.save()
+        emission.recommendation_flags = emission_recommendation_flags(emission)
+        emission.save(update_fields=['recommendation_flags'])
+
+    @action(detail=False, methods=['get'], renderer_classes=EXPORT_RENDERERS)
+    def export(self, request):
+        """
+        Stream emissions as CSV (default) or NDJSON (``?format=ndjson``),
+        filtered by supplier_id, start_date and end_date
+        """
+        queryset = filter_export(TransportationEmission.objects.all(), request, 'created_at')
+        return export_response(
+            queryset.order_by('id'),
+            EMISSION_EXPORT_COLUMNS,
+            request.accepted_renderer.format,
+            'transportation_emissions',
+            asynchronous=is_asgi_request(request)
+        )
+
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """
+        Ingest many shipment legs: a JSON array (or {"shipments": [...]}) or a
+        CSV upload in the ``file`` field with the same column names
+        """
+        upload = request.FILES.get('file')
+        if upload is not None:
+            rows = list(csv.DictReader(codecs.iterdecode(upload, 'utf-8-sig')))
+        elif isinstance(request.data, list):
+            rows = request.data
+        else:
+            rows = request.data.get('shipments')
+        
+        if not isinstance(rows, list) or not rows:
+            return Response(
+                {'error': 'Provide a non-empty JSON array of shipments or a CSV file'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        max_rows = settings.TRANSPORTATION_SETTINGS['MAX_BULK_ROWS']
+        if len(rows) > max_rows:
+            return Response(
+                {'error': f'At most {max_rows} shipments per request'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not all(isinstance(row, dict) for row in rows):
+            return Response(
+                {'error': 'Each shipment must be an object'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        result = self.service.bulk_create_emissions(rows)
+        report = result['data']
+        return Response(
+            report,
+            status=status.HTTP_201_CREATED if report['created'] else status.HTTP_400_BAD_REQUEST
+        )
+
     @action(detail=False, methods=['get'])
     def summary(self, request):
         supplier_id = request.query_params.get('supplier_id')
         days = int(request.query_params.get('days', 30))
+        group_by = request.query_params.get('group_by')
         
         if not supplier_id:
             return Response(
@@ -254,35 +456,20 @@ class TransportationEmissionViewSet(viewsets.ModelViewSet):
         end_date = timezone.now()
         start_date = end_date - timedelta(days=days)
         
-        emissions = self.service.get_supplier_emissions(
+        # Totals, per-mode figures and the optional breakdown in one grouped query
+        result = self.service.get_supplier_emissions(
             supplier_id=supplier_id,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            group_by=group_by
         )
+        if not result['success']:
+            return Response(
+                {'error': result['error']},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        # Calculate summary statistics
-        total_emissions = sum(e['total_emissions'] for e in emissions)
-        total_distance = sum(e['distance'] for e in emissions)
-        total_volume = sum(e['volume'] for e in emissions)
-        average_efficiency = sum(e['transport_efficiency_score'] for e in emissions) / len(emissions) if emissions else 0
-        
-        # Group emissions by transport mode
-        emissions_by_mode = {}
-        for emission in emissions:
-            mode = emission['transport_mode']
-            if mode not in emissions_by_mode:
-                emissions_by_mode[mode] = 0
-            emissions_by_mode[mode] += emission['total_emissions']
-        
-        summary_data = {
-            'total_emissions': total_emissions,
-            'average_efficiency': average_efficiency,
-            'total_distance': total_distance,
-            'total_volume': total_volume,
-            'emissions_by_mode': emissions_by_mode
-        }
-        
-        serializer = TransportationEmissionSummarySerializer(summary_data)
+        serializer = TransportationEmissionSummarySerializer(result['data'])
         return Response(serializer.data)
 
 class EmissionFactorViewSet(viewsets.ModelViewSet):
@@ -303,3 +490,18 @@ class EmissionFactorViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(fuel_type=fuel_type)
             
         return queryset.filter(is_active=True)
+
+class SupplierMetricsSnapshotViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Dashboard metrics, one precomputed row per supplier
+    """
+    queryset = SupplierMetricsSnapshot.objects.select_related('supplier')
+    serializer_class = SupplierMetricsSnapshotSerializer
+    pagination_class = SupplierMetricsCursorPagination
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        supplier_id = self.request.query_params.get('supplier_id')
+        if supplier_id:
+            queryset = queryset.filter(supplier_id=supplier_id)
+        return queryset
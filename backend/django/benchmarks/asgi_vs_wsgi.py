@@ -0,0 +1,130 @@
+"""
+Throughput of the FastAPI-backed supplier actions under gunicorn in WSGI mode
+(threaded sync workers) and ASGI mode (uvicorn workers), see gunicorn.conf.py.
+
+FastAPI is replaced by a stub that answers every request after a fixed
+latency, so the numbers measure how many upstream waits each mode overlaps.
+The database is a throwaway SQLite file.
+
+    python -m benchmarks.asgi_vs_wsgi [requests] [concurrency] [workers]
+"""
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import httpx
+
+UPSTREAM_LATENCY = 0.05  # seconds per FastAPI call
+ENDPOINTS = ("performance_metrics", "supplier_overview")
+
+async def upstream(scope, receive, send):
+    """FastAPI stand-in: every GET succeeds after UPSTREAM_LATENCY"""
+    if scope["type"] != "http":
+        return
+    await asyncio.sleep(UPSTREAM_LATENCY)
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": b'{"status": "ok"}'})
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def prepare_database(env: dict) -> tuple:
+    """Migrate the throwaway database; return a supplier id and a session cookie"""
+    os.environ.update(env)
+    import django
+    django.setup()
+    from django.core.management import call_command
+    from django.test import Client
+    from apps.suppliers.tests.factories import create_user, create_supplier
+
+    # The users app has no migrations, so its tables come from syncdb
+    call_command("migrate", run_syncdb=True, verbosity=0)
+    user = create_user()
+    supplier = create_supplier(user, orders=0)
+    client = Client()
+    client.force_login(user)
+    return supplier.id, client.cookies["sessionid"].value
+
+def start(command: list, env: dict, port: int) -> subprocess.Popen:
+    process = subprocess.Popen(command, env={**os.environ, **env}, stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError(f"{command[0]} did not start on port {port}")
+
+async def load(url: str, session: str, total: int, concurrency: int) -> tuple:
+    latencies = []
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(cookies={"sessionid": session}, limits=limits, timeout=60) as client:
+        remaining = iter(range(total))
+
+        async def worker():
+            for _ in remaining:
+                started = time.perf_counter()
+                response = await client.get(url)
+                assert response.status_code == 200, response.text[:200]
+                latencies.append(time.perf_counter() - started)
+
+        # Warm up connections, the client pool and Django's URL resolver
+        await asyncio.gather(*(client.get(url) for _ in range(concurrency)))
+        start_time = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start_time
+    latencies.sort()
+    return total / elapsed, statistics.median(latencies), latencies[int(len(latencies) * 0.95)]
+
+def main(total: int, concurrency: int, workers: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        upstream_port, django_port = free_port(), free_port()
+        env = {
+            "DJANGO_SETTINGS_MODULE": "benchmarks.settings",
+            "BENCHMARK_DATABASE": os.path.join(directory, "benchmark.sqlite3"),
+            "FASTAPI_BASE_URL": f"http://127.0.0.1:{upstream_port}",
+            "GUNICORN_BIND": f"127.0.0.1:{django_port}",
+            "GUNICORN_WORKERS": str(workers),
+        }
+        supplier_id, session = prepare_database(env)
+        upstream_server = start(
+            [sys.executable, "-m", "uvicorn", "benchmarks.asgi_vs_wsgi:upstream",
+             "--port", str(upstream_port), "--log-level", "warning",
+             # Outlive the Django client's keep-alive so pooled connections are not cut
+             "--timeout-keep-alive", "60"],
+            env, upstream_port
+        )
+        try:
+            print(f"{total} requests, concurrency {concurrency}, {workers} workers, "
+                  f"{UPSTREAM_LATENCY * 1000:.0f} ms upstream latency")
+            for mode in ("wsgi", "asgi"):
+                server = start(
+                    [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py"],
+                    {**env, "DJANGO_SERVER_MODE": mode}, django_port
+                )
+                try:
+                    for endpoint in ENDPOINTS:
+                        url = f"http://127.0.0.1:{django_port}/api/suppliers/suppliers/{supplier_id}/{endpoint}/"
+                        rate, median, p95 = asyncio.run(load(url, session, total, concurrency))
+                        print(f"{mode:>5} {endpoint:>20}: {rate:8,.0f} req/s  "
+                              f"p50 {median * 1000:6.0f} ms  p95 {p95 * 1000:6.0f} ms")
+                finally:
+                    server.terminate()
+                    server.wait()
+        finally:
+            upstream_server.terminate()
+            upstream_server.wait()
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+    main(total, concurrency, workers)
@@ -0,0 +1,20 @@
+"""Settings for benchmarks.asgi_vs_wsgi: development settings on a throwaway database."""
+import os
+from config.settings.development import *
+
+DEBUG = False
+FASTAPI_BASE_URL = os.environ['FASTAPI_BASE_URL']
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ['BENCHMARK_DATABASE'],
+    }
+}
+
+# Failed requests abort the run; print their tracebacks on the server's stderr
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {'console': {'class': 'logging.StreamHandler'}},
+    'loggers': {'django.request': {'handlers': ['console'], 'level': 'ERROR'}},
+}
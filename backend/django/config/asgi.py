@@ -13,4 +13,25 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+from apps.services.http import close_http_clients, mark_persistent_loop  # noqa: E402
+
+async def application(scope, receive, send):
+    """
+    Django does not handle the ASGI lifespan protocol; answer it here so the
+    pooled FastAPI client is closed when the worker shuts down.
+    """
+    if scope['type'] != 'lifespan':
+        # The server loop serves every request, so it keeps its own pooled client
+        mark_persistent_loop()
+        return await django_application(scope, receive, send)
+
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await close_http_clients()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
@@ -64,6 +64,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'config.wsgi.application'
+ASGI_APPLICATION = 'config.asgi.application'
 
 # Database
 DATABASES = {
@@ -142,9 +143,64 @@ SPECTACULAR_SETTINGS = {
 # FastAPI Configuration
 FASTAPI_BASE_URL = os.environ.get('FASTAPI_BASE_URL', 'http://localhost:8001')
 
+# Pooled HTTP client used by the services layer for Django -> FastAPI calls
+FASTAPI_HTTP_CLIENT = {
+    'MAX_CONNECTIONS': int(os.environ.get('FASTAPI_MAX_CONNECTIONS', 100)),
+    'MAX_KEEPALIVE_CONNECTIONS': int(os.environ.get('FASTAPI_MAX_KEEPALIVE_CONNECTIONS', 20)),
+    'KEEPALIVE_EXPIRY': float(os.environ.get('FASTAPI_KEEPALIVE_EXPIRY', 30.0)),  # seconds
+    'HTTP2': os.environ.get('FASTAPI_HTTP2', 'False') == 'True',
+    'CONNECT_TIMEOUT': float(os.environ.get('FASTAPI_CONNECT_TIMEOUT', 2.0)),  # seconds
+    'READ_TIMEOUT': float(os.environ.get('FASTAPI_READ_TIMEOUT', 10.0)),
+    'WRITE_TIMEOUT': float(os.environ.get('FASTAPI_WRITE_TIMEOUT', 10.0)),
+    'POOL_TIMEOUT': float(os.environ.get('FASTAPI_POOL_TIMEOUT', 2.0)),
+}
+
+# Timeouts, retries, circuit breaker and hedging for every FastAPI call
+FASTAPI_RESILIENCE = {
+    'DEFAULT_TIMEOUT': float(os.environ.get('FASTAPI_DEFAULT_TIMEOUT', 5.0)),  # seconds
+    # Endpoint glob -> timeout; the first matching pattern wins
+    'ENDPOINT_TIMEOUTS': {
+        '/api/orders/calculate/batch': 10.0,
+        '/api/suppliers/*/analytics': 8.0,
+    },
+    'MAX_RETRIES': int(os.environ.get('FASTAPI_MAX_RETRIES', 2)),
+    'RETRY_BACKOFF': float(os.environ.get('FASTAPI_RETRY_BACKOFF', 0.1)),  # seconds, doubled per retry
+    'RETRY_BACKOFF_MAX': float(os.environ.get('FASTAPI_RETRY_BACKOFF_MAX', 1.0)),
+    # Retries and hedges may add at most 20% to the traffic, plus a small reserve
+    'RETRY_BUDGET_RATIO': float(os.environ.get('FASTAPI_RETRY_BUDGET_RATIO', 0.2)),
+    'RETRY_BUDGET_RESERVE': int(os.environ.get('FASTAPI_RETRY_BUDGET_RESERVE', 10)),
+    'BREAKER_FAILURE_THRESHOLD': int(os.environ.get('FASTAPI_BREAKER_FAILURE_THRESHOLD', 5)),
+    'BREAKER_RESET_TIMEOUT': float(os.environ.get('FASTAPI_BREAKER_RESET_TIMEOUT', 30.0)),
+    # Send a second GET when the first has not answered after this many seconds
+    'HEDGE_DELAY': float(os.environ['FASTAPI_HEDGE_DELAY']) if os.environ.get('FASTAPI_HEDGE_DELAY') else None,
+}
+
+# Concurrent order metric calculations are coalesced into one batch request
+FASTAPI_ORDER_METRICS_BATCH = {
+    'WINDOW': float(os.environ.get('FASTAPI_ORDER_METRICS_BATCH_WINDOW', 0.005)),  # seconds
+    'MAX_BATCH_SIZE': int(os.environ.get('FASTAPI_ORDER_METRICS_BATCH_SIZE', 100)),
+}
+
+# Per-section deadline (seconds) of the concurrent supplier overview fan-out; it
+# shortens the FASTAPI_RESILIENCE timeouts and retries of each section's calls
+SUPPLIER_OVERVIEW = {
+    'SECTION_TIMEOUT': float(os.environ.get('SUPPLIER_OVERVIEW_SECTION_TIMEOUT', 3.0)),
+}
+
+# Rows fetched per database round trip and per streamed chunk in CSV/NDJSON exports
+EXPORT_CHUNK_SIZE = 2000
+
+ORDER_SETTINGS = {
+    'BULK_CREATE_BATCH_SIZE': 1000,
+    'MAX_BULK_ORDERS': 50000,
+}
+
 # Transportation Settings
 TRANSPORTATION_SETTINGS = {
     'DEFAULT_LOAD_FACTOR': 0.8,
+    'BULK_CREATE_BATCH_SIZE': 1000,
+    'MAX_BULK_ROWS': 100000,
+    'FACTOR_VERSION_CHECK_INTERVAL': 5,  # seconds between shared factor table version checks
     'MAX_EMISSIONS_PER_KM': 2.0,  # kg CO2e/km
     'MAX_EMISSIONS_PER_VOLUME': 5.0,  # kg CO2e/m3
     'EFFICIENCY_SCORE_WEIGHTS': {
@@ -19,6 +19,7 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
+from apps.services.views import FastAPIHealthView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -32,6 +33,7 @@ urlpatterns = [
     path('api/users/', include('apps.users.urls')),
     path('api/suppliers/', include('apps.suppliers.urls')),
     path('api/assessments/', include('apps.assessments.urls')),
+    path('api/health/fastapi/', FastAPIHealthView.as_view(), name='fastapi-health'),
 ]
 
 if settings.DEBUG:
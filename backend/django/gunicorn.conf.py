@@ -0,0 +1,29 @@
+"""
+Gunicorn settings for both deployment modes, picked with DJANGO_SERVER_MODE:
+
+    asgi (default)  config.asgi:application on uvicorn workers; async views and
+                    the pooled FastAPI client share each worker's event loop
+    wsgi            config.wsgi:application on threaded sync workers; every
+                    async view runs on a throwaway event loop
+
+    gunicorn -c gunicorn.conf.py
+"""
+import multiprocessing
+import os
+
+mode = os.environ.get('DJANGO_SERVER_MODE', 'asgi')
+if mode not in ('asgi', 'wsgi'):
+    raise ValueError(f"DJANGO_SERVER_MODE must be 'asgi' or 'wsgi', got {mode!r}")
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG')  # e.g. "-" for stdout
+
+if mode == 'asgi':
+    wsgi_app = 'config.asgi:application'
+    worker_class = 'uvicorn_worker.UvicornWorker'
+else:
+    wsgi_app = 'config.wsgi:application'
+    worker_class = 'gthread'
+    threads = int(os.environ.get('GUNICORN_THREADS', 4))
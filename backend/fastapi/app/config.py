@@ -2,7 +2,7 @@
 
 from pydantic_settings import BaseSettings
 from functools import lru_cache
-from typing import List
+from typing import List, Optional
 
 class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
@@ -12,9 +12,21 @@ class Settings(BaseSettings):
     # Calculation Parameters
     MAX_OPTIMIZATION_ITERATIONS: int = 1000
     DEFAULT_TOLERANCE: float = 0.0001
+    OPTIMIZATION_TIME_LIMIT: int = 30  # seconds
+    MAX_ORDER_BATCH_SIZE: int = 1000  # orders per /api/orders/calculate/batch request
+    
+    # Read-only access to the Django database, e.g. postgresql+asyncpg://user:pass@db/fontaine_sante_db
+    DATABASE_URL: Optional[str] = None
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a pooled connection
+    DB_POOL_RECYCLE: int = 1800  # seconds
     
     # Caching
     CACHE_TTL: int = 3600  # 1 hour
+    CACHE_MAX_ENTRIES: int = 1024
+    REDIS_URL: Optional[str] = None  # e.g. redis://redis:6379/0 enables the shared tier
+    ANALYTICS_CACHE_TTL: int = 300  # supplier analytics read live data, so expire sooner
     
     # API Settings
     API_KEY: str = "your-secret-api-key"  # Change this in production!
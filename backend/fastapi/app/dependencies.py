@@ -1,6 +1,9 @@
 from fastapi import Header, HTTPException, Depends
+from functools import lru_cache
 from typing import Optional
 from .services.calculation_service import CalculationService
+from .services.cache import ResultCache
+from .services.supplier_analytics import SupplierAnalyticsService
 from .config import settings
 
 async def verify_token(x_token: str = Header(...)):
@@ -9,5 +12,13 @@ async def verify_token(x_token: str = Header(...)):
     # Add token verification logic
     return x_token
 
-def get_calculation_service():
-    return CalculationService()
+@lru_cache()
+def get_calculation_service() -> CalculationService:
+    # One shared instance per process; engines are stateless after construction
+    return CalculationService(cache=ResultCache.from_settings(settings))
+
+@lru_cache()
+def get_supplier_analytics_service() -> SupplierAnalyticsService:
+    return SupplierAnalyticsService(
+        cache=ResultCache.from_settings(settings, ttl=settings.ANALYTICS_CACHE_TTL, key_prefix="scos:analytics")
+    )
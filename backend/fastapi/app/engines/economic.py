@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException
-from typing import List, Dict
+from typing import List, Dict, Optional
 from ..schemas.economic import (
     SupplierCostInput,
     EconomicScoreOutput,
-    OptimizationResult
+    OptimizationResult,
+    SupplierCostBatchInput,
+    EconomicBatchOutput
 )
 from ..services.calculation_service import CalculationService
 from ..dependencies import get_calculation_service
@@ -32,13 +34,32 @@ async def calculate_economic_score(
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.post("/calculate-score/batch", response_model=EconomicBatchOutput)
+async def calculate_economic_scores_batch(
+    data: SupplierCostBatchInput,
+    calc_service: CalculationService = Depends(get_calculation_service)
+):
+    try:
+        result = await calc_service.calculate_economic_scores_batch(data)
+        return result
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.post("/optimize", response_model=OptimizationResult)
 async def optimize_sourcing(
     data: List[SupplierCostInput],
+    demand: Optional[float] = None,
+    max_lead_time: Optional[int] = None,
+    strategy: str = "solver",
     calc_service: CalculationService = Depends(get_calculation_service)
 ):
     try:
-        result = await calc_service.optimize_sourcing(data)
+        result = await calc_service.optimize_sourcing(
+            data,
+            demand=demand,
+            max_lead_time=max_lead_time,
+            strategy=strategy
+        )
         return result
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e)) 
\ No newline at end of file
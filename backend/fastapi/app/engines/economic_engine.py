@@ -1,6 +1,16 @@
 from typing import Dict, Any, List
-from ..schemas.economic import SupplierCostInput, EconomicScoreOutput, OptimizationResult
+import numpy as np
+from ..schemas.economic import (
+    SupplierCostInput,
+    EconomicScoreOutput,
+    OptimizationResult,
+    SupplierCostBatchInput,
+    EconomicBatchRow,
+    BatchRowError,
+    EconomicBatchOutput
+)
 from ..exceptions import ValidationError, CalculationError
+from ..services.metrics import timed_engine
 
 class EconomicEngine:
     async def calculate(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -11,6 +21,7 @@ class EconomicEngine:
         except Exception as e:
             raise CalculationError(f"Error in economic calculation: {str(e)}")
 
+    @timed_engine("EconomicEngine")
     async def calculate_economic_score(
         self,
         data: SupplierCostInput
@@ -60,6 +71,114 @@ class EconomicEngine:
         except Exception as e:
             raise CalculationError(f"Error calculating economic score: {str(e)}")
 
+    @timed_engine("EconomicEngine")
+    async def calculate_economic_scores_batch(
+        self,
+        data: SupplierCostBatchInput
+    ) -> EconomicBatchOutput:
+        """Score a columnar batch of suppliers in a single vectorized pass.
+
+        Rows that fail validation are reported in ``errors`` instead of
+        aborting the batch; every other row is scored with the same formulas
+        as ``calculate_economic_score``.
+        """
+        try:
+            total_rows = len(data.supplier_id)
+            if total_rows == 0:
+                raise ValidationError("No supplier data provided")
+
+            supplier_ids = np.asarray(data.supplier_id, dtype=np.int64)
+            material_cost = np.asarray(data.material_cost, dtype=np.float64)
+            transportation_cost = np.asarray(data.transportation_cost, dtype=np.float64)
+            labor_cost = np.asarray(data.labor_cost, dtype=np.float64)
+            overhead_cost = np.asarray(data.overhead_cost, dtype=np.float64)
+            tax_rate = np.asarray(data.tax_rate, dtype=np.float64)
+            capacity = np.asarray(data.capacity, dtype=np.float64)
+            volume = np.asarray(data.volume, dtype=np.float64)
+            lead_time = np.asarray(data.lead_time, dtype=np.int64)
+
+            # Per-row checks mirror the SupplierCostInput field constraints
+            checks = [
+                (material_cost > 0, "material_cost must be greater than zero"),
+                (transportation_cost > 0, "transportation_cost must be greater than zero"),
+                (labor_cost > 0, "labor_cost must be greater than zero"),
+                (overhead_cost > 0, "overhead_cost must be greater than zero"),
+                ((tax_rate >= 0) & (tax_rate <= 1), "tax_rate must be between 0 and 1"),
+                (capacity > 0, "Capacity must be greater than zero"),
+                (volume > 0, "Volume must be greater than zero"),
+                (lead_time > 0, "lead_time must be greater than zero"),
+            ]
+            valid = np.logical_and.reduce([mask for mask, _ in checks])
+
+            row_errors: Dict[int, List[str]] = {}
+            for mask, message in checks:
+                for index in np.flatnonzero(~mask).tolist():
+                    row_errors.setdefault(index, []).append(message)
+
+            rows = np.flatnonzero(valid)
+            total_cost = (
+                material_cost[rows] +
+                transportation_cost[rows] +
+                labor_cost[rows] +
+                overhead_cost[rows]
+            )
+            tax_amount = total_cost * tax_rate[rows]
+            cost_per_unit = total_cost / volume[rows]
+            capacity_value = capacity[rows] * cost_per_unit
+            roi = (capacity_value - total_cost) / total_cost * 100
+            score = 100 * (1 - total_cost / capacity_value)
+
+            # Recommendation tiers follow the thresholds in _generate_recommendations
+            thresholds = (30.0, 60.0)
+            tier_recommendations = [
+                self._generate_recommendations(value)
+                for value in (0.0,) + thresholds
+            ]
+            tiers = np.searchsorted(thresholds, score, side="right")
+
+            columns = zip(
+                rows.tolist(),
+                supplier_ids[rows].tolist(),
+                np.clip(score, 0, 100).tolist(),
+                total_cost.tolist(),
+                tax_amount.tolist(),
+                cost_per_unit.tolist(),
+                roi.tolist(),
+                tiers.tolist()
+            )
+            results = []
+            for index, supplier_id, row_score, row_total, row_tax, row_unit_cost, row_roi, tier in columns:
+                results.append(EconomicBatchRow(
+                    index=index,
+                    supplier_id=supplier_id,
+                    score=row_score,
+                    total_cost=row_total,
+                    tax=row_tax,
+                    cost_per_unit=row_unit_cost,
+                    roi=row_roi,
+                    recommendations=tier_recommendations[tier]
+                ))
+
+            errors = [
+                BatchRowError(
+                    index=index,
+                    supplier_id=data.supplier_id[index],
+                    errors=messages
+                )
+                for index, messages in sorted(row_errors.items())
+            ]
+
+            return EconomicBatchOutput(
+                results=results,
+                errors=errors,
+                total_rows=total_rows,
+                processed_rows=len(results)
+            )
+        except ValidationError as e:
+            raise e
+        except Exception as e:
+            raise CalculationError(f"Error calculating economic scores batch: {str(e)}")
+
     def _generate_recommendations(self, score: float) -> List[str]:
         recommendations = []
         if score < 30:
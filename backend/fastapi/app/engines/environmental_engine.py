@@ -1,6 +1,7 @@
 from typing import Dict, Any, List
 from ..schemas.environmental import EnvironmentalInput, EnvironmentalAssessment
 from ..exceptions import ValidationError, CalculationError
+from ..services.metrics import timed_engine
 
 class EnvironmentalEngine:
     async def calculate(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -11,6 +12,7 @@ class EnvironmentalEngine:
         except Exception as e:
             raise CalculationError(f"Error in environmental calculation: {str(e)}")
 
+    @timed_engine("EnvironmentalEngine")
     async def assess_environmental_impact(
         self,
         data: EnvironmentalInput
@@ -0,0 +1,252 @@
+import asyncio
+import time
+from typing import Dict, Any, List, Optional
+import pulp
+from ..config import settings
+from ..schemas.economic import SupplierCostInput, OptimizationResult
+from ..exceptions import ValidationError, CalculationError
+from ..services.metrics import timed_engine
+
+class OptimizationEngine:
+    """Allocates demand across suppliers with an LP/MILP solved by the bundled CBC solver."""
+
+    def __init__(self):
+        self.max_nodes = settings.MAX_OPTIMIZATION_ITERATIONS
+        self.gap_tolerance = settings.DEFAULT_TOLERANCE
+        self.time_limit = settings.OPTIMIZATION_TIME_LIMIT
+
+    def solver_available(self) -> bool:
+        return bool(pulp.PULP_CBC_CMD(msg=False).available())
+
+    @timed_engine("OptimizationEngine")
+    async def optimize_sourcing(
+        self,
+        data: List[SupplierCostInput],
+        demand: Optional[float] = None,
+        max_lead_time: Optional[int] = None,
+        warm_start: bool = True
+    ) -> OptimizationResult:
+        """
+        Minimize the variable cost of meeting demand.
+
+        Each supplier receives an allocation bounded by its capacity. Suppliers
+        with a minimum order quantity get a binary "used" variable, which turns
+        the model into a MILP. Suppliers slower than ``max_lead_time`` are
+        excluded. Demand defaults to the total volume currently ordered.
+        """
+        try:
+            self._validate_suppliers(data)
+
+            if demand is None:
+                demand = sum(s.volume for s in data)
+            if demand <= 0:
+                raise ValidationError("Demand must be greater than zero")
+
+            eligible = [
+                s for s in data
+                if max_lead_time is None or s.lead_time <= max_lead_time
+            ]
+            if not eligible:
+                raise ValidationError(f"No supplier meets the maximum lead time of {max_lead_time} days")
+            if sum(s.capacity for s in eligible) < demand:
+                raise ValidationError("Total supplier capacity is insufficient to meet demand")
+
+            unit_costs = [s.material_cost + s.transportation_cost for s in eligible]
+            is_mip = any(s.min_order_quantity for s in eligible)
+
+            # Build the model
+            problem = pulp.LpProblem("supplier_allocation", pulp.LpMinimize)
+            allocations = [
+                pulp.LpVariable(f"x_{i}", lowBound=0, upBound=s.capacity)
+                for i, s in enumerate(eligible)
+            ]
+            usage = {}
+            for i, supplier in enumerate(eligible):
+                if supplier.min_order_quantity:
+                    usage[i] = pulp.LpVariable(f"y_{i}", cat=pulp.LpBinary)
+                    problem += allocations[i] <= supplier.capacity * usage[i], f"capacity_{i}"
+                    problem += allocations[i] >= supplier.min_order_quantity * usage[i], f"min_order_{i}"
+
+            problem += pulp.LpAffineExpression(zip(allocations, unit_costs)), "total_cost"
+            problem += pulp.lpSum(allocations) >= demand, "demand"
+
+            if warm_start:
+                self._set_initial_allocation(eligible, unit_costs, allocations, usage, demand)
+
+            solver = pulp.PULP_CBC_CMD(
+                msg=False,
+                timeLimit=self.time_limit,
+                gapRel=self.gap_tolerance,
+                maxNodes=self.max_nodes,
+                warmStart=warm_start
+            )
+
+            # CBC runs in a subprocess; keep the event loop free while it solves
+            start_time = time.perf_counter()
+            status = await asyncio.to_thread(problem.solve, solver)
+            solve_time = time.perf_counter() - start_time
+
+            if problem.sol_status not in (pulp.LpSolutionOptimal, pulp.LpSolutionIntegerFeasible):
+                raise CalculationError(
+                    f"Solver did not find a feasible allocation (status: {pulp.LpStatus[status]})"
+                )
+
+            optimal_allocation = {}
+            total_cost = 0
+            for supplier, variable, unit_cost in zip(eligible, allocations, unit_costs):
+                allocation = variable.value() or 0
+                if allocation > self.gap_tolerance:
+                    optimal_allocation[supplier.supplier_id] = allocation
+                    total_cost += allocation * unit_cost
+            total_allocated = sum(optimal_allocation.values())
+
+            # Calculate potential savings
+            current_cost = sum(
+                s.volume * (s.material_cost + s.transportation_cost)
+                for s in data
+            )
+
+            return OptimizationResult(
+                optimal_allocation=optimal_allocation,
+                total_cost=total_cost,
+                savings_potential=current_cost - total_cost,
+                optimal_suppliers=[
+                    {
+                        "supplier_id": s.supplier_id,
+                        "allocation": optimal_allocation.get(s.supplier_id, 0),
+                        "cost_efficiency": (s.material_cost + s.transportation_cost) / s.capacity
+                    }
+                    for s in sorted(
+                        data,
+                        key=lambda x: (x.material_cost + x.transportation_cost) / x.capacity
+                    )
+                ],
+                optimization_details={
+                    "demand": demand,
+                    "total_capacity_utilized": total_allocated,
+                    "number_of_suppliers": len(optimal_allocation),
+                    "average_cost_per_unit": total_cost / total_allocated if total_allocated > 0 else 0,
+                    "excluded_by_lead_time": len(data) - len(eligible)
+                },
+                solver_stats={
+                    "solver": "CBC",
+                    "status": pulp.LpStatus[status],
+                    "solution_status": pulp.LpSolution[problem.sol_status],
+                    "is_mip": is_mip,
+                    "warm_start": warm_start,
+                    "objective": pulp.value(problem.objective),
+                    "solve_time_seconds": solve_time,
+                    "num_variables": len(allocations) + len(usage),
+                    "num_constraints": len(problem.constraints),
+                    "time_limit_seconds": self.time_limit,
+                    "max_nodes": self.max_nodes,
+                    "gap_tolerance": self.gap_tolerance
+                }
+            )
+        except (ValidationError, CalculationError) as e:
+            raise e
+        except Exception as e:
+            raise CalculationError(f"Error optimizing sourcing: {str(e)}")
+
+    @timed_engine("OptimizationEngine")
+    async def optimize_sourcing_greedy(
+        self,
+        data: List[SupplierCostInput]
+    ) -> OptimizationResult:
+        """Original cost-efficiency greedy allocation, kept as a benchmark baseline."""
+        try:
+            self._validate_suppliers(data)
+            start_time = time.perf_counter()
+
+            # Simple optimization example
+            optimal_allocation = {}
+            total_cost = 0
+            current_capacity = 0
+
+            # Sort suppliers by cost efficiency
+            sorted_suppliers = sorted(
+                data,
+                key=lambda x: (x.material_cost + x.transportation_cost) / x.capacity
+            )
+
+            for supplier in sorted_suppliers:
+                if current_capacity < supplier.capacity:
+                    allocation = min(
+                        supplier.capacity - current_capacity,
+                        supplier.volume
+                    )
+                    optimal_allocation[supplier.supplier_id] = allocation
+                    total_cost += allocation * (
+                        supplier.material_cost +
+                        supplier.transportation_cost
+                    )
+                    current_capacity += allocation
+
+            # Calculate potential savings
+            current_cost = sum(
+                s.volume * (s.material_cost + s.transportation_cost)
+                for s in data
+            )
+            savings_potential = current_cost - total_cost
+
+            return OptimizationResult(
+                optimal_allocation=optimal_allocation,
+                total_cost=total_cost,
+                savings_potential=savings_potential,
+                optimal_suppliers=[
+                    {
+                        "supplier_id": s.supplier_id,
+                        "allocation": optimal_allocation.get(s.supplier_id, 0),
+                        "cost_efficiency": (s.material_cost + s.transportation_cost) / s.capacity
+                    }
+                    for s in sorted_suppliers
+                ],
+                optimization_details={
+                    "total_capacity_utilized": current_capacity,
+                    "number_of_suppliers": len(optimal_allocation),
+                    "average_cost_per_unit": total_cost / current_capacity if current_capacity > 0 else 0
+                },
+                solver_stats={
+                    "solver": "greedy",
+                    "solve_time_seconds": time.perf_counter() - start_time
+                }
+            )
+        except ValidationError as e:
+            raise e
+        except Exception as e:
+            raise CalculationError(f"Error optimizing sourcing: {str(e)}")
+
+    def _validate_suppliers(self, data: List[SupplierCostInput]) -> None:
+        if not data:
+            raise ValidationError("No supplier data provided")
+
+        # Validate each supplier's data
+        for supplier in data:
+            if supplier.volume <= 0:
+                raise ValidationError(f"Invalid volume for supplier {supplier.supplier_id}")
+            if supplier.capacity <= 0:
+                raise ValidationError(f"Invalid capacity for supplier {supplier.supplier_id}")
+            if supplier.min_order_quantity and supplier.min_order_quantity > supplier.capacity:
+                raise ValidationError(f"Minimum order quantity exceeds capacity for supplier {supplier.supplier_id}")
+
+    def _set_initial_allocation(
+        self,
+        suppliers: List[SupplierCostInput],
+        unit_costs: List[float],
+        allocations: List[pulp.LpVariable],
+        usage: Dict[int, pulp.LpVariable],
+        demand: float
+    ) -> None:
+        """Seed the solver with a cheapest-first fill of the demand."""
+        remaining = demand
+        for i in sorted(range(len(suppliers)), key=lambda i: unit_costs[i]):
+            supplier = suppliers[i]
+            allocation = 0
+            if remaining > 0:
+                allocation = min(supplier.capacity, remaining)
+                if supplier.min_order_quantity:
+                    allocation = max(allocation, supplier.min_order_quantity)
+            allocations[i].setInitialValue(allocation)
+            if i in usage:
+                usage[i].setInitialValue(1 if allocation > 0 else 0)
+            remaining -= allocation
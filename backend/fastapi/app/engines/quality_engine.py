@@ -1,6 +1,7 @@
 from typing import Dict, Any, List
 from ..schemas.quality import QualityInput, QualityAssessment
 from ..exceptions import ValidationError, CalculationError
+from ..services.metrics import timed_engine
 
 class QualityEngine:
     async def calculate(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -11,6 +12,7 @@ class QualityEngine:
         except Exception as e:
             raise CalculationError(f"Error in quality calculation: {str(e)}")
 
+    @timed_engine("QualityEngine")
     async def assess_quality(
         self,
         data: QualityInput
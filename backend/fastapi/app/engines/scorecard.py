@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, HTTPException
+from ..schemas.scorecard import SupplierScorecardInput, SupplierScorecard
+from ..services.calculation_service import CalculationService
+from ..dependencies import get_calculation_service
+
+router = APIRouter(
+    prefix="/scorecard",
+    tags=["scorecard"]
+)
+
+@router.get("/")
+async def root():
+    return {"message": "Supplier Scorecard Service"}
+
+@router.get("/health")
+async def health_check():
+    return {"status": "healthy"}
+
+@router.post("/calculate", response_model=SupplierScorecard)
+async def build_supplier_scorecard(
+    data: SupplierScorecardInput,
+    calc_service: CalculationService = Depends(get_calculation_service)
+):
+    try:
+        result = await calc_service.build_supplier_scorecard(data)
+        return result
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -5,7 +5,9 @@ from ..schemas.tradeoff import (
     TradeoffAnalysis,
     TradeoffOutput,
     TradeoffResponse,
-    OptimizationPreferences
+    OptimizationPreferences,
+    MultiSupplierTradeoffInput,
+    ParetoAnalysis
 )
 from ..services.calculation_service import CalculationService
 from ..dependencies import get_calculation_service
@@ -44,4 +46,15 @@ async def analyze_tradeoffs(
         return TradeoffResponse(
             success=False,
             error=str(e)
-        ) 
\ No newline at end of file
+        )
+
+@router.post("/pareto", response_model=ParetoAnalysis)
+async def analyze_pareto_frontier(
+    data: MultiSupplierTradeoffInput,
+    calc_service: CalculationService = Depends(get_calculation_service)
+):
+    try:
+        result = await calc_service.analyze_pareto_frontier(data)
+        return result
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -1,6 +1,17 @@
+from bisect import bisect_left
 from typing import Dict, Any, List
-from ..schemas.tradeoff import TradeoffInput, TradeoffAnalysis, OptimizationPreferences
+import numpy as np
+from ..schemas.tradeoff import (
+    TradeoffInput,
+    TradeoffAnalysis,
+    OptimizationPreferences,
+    MultiSupplierTradeoffInput,
+    ParetoAnalysis,
+    WeightVector,
+    WeightedRanking
+)
 from ..exceptions import ValidationError, CalculationError
+from ..services.metrics import timed_engine
 
 class TradeoffEngine:
     async def calculate(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -12,6 +23,7 @@ class TradeoffEngine:
         except Exception as e:
             raise CalculationError(f"Error in tradeoff calculation: {str(e)}")
 
+    @timed_engine("TradeoffEngine")
     async def analyze_tradeoffs(
         self,
         data: TradeoffInput,
@@ -77,6 +89,111 @@ class TradeoffEngine:
         except Exception as e:
             raise CalculationError(f"Error analyzing tradeoffs: {str(e)}")
 
+    @timed_engine("TradeoffEngine")
+    async def analyze_pareto_frontier(
+        self,
+        data: MultiSupplierTradeoffInput
+    ) -> ParetoAnalysis:
+        """
+        Find the suppliers that are not dominated on economic, quality and
+        environmental score, and rank every supplier under each weight vector.
+        """
+        try:
+            if not data.supplier_id:
+                raise ValidationError("No supplier scores provided")
+
+            scores = np.column_stack([
+                np.asarray(data.economic_score, dtype=np.float64),
+                np.asarray(data.quality_score, dtype=np.float64),
+                np.asarray(data.environmental_score, dtype=np.float64)
+            ])
+            if not np.all((scores >= 0) & (scores <= 100)):
+                raise ValidationError("Scores must be between 0 and 100")
+
+            weight_vectors = data.weights or self._generate_weight_sweep(data.sweep_resolution)
+            weights = np.array([
+                [w.economic_weight, w.quality_weight, w.environmental_weight]
+                for w in weight_vectors
+            ])
+            if not np.all((weights.sum(axis=1) >= 0.99) & (weights.sum(axis=1) <= 1.01)):
+                raise ValidationError("Weights must sum to 1")
+
+            frontier = self._pareto_frontier(scores)
+
+            # One matrix product scores every supplier under every weight vector
+            weighted = scores @ weights.T / weights.sum(axis=1)
+            top_k = min(data.top_k or len(scores), len(scores))
+            order = np.argsort(-weighted, axis=0, kind="stable")[:top_k]
+
+            rankings = []
+            for column, weight_vector in enumerate(weight_vectors):
+                ranked = order[:, column]
+                rankings.append(WeightedRanking(
+                    weights=weight_vector,
+                    supplier_ids=[data.supplier_id[i] for i in ranked.tolist()],
+                    scores=weighted[ranked, column].tolist()
+                ))
+
+            return ParetoAnalysis(
+                pareto_frontier=[data.supplier_id[i] for i in frontier],
+                frontier_indices=frontier,
+                rankings=rankings,
+                total_suppliers=len(scores)
+            )
+        except ValidationError as e:
+            raise e
+        except Exception as e:
+            raise CalculationError(f"Error analyzing Pareto frontier: {str(e)}")
+
+    def _pareto_frontier(self, scores: np.ndarray) -> List[int]:
+        """
+        Skyline of an (N, 3) score matrix where higher is better on every axis.
+
+        Distinct points are swept in descending economic order while a 2D
+        staircase of the best (quality, environmental) pairs seen so far is
+        kept sorted by quality, so each dominance test is a binary search.
+        Identical score triples share the same outcome.
+        """
+        unique_points, inverse = np.unique(scores, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        order = np.lexsort((-unique_points[:, 2], -unique_points[:, 1], -unique_points[:, 0]))
+
+        # Staircase: quality ascending, environmental strictly descending
+        stair_quality: List[float] = []
+        stair_environmental: List[float] = []
+        on_frontier = np.zeros(len(unique_points), dtype=bool)
+
+        for point in order.tolist():
+            _, quality, environmental = unique_points[point].tolist()
+            position = bisect_left(stair_quality, quality)
+            if position < len(stair_quality) and stair_environmental[position] >= environmental:
+                continue  # An earlier point is at least as good on every axis
+
+            on_frontier[point] = True
+            # Drop staircase entries the new point now covers
+            end = position
+            if end < len(stair_quality) and stair_quality[end] == quality:
+                end += 1
+            start = position
+            while start > 0 and stair_environmental[start - 1] <= environmental:
+                start -= 1
+            stair_quality[start:end] = [quality]
+            stair_environmental[start:end] = [environmental]
+
+        return np.flatnonzero(on_frontier[inverse]).tolist()
+
+    def _generate_weight_sweep(self, resolution: int) -> List[WeightVector]:
+        """Every weight vector on a simplex grid with the given number of steps."""
+        return [
+            WeightVector(
+                economic_weight=economic / resolution,
+                quality_weight=quality / resolution,
+                environmental_weight=(resolution - economic - quality) / resolution
+            )
+            for economic in range(resolution + 1)
+            for quality in range(resolution - economic + 1)
+        ]
+
     def _calculate_risk_assessment(
         self,
         historical_performance: Dict[str, float],
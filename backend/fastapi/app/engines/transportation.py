@@ -3,7 +3,9 @@ from typing import Dict, Any
 from ..schemas.transportation import (
     TransportationInput,
     TransportationAssessment,
-    TransportationResponse
+    TransportationResponse,
+    TransportationBatchInput,
+    TransportationBatchOutput
 )
 from ..services.calculation_service import CalculationService
 from ..dependencies import get_calculation_service
@@ -38,6 +40,17 @@ async def calculate_transportation_emissions(
             error=str(e)
         )
 
+@router.post("/calculate/batch", response_model=TransportationBatchOutput)
+async def calculate_transportation_emissions_batch(
+    data: TransportationBatchInput,
+    calc_service: CalculationService = Depends(get_calculation_service)
+):
+    try:
+        result = await calc_service.calculate_transportation_emissions_batch(data)
+        return result
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.post("/optimize")
 async def optimize_transportation(
     data: Dict[str, Any],
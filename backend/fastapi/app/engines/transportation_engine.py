@@ -1,44 +1,67 @@
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Sequence
+import numpy as np
 from ..schemas.transportation import (
     TransportationInput,
     TransportationAssessment,
+    TransportationBatchInput,
+    TransportationBatchOutput,
     TransportationEmissionFactors,
     TransportMode,
     VehicleType,
     FuelType
 )
 from ..exceptions import ValidationError, CalculationError
+from ..services.metrics import timed_engine
+
+# Emission factors are immutable and shared by every engine instance
+EMISSION_FACTORS = MappingProxyType({
+    "base_factors": MappingProxyType({
+        TransportMode.TRUCK: 0.15,  # kg CO2e per km per ton
+        TransportMode.TRAIN: 0.03,
+        TransportMode.SHIP: 0.02,
+        TransportMode.PLANE: 0.25
+    }),
+    "vehicle_factors": MappingProxyType({
+        VehicleType.SMALL_TRUCK: 1.0,
+        VehicleType.MEDIUM_TRUCK: 1.5,
+        VehicleType.LARGE_TRUCK: 2.0,
+        VehicleType.ELECTRIC_VEHICLE: 0.3,
+        VehicleType.HYBRID_VEHICLE: 0.6
+    }),
+    "fuel_factors": MappingProxyType({
+        FuelType.DIESEL: 1.0,
+        FuelType.PETROL: 1.1,
+        FuelType.ELECTRIC: 0.2,
+        FuelType.HYBRID: 0.5,
+        FuelType.BIODIESEL: 0.7,
+        FuelType.CNG: 0.8
+    })
+})
+
+def _code_table(members: Sequence) -> Dict[Any, int]:
+    """Map enum members to integer codes; None gets the trailing "missing" code."""
+    codes = {member: code for code, member in enumerate(members)}
+    codes[None] = len(members)
+    return MappingProxyType(codes)
+
+def _factor_array(factors: Dict[Any, float], members: Sequence) -> np.ndarray:
+    """Build a read-only lookup array indexed by enum code, NaN for missing."""
+    array = np.array([factors[member] for member in members] + [np.nan])
+    array.flags.writeable = False
+    return array
+
+# Integer codes and NumPy lookup arrays used by the batch calculation
+MODE_CODES = _code_table(list(TransportMode))
+VEHICLE_CODES = _code_table(list(VehicleType))
+FUEL_CODES = _code_table(list(FuelType))
+BASE_FACTOR_ARRAY = _factor_array(EMISSION_FACTORS["base_factors"], list(TransportMode))
+VEHICLE_FACTOR_ARRAY = _factor_array(EMISSION_FACTORS["vehicle_factors"], list(VehicleType))
+FUEL_FACTOR_ARRAY = _factor_array(EMISSION_FACTORS["fuel_factors"], list(FuelType))
 
 class TransportationEngine:
     def __init__(self):
-        # Initialize emission factors database
-        self.emission_factors = self._initialize_emission_factors()
-
-    def _initialize_emission_factors(self) -> Dict[str, Dict[str, float]]:
-        """Initialize the database of emission factors for different transport modes and vehicles."""
-        return {
-            "base_factors": {
-                TransportMode.TRUCK: 0.15,  # kg CO2e per km per ton
-                TransportMode.TRAIN: 0.03,
-                TransportMode.SHIP: 0.02,
-                TransportMode.PLANE: 0.25
-            },
-            "vehicle_factors": {
-                VehicleType.SMALL_TRUCK: 1.0,
-                VehicleType.MEDIUM_TRUCK: 1.5,
-                VehicleType.LARGE_TRUCK: 2.0,
-                VehicleType.ELECTRIC_VEHICLE: 0.3,
-                VehicleType.HYBRID_VEHICLE: 0.6
-            },
-            "fuel_factors": {
-                FuelType.DIESEL: 1.0,
-                FuelType.PETROL: 1.1,
-                FuelType.ELECTRIC: 0.2,
-                FuelType.HYBRID: 0.5,
-                FuelType.BIODIESEL: 0.7,
-                FuelType.CNG: 0.8
-            }
-        }
+        self.emission_factors = EMISSION_FACTORS
 
     async def calculate(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate transportation emissions based on input data."""
@@ -48,6 +71,7 @@ class TransportationEngine:
         except Exception as e:
             raise CalculationError(f"Error in transportation calculation: {str(e)}")
 
+    @timed_engine("TransportationEngine")
     async def calculate_transportation_emissions(
         self,
         data: TransportationInput
@@ -129,6 +153,90 @@ class TransportationEngine:
         except Exception as e:
             raise CalculationError(f"Error calculating transportation emissions: {str(e)}")
 
+    @timed_engine("TransportationEngine")
+    async def calculate_transportation_emissions_batch(
+        self,
+        data: TransportationBatchInput
+    ) -> TransportationBatchOutput:
+        """
+        Calculate emissions for a columnar batch of shipment legs in one pass.
+
+        Enum columns are mapped to integer codes and the factors are gathered
+        from the precomputed lookup arrays. Legs that fail validation are
+        flagged in the ``valid`` mask, and their metrics are returned as null.
+        """
+        try:
+            total_rows = len(data.supplier_id)
+            if total_rows == 0:
+                raise ValidationError("No shipment data provided")
+
+            distance = np.asarray(data.distance, dtype=np.float64)
+            volume = np.asarray(data.volume, dtype=np.float64)
+            load_factor = np.asarray(data.load_factor, dtype=np.float64)
+            return_trip = (
+                np.asarray(data.return_trip, dtype=bool)
+                if data.return_trip is not None
+                else np.zeros(total_rows, dtype=bool)
+            )
+            mode_codes = self._encode(data.transport_mode, MODE_CODES)
+            vehicle_codes = self._encode(data.vehicle_type, VEHICLE_CODES)
+            fuel_codes = self._encode(data.fuel_type, FUEL_CODES)
+
+            is_truck = mode_codes == MODE_CODES[TransportMode.TRUCK]
+            checks = [
+                (distance > 0, "Distance must be greater than zero"),
+                (volume > 0, "Volume must be greater than zero"),
+                ((load_factor > 0) & (load_factor <= 1), "Load factor must be between 0 and 1"),
+                (~is_truck | (vehicle_codes != VEHICLE_CODES[None]), "Vehicle type is required for road transport"),
+                (~is_truck | (fuel_codes != FUEL_CODES[None]), "Fuel type is required for road transport"),
+            ]
+            valid = np.logical_and.reduce([mask for mask, _ in checks])
+
+            errors = [[] for _ in range(total_rows)]
+            for mask, message in checks:
+                for index in np.flatnonzero(~mask).tolist():
+                    errors[index].append(message)
+
+            # Vehicle and fuel multipliers only apply to road transport
+            vehicle_multiplier = np.where(is_truck, VEHICLE_FACTOR_ARRAY[vehicle_codes], 1.0)
+            fuel_multiplier = np.where(is_truck, FUEL_FACTOR_ARRAY[fuel_codes], 1.0)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                base_emissions = distance * BASE_FACTOR_ARRAY[mode_codes] * volume
+                adjusted_emissions = base_emissions * vehicle_multiplier * fuel_multiplier
+                load_factor_impact = 1 + (1 - load_factor) * 0.2  # 20% penalty for empty space
+                total_emissions = adjusted_emissions * load_factor_impact
+                total_emissions = np.where(return_trip, total_emissions * 2, total_emissions)
+
+                emissions_per_km = total_emissions / distance
+                emissions_per_volume = total_emissions / volume
+                efficiency_score = (
+                    np.maximum(0, 100 * (1 - emissions_per_km / 2)) * 0.4 +
+                    np.maximum(0, 100 * (1 - emissions_per_volume / 5)) * 0.4 +
+                    load_factor * 100 * 0.2
+                )
+
+            return TransportationBatchOutput(
+                total_emissions=self._masked_list(total_emissions, valid),
+                emissions_per_km=self._masked_list(emissions_per_km, valid),
+                emissions_per_volume=self._masked_list(emissions_per_volume, valid),
+                transport_efficiency_score=self._masked_list(efficiency_score, valid),
+                valid=valid.tolist(),
+                errors=errors,
+                total_rows=total_rows,
+                processed_rows=int(valid.sum())
+            )
+        except ValidationError as e:
+            raise e
+        except Exception as e:
+            raise CalculationError(f"Error calculating transportation emissions batch: {str(e)}")
+
+    def _encode(self, values: List[Optional[Any]], codes: Dict[Any, int]) -> np.ndarray:
+        return np.fromiter((codes[value] for value in values), dtype=np.intp, count=len(values))
+
+    def _masked_list(self, values: np.ndarray, valid: np.ndarray) -> List[Optional[float]]:
+        return [value if ok else None for value, ok in zip(values.tolist(), valid.tolist())]
+
     def _calculate_efficiency_score(
         self,
         emissions_per_km: float,
@@ -20,4 +20,10 @@ class ServiceError(Exception):
     """Exception raised for errors in service operations."""
     def __init__(self, message: str):
         self.message = message
-        super().__init__(self.message) 
\ No newline at end of file
+        super().__init__(self.message)
+
+class NotFoundError(Exception):
+    """Exception raised when a requested record does not exist."""
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
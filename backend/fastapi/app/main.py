@@ -1,19 +1,35 @@
 # app/main.py
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from .config import settings
 from .middleware.logging import LoggingMiddleware
 from .middleware.auth import AuthMiddleware
-from .exceptions import CalculationError, ValidationError, ConfigurationError, ServiceError
-from .engines import economic, quality, environmental, tradeoff
+from .middleware.metrics import MetricsMiddleware
+from .services.metrics import REGISTRY
+from .services.database import dispose_engine
+from .exceptions import CalculationError, ValidationError, ConfigurationError, ServiceError, NotFoundError
+from .dependencies import get_calculation_service
+from .engines import economic, quality, environmental, tradeoff, scorecard, transportation
 from .routers import suppliers, orders
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the shared calculation service once and warm it before serving traffic
+    app.state.ready = False
+    await get_calculation_service().warm_up()
+    app.state.ready = True
+    yield
+    app.state.ready = False
+    await dispose_engine()
+
 app = FastAPI(
     title="Supplier Management API",
     description="API for supplier management and analytics",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Middleware
@@ -26,10 +42,17 @@ app.add_middleware(
 )
 app.add_middleware(LoggingMiddleware)
 app.add_middleware(AuthMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 # Include routers
 app.include_router(suppliers.router)
 app.include_router(orders.router)
+app.include_router(economic.router, prefix=settings.API_V1_STR)
+app.include_router(quality.router, prefix=settings.API_V1_STR)
+app.include_router(environmental.router, prefix=settings.API_V1_STR)
+app.include_router(tradeoff.router, prefix=settings.API_V1_STR)
+app.include_router(scorecard.router, prefix=settings.API_V1_STR)
+app.include_router(transportation.router, prefix=settings.API_V1_STR)
 
 # Exception handlers
 @app.exception_handler(CalculationError)
@@ -54,6 +77,17 @@ async def validation_error_handler(request: Request, exc: ValidationError):
         }
     )
 
+@app.exception_handler(NotFoundError)
+async def not_found_error_handler(request: Request, exc: NotFoundError):
+    return JSONResponse(
+        status_code=404,
+        content={
+            "error": "Not Found",
+            "message": str(exc),
+            "detail": "The requested record does not exist"
+        }
+    )
+
 @app.exception_handler(ConfigurationError)
 async def configuration_error_handler(request: Request, exc: ConfigurationError):
     return JSONResponse(
@@ -78,4 +112,25 @@ async def service_error_handler(request: Request, exc: ServiceError):
 
 @app.get("/")
 async def root():
-    return {"message": "Welcome to the Supplier Management API"}
\ No newline at end of file
+    return {"message": "Welcome to the Supplier Management API"}
+
+@app.get("/health")
+async def health_check():
+    return {"status": "healthy"}
+
+@app.get("/health/ready")
+async def readiness_check():
+    if not getattr(app.state, "ready", False):
+        return JSONResponse(status_code=503, content={"status": "warming_up"})
+    return {"status": "ready"}
+
+@app.get("/health/cache")
+async def cache_stats():
+    cache = get_calculation_service().cache
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.snapshot()}
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
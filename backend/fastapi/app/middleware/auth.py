@@ -1,20 +1,30 @@
-from fastapi import Request, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
+import hmac
+from typing import Optional
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 from ..config import settings
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        # Skip auth for docs and health check
-        if request.url.path in ["/docs", "/redoc", "/openapi.json", "/health"]:
-            return await call_next(request)
-            
+# Docs, health and metrics are reachable without a key
+SKIP_PATHS = frozenset(["/docs", "/redoc", "/openapi.json", "/health", "/health/ready", "/metrics"])
+
+class AuthMiddleware:
+    def __init__(self, app: ASGIApp, api_key: Optional[str] = None):
+        self.app = app
+        self.api_key = (api_key or settings.API_KEY).encode()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] in SKIP_PATHS:
+            return await self.app(scope, receive, send)
+
         # Get API key from header
-        api_key = request.headers.get("X-API-Key")
-        
+        api_key = Headers(scope=scope).get("x-api-key")
+
         if not api_key:
-            raise HTTPException(status_code=401, detail="API key is missing")
-            
-        if api_key != settings.API_KEY:
-            raise HTTPException(status_code=401, detail="Invalid API key")
-            
-        return await call_next(request) 
\ No newline at end of file
+            response = JSONResponse({"detail": "API key is missing"}, status_code=401)
+        elif not hmac.compare_digest(api_key.encode(), self.api_key):
+            response = JSONResponse({"detail": "Invalid API key"}, status_code=401)
+        else:
+            return await self.app(scope, receive, send)
+
+        await response(scope, receive, send)
@@ -0,0 +1,32 @@
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from ..services.metrics import HTTP_REQUESTS, HTTP_LATENCY, HTTP_IN_PROGRESS
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        method = scope["method"]
+        HTTP_IN_PROGRESS.inc(method)
+        start_time = time.perf_counter_ns()
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Label by route template, not raw path, to keep cardinality bounded
+            route = scope.get("route")
+            route_path = getattr(route, "path", "<unmatched>")
+            HTTP_REQUESTS.inc(method, route_path, str(status_code))
+            HTTP_LATENCY.observe((time.perf_counter_ns() - start_time) / 1e9, method, route_path)
+            HTTP_IN_PROGRESS.dec(method)
@@ -1,7 +1,9 @@
 from fastapi import APIRouter, HTTPException
-from typing import Dict, Any, List
-from pydantic import BaseModel
+from typing import Dict, Any, List, Optional, Tuple
+from pydantic import BaseModel, Field, ValidationError
 from datetime import datetime
+import numpy as np
+from ..config import settings
 
 router = APIRouter(prefix="/api/orders", tags=["orders"])
 
@@ -17,39 +19,111 @@ class OrderCalculationResponse(BaseModel):
     risk_score: float
     recommended_actions: List[str]
 
+class OrderBatchResult(BaseModel):
+    index: int = Field(..., description="Order position in the input batch")
+    result: Optional[OrderCalculationResponse] = Field(None, description="Metrics, when the order is valid")
+    errors: List[str] = Field(default_factory=list, description="Validation errors for a rejected order")
+
+# Per-currency-unit impact factors applied to the order total
+IMPACT_FACTORS = {
+    "carbon_emissions": 0.01,
+    "water_usage": 0.005,
+    "waste_generated": 0.002
+}
+
+def _item_values(requests: List[OrderCalculationRequest], key: str) -> np.ndarray:
+    # Django serializes DecimalFields as strings, so coerce through float()
+    return np.fromiter(
+        (float(item.get(key) or 0) for request in requests for item in request.items),
+        dtype=np.float64
+    )
+
+def _calculate_orders(requests: List[OrderCalculationRequest]) -> List[OrderCalculationResponse]:
+    """
+    Calculate metrics for many orders in one vectorized pass. Every item of
+    every order is flattened into one array and summed back per order.
+    """
+    order_index = np.repeat(np.arange(len(requests)), [len(request.items) for request in requests])
+    line_totals = _item_values(requests, "quantity") * _item_values(requests, "unit_price")
+    total_amount = np.bincount(order_index, weights=line_totals, minlength=len(requests))
+
+    environmental_impact = {name: total_amount * factor for name, factor in IMPACT_FACTORS.items()}
+
+    # Risk score is a placeholder until it is based on supplier history, order size, etc.
+    risk_score = 0.5
+
+    # Generate recommendations
+    split_order = total_amount > 10000
+    alternative_transport = environmental_impact["carbon_emissions"] > 100
+
+    return [
+        OrderCalculationResponse(
+            total_amount=total_amount[index],
+            estimated_delivery_time=5,  # Example: 5 days
+            environmental_impact={name: values[index] for name, values in environmental_impact.items()},
+            risk_score=risk_score,
+            recommended_actions=[
+                action for action, flagged in (
+                    ("Consider splitting order into smaller batches", split_order[index]),
+                    ("Consider alternative transportation methods", alternative_transport[index])
+                ) if flagged
+            ]
+        )
+        for index in range(len(requests))
+    ]
+
+def _parse_order(payload: Any) -> Tuple[Optional[OrderCalculationRequest], List[str]]:
+    """Validate one batch entry on its own, including the numeric item fields."""
+    try:
+        request = OrderCalculationRequest.model_validate(payload)
+    except ValidationError as e:
+        return None, [
+            f"{'.'.join(str(part) for part in error['loc']) or 'order'}: {error['msg']}"
+            for error in e.errors()
+        ]
+    errors = []
+    for position, item in enumerate(request.items):
+        for key in ("quantity", "unit_price"):
+            try:
+                float(item.get(key) or 0)
+            except (TypeError, ValueError):
+                errors.append(f"items.{position}.{key}: must be a number")
+    return (None, errors) if errors else (request, [])
+
 @router.post("/calculate")
 async def calculate_order_metrics(request: OrderCalculationRequest) -> OrderCalculationResponse:
     """
     Calculate various metrics for an order
     """
     try:
-        # Example calculation logic
-        total_amount = sum(item.get('quantity', 0) * item.get('unit_price', 0) 
-                         for item in request.items)
-        
-        # Calculate environmental impact
-        environmental_impact = {
-            "carbon_emissions": total_amount * 0.01,  # Example calculation
-            "water_usage": total_amount * 0.005,
-            "waste_generated": total_amount * 0.002
-        }
-        
-        # Calculate risk score (example)
-        risk_score = 0.5  # This would be based on supplier history, order size, etc.
-        
-        # Generate recommendations
-        recommended_actions = []
-        if total_amount > 10000:
-            recommended_actions.append("Consider splitting order into smaller batches")
-        if environmental_impact["carbon_emissions"] > 100:
-            recommended_actions.append("Consider alternative transportation methods")
-        
-        return OrderCalculationResponse(
-            total_amount=total_amount,
-            estimated_delivery_time=5,  # Example: 5 days
-            environmental_impact=environmental_impact,
-            risk_score=risk_score,
-            recommended_actions=recommended_actions
-        )
+        return _calculate_orders([request])[0]
     except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/calculate/batch")
+async def calculate_order_metrics_batch(payloads: List[Any]) -> List[OrderBatchResult]:
+    """
+    Calculate metrics for a list of orders; results are returned in request order.
+    Each order is validated on its own, so an invalid one is reported in its
+    own entry and does not fail the others.
+    """
+    if not payloads:
+        raise HTTPException(status_code=400, detail="No orders provided")
+    if len(payloads) > settings.MAX_ORDER_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.MAX_ORDER_BATCH_SIZE} orders per batch"
+        )
+
+    entries, valid = [], []
+    for index, payload in enumerate(payloads):
+        request, errors = _parse_order(payload)
+        entries.append(OrderBatchResult(index=index, errors=errors))
+        if request is not None:
+            valid.append((index, request))
+
+    if valid:
+        results = _calculate_orders([request for _, request in valid])
+        for (index, _), result in zip(valid, results):
+            entries[index].result = result
+    return entries
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from typing import Dict, Any, List
 from pydantic import BaseModel
 from datetime import datetime
+from ..dependencies import get_supplier_analytics_service
+from ..schemas.suppliers import SupplierAnalyticsResponse, EnvironmentalImpactResponse
+from ..services.supplier_analytics import SupplierAnalyticsService
 
 router = APIRouter(prefix="/api/suppliers", tags=["suppliers"])
 
@@ -10,19 +13,6 @@ class OrderCalculationRequest(BaseModel):
     supplier_id: int
     expected_delivery_date: datetime
 
-class SupplierAnalyticsResponse(BaseModel):
-    total_orders: int
-    average_order_value: float
-    on_time_delivery_rate: float
-    environmental_score: float
-    sustainability_metrics: Dict[str, Any]
-
-class EnvironmentalImpactResponse(BaseModel):
-    carbon_footprint: float
-    renewable_energy_usage: float
-    waste_management_score: float
-    sustainability_goals_progress: Dict[str, float]
-
 @router.post("/calculate-sustainability")
 async def calculate_sustainability_score(supplier_data: Dict[str, Any]) -> Dict[str, float]:
     """
@@ -58,42 +48,21 @@ async def calculate_sustainability_score(supplier_data: Dict[str, Any]) -> Dict[
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/{supplier_id}/analytics")
-async def get_supplier_analytics(supplier_id: int) -> SupplierAnalyticsResponse:
+async def get_supplier_analytics(
+    supplier_id: int,
+    service: SupplierAnalyticsService = Depends(get_supplier_analytics_service)
+) -> SupplierAnalyticsResponse:
     """
     Get comprehensive analytics for a supplier
     """
-    try:
-        # Example analytics calculation
-        return SupplierAnalyticsResponse(
-            total_orders=100,  # This would be calculated from actual data
-            average_order_value=1500.0,
-            on_time_delivery_rate=0.95,
-            environmental_score=0.85,
-            sustainability_metrics={
-                "carbon_reduction": 0.15,
-                "renewable_energy_increase": 0.25,
-                "waste_reduction": 0.30
-            }
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return await service.get_supplier_analytics(supplier_id)
 
 @router.get("/{supplier_id}/environmental-impact")
-async def get_environmental_impact(supplier_id: int) -> EnvironmentalImpactResponse:
+async def get_environmental_impact(
+    supplier_id: int,
+    service: SupplierAnalyticsService = Depends(get_supplier_analytics_service)
+) -> EnvironmentalImpactResponse:
     """
     Get detailed environmental impact analysis
     """
-    try:
-        # Example environmental impact calculation
-        return EnvironmentalImpactResponse(
-            carbon_footprint=150.5,
-            renewable_energy_usage=75.0,
-            waste_management_score=0.85,
-            sustainability_goals_progress={
-                "carbon_neutrality": 0.75,
-                "zero_waste": 0.60,
-                "renewable_energy": 0.80
-            }
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e)) 
\ No newline at end of file
+    return await service.get_environmental_impact(supplier_id)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import List, Optional, Dict, Any
 
 class SupplierCostInput(BaseModel):
@@ -11,6 +11,7 @@ class SupplierCostInput(BaseModel):
     overhead_cost: float = Field(..., gt=0, description="Overhead costs")
     volume: float = Field(..., gt=0, description="Order volume")
     lead_time: int = Field(..., gt=0, description="Lead time in days")
+    min_order_quantity: Optional[float] = Field(None, ge=0, description="Minimum quantity to allocate if the supplier is used")
     
 class EconomicScoreOutput(BaseModel):
     supplier_id: int = Field(..., description="Unique identifier for the supplier")
@@ -26,4 +27,44 @@ class OptimizationResult(BaseModel):
     total_cost: float = Field(..., description="Total optimized cost")
     savings_potential: float = Field(..., description="Potential cost savings")
     optimal_suppliers: List[Dict[str, Any]] = Field(..., description="List of optimal suppliers")
-    optimization_details: Dict[str, Any] = Field(..., description="Detailed optimization results") 
\ No newline at end of file
+    optimization_details: Dict[str, Any] = Field(..., description="Detailed optimization results")
+    solver_stats: Optional[Dict[str, Any]] = Field(None, description="Solver statistics for benchmarking")
+
+class SupplierCostBatchInput(BaseModel):
+    supplier_id: List[int] = Field(..., description="Supplier identifiers, one per row")
+    material_cost: List[float] = Field(..., description="Cost of raw materials per row")
+    transportation_cost: List[float] = Field(..., description="Transportation and logistics costs per row")
+    tax_rate: List[float] = Field(..., description="Tax rate as a decimal per row")
+    capacity: List[float] = Field(..., description="Supplier capacity per row")
+    labor_cost: List[float] = Field(..., description="Cost of labor per row")
+    overhead_cost: List[float] = Field(..., description="Overhead costs per row")
+    volume: List[float] = Field(..., description="Order volume per row")
+    lead_time: List[int] = Field(..., description="Lead time in days per row")
+
+    @model_validator(mode="after")
+    def check_column_lengths(self):
+        lengths = {name: len(getattr(self, name)) for name in type(self).model_fields}
+        if len(set(lengths.values())) > 1:
+            raise ValueError(f"All columns must have the same length, got {lengths}")
+        return self
+
+class EconomicBatchRow(BaseModel):
+    index: int = Field(..., description="Row position in the input batch")
+    supplier_id: int = Field(..., description="Unique identifier for the supplier")
+    score: float = Field(..., description="Economic performance score")
+    total_cost: float = Field(..., description="Total cost of the supply chain")
+    tax: float = Field(..., description="Tax amount on the total cost")
+    cost_per_unit: float = Field(..., description="Cost per unit")
+    roi: float = Field(..., description="Return on investment")
+    recommendations: List[str] = Field(..., description="Cost optimization recommendations")
+
+class BatchRowError(BaseModel):
+    index: int = Field(..., description="Row position in the input batch")
+    supplier_id: Optional[int] = Field(None, description="Supplier identifier of the failing row")
+    errors: List[str] = Field(..., description="Validation errors for the row")
+
+class EconomicBatchOutput(BaseModel):
+    results: List[EconomicBatchRow] = Field(..., description="Scores for every valid row")
+    errors: List[BatchRowError] = Field(..., description="Validation errors for rejected rows")
+    total_rows: int = Field(..., description="Number of rows received")
+    processed_rows: int = Field(..., description="Number of rows scored")
@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any
+from .economic import SupplierCostInput, EconomicScoreOutput
+from .quality import QualityInput, QualityAssessment
+from .environmental import EnvironmentalInput, EnvironmentalAssessment
+from .transportation import TransportationInput, TransportationAssessment
+from .tradeoff import TradeoffAnalysis, OptimizationPreferences
+
+class SupplierScorecardInput(BaseModel):
+    supplier_id: str = Field(..., description="Unique identifier for the supplier")
+    economic: SupplierCostInput = Field(..., description="Cost inputs for the economic engine")
+    quality: QualityInput = Field(..., description="Inputs for the quality engine")
+    environmental: EnvironmentalInput = Field(..., description="Inputs for the environmental engine")
+    transportation: Optional[TransportationInput] = Field(None, description="Inputs for the transportation engine")
+    historical_performance: Dict[str, float] = Field(..., description="Historical performance metrics")
+    risk_factors: Dict[str, float] = Field(..., description="Risk factors and their scores")
+    preferences: OptimizationPreferences = Field(..., description="Tradeoff weighting preferences")
+
+class SupplierScorecard(BaseModel):
+    supplier_id: str = Field(..., description="Unique identifier for the supplier")
+    economic: EconomicScoreOutput = Field(..., description="Economic engine results")
+    quality: QualityAssessment = Field(..., description="Quality engine results")
+    environmental: EnvironmentalAssessment = Field(..., description="Environmental engine results")
+    transportation: Optional[TransportationAssessment] = Field(None, description="Transportation engine results")
+    tradeoff: TradeoffAnalysis = Field(..., description="Tradeoff analysis over the engine scores")
+    timings_ms: Dict[str, float] = Field(..., description="Wall-clock time per engine and end to end, in milliseconds")
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from typing import Dict, Any
+
+class SupplierAnalyticsResponse(BaseModel):
+    total_orders: int
+    average_order_value: float
+    on_time_delivery_rate: float
+    environmental_score: float
+    sustainability_metrics: Dict[str, Any]
+
+class EnvironmentalImpactResponse(BaseModel):
+    carbon_footprint: float  # metric tons CO2e: declared footprint plus last 12 months of transport
+    renewable_energy_usage: float
+    waste_management_score: float
+    sustainability_goals_progress: Dict[str, float]
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import List, Optional, Dict, Any
 
 class TradeoffInput(BaseModel):
@@ -33,4 +33,37 @@ class TradeoffOutput(BaseModel):
 class TradeoffResponse(BaseModel):
     success: bool = Field(..., description="Whether the calculation was successful")
     data: Optional[TradeoffOutput] = Field(None, description="Tradeoff calculation results")
-    error: Optional[str] = Field(None, description="Error message if calculation failed") 
\ No newline at end of file
+    error: Optional[str] = Field(None, description="Error message if calculation failed")
+
+class WeightVector(BaseModel):
+    economic_weight: float = Field(..., ge=0, le=1, description="Weight for economic factors")
+    quality_weight: float = Field(..., ge=0, le=1, description="Weight for quality factors")
+    environmental_weight: float = Field(..., ge=0, le=1, description="Weight for environmental factors")
+
+class MultiSupplierTradeoffInput(BaseModel):
+    supplier_id: List[str] = Field(..., description="Supplier identifiers, one per row")
+    economic_score: List[float] = Field(..., description="Economic performance score per supplier")
+    quality_score: List[float] = Field(..., description="Quality performance score per supplier")
+    environmental_score: List[float] = Field(..., description="Environmental performance score per supplier")
+    weights: Optional[List[WeightVector]] = Field(None, description="Weight vectors to rank under; a simplex grid is generated when omitted")
+    sweep_resolution: int = Field(10, ge=1, le=100, description="Grid steps per dimension for the generated weight sweep")
+    top_k: Optional[int] = Field(None, gt=0, description="Number of suppliers to return per ranking (all when omitted)")
+
+    @model_validator(mode="after")
+    def check_column_lengths(self):
+        columns = ("supplier_id", "economic_score", "quality_score", "environmental_score")
+        lengths = {name: len(getattr(self, name)) for name in columns}
+        if len(set(lengths.values())) > 1:
+            raise ValueError(f"All columns must have the same length, got {lengths}")
+        return self
+
+class WeightedRanking(BaseModel):
+    weights: WeightVector = Field(..., description="Weight vector used for this ranking")
+    supplier_ids: List[str] = Field(..., description="Suppliers ordered from best to worst")
+    scores: List[float] = Field(..., description="Weighted score for each ranked supplier")
+
+class ParetoAnalysis(BaseModel):
+    pareto_frontier: List[str] = Field(..., description="Suppliers not dominated on all three scores")
+    frontier_indices: List[int] = Field(..., description="Row positions of the frontier suppliers")
+    rankings: List[WeightedRanking] = Field(..., description="Weighted ranking for each weight vector")
+    total_suppliers: int = Field(..., description="Number of suppliers analysed")
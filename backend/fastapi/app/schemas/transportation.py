@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
@@ -51,4 +51,35 @@ class TransportationAssessment(BaseModel):
 class TransportationResponse(BaseModel):
     success: bool = Field(..., description="Whether the calculation was successful")
     data: Optional[TransportationAssessment] = Field(None, description="Transportation assessment results")
-    error: Optional[str] = Field(None, description="Error message if calculation failed") 
\ No newline at end of file
+    error: Optional[str] = Field(None, description="Error message if calculation failed")
+
+class TransportationBatchInput(BaseModel):
+    supplier_id: List[str] = Field(..., description="Supplier identifiers, one per shipment leg")
+    distance: List[float] = Field(..., description="Distance in kilometers per leg")
+    volume: List[float] = Field(..., description="Volume in cubic meters per leg")
+    transport_mode: List[TransportMode] = Field(..., description="Mode of transportation per leg")
+    vehicle_type: List[Optional[VehicleType]] = Field(..., description="Type of vehicle per leg (required for road transport)")
+    fuel_type: List[Optional[FuelType]] = Field(..., description="Type of fuel used per leg (required for road transport)")
+    load_factor: List[float] = Field(..., description="Load factor (0-1) per leg")
+    return_trip: Optional[List[bool]] = Field(None, description="Whether to include return trip emissions per leg")
+
+    @model_validator(mode="after")
+    def check_column_lengths(self):
+        lengths = {
+            name: len(getattr(self, name))
+            for name in type(self).model_fields
+            if getattr(self, name) is not None
+        }
+        if len(set(lengths.values())) > 1:
+            raise ValueError(f"All columns must have the same length, got {lengths}")
+        return self
+
+class TransportationBatchOutput(BaseModel):
+    total_emissions: List[Optional[float]] = Field(..., description="Total emissions in kg CO2e per leg")
+    emissions_per_km: List[Optional[float]] = Field(..., description="Emissions per kilometer per leg")
+    emissions_per_volume: List[Optional[float]] = Field(..., description="Emissions per cubic meter per leg")
+    transport_efficiency_score: List[Optional[float]] = Field(..., description="Transport efficiency score (0-100) per leg")
+    valid: List[bool] = Field(..., description="Mask of legs that passed validation; metrics are null where false")
+    errors: List[List[str]] = Field(..., description="Validation errors per leg, empty for valid legs")
+    total_rows: int = Field(..., description="Number of legs received")
+    processed_rows: int = Field(..., description="Number of legs calculated")
@@ -0,0 +1,191 @@
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type
+from pydantic import BaseModel, ValidationError
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # Redis tier is optional
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+def _normalize(value: Any) -> Any:
+    """Recursively normalize floats so equal inputs hash identically."""
+    if isinstance(value, BaseModel):
+        return _normalize(value.model_dump(mode="json"))
+    if isinstance(value, dict):
+        return {str(key): _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    if isinstance(value, float):
+        # 12 significant digits absorbs float noise; 0.0 covers -0.0
+        return float(format(value, ".12g")) + 0.0
+    return value
+
+def canonical_key(namespace: str, *args: Any, **kwargs: Any) -> str:
+    """Hash the canonicalized call arguments (sorted keys, normalized floats)."""
+    payload = json.dumps(
+        {"args": _normalize(args), "kwargs": _normalize(kwargs)},
+        sort_keys=True,
+        separators=(",", ":")
+    )
+    return f"{namespace}:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+class ResultCache:
+    """
+    Two-tier result cache: a bounded in-process LRU with TTL eviction, and an
+    optional shared Redis tier. Only successful results are stored, and every
+    caller gets its own copy so mutating a result cannot corrupt the cache.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: int = 3600,
+        redis_client: Optional[Any] = None,
+        key_prefix: str = "scos:calc"
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.redis_client = redis_client
+        self.key_prefix = key_prefix
+        self._entries: "OrderedDict[str, Tuple[float, BaseModel]]" = OrderedDict()
+        self.stats: Dict[str, int] = {
+            "hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "redis_errors": 0
+        }
+
+    @classmethod
+    def from_settings(cls, settings, ttl: Optional[int] = None, key_prefix: str = "scos:calc") -> "ResultCache":
+        redis_client = None
+        if settings.REDIS_URL:
+            if redis is None:
+                logger.warning("REDIS_URL is set but the redis package is not installed; using in-process cache only")
+            else:
+                redis_client = redis.from_url(settings.REDIS_URL)
+        return cls(
+            max_entries=settings.CACHE_MAX_ENTRIES,
+            ttl=settings.CACHE_TTL if ttl is None else ttl,
+            redis_client=redis_client,
+            key_prefix=key_prefix
+        )
+
+    async def get_or_compute(
+        self,
+        key: str,
+        result_type: Type[BaseModel],
+        compute: Callable[[], Awaitable[BaseModel]]
+    ) -> BaseModel:
+        result = self._get_local(key)
+        if result is not None:
+            self.stats["hits"] += 1
+            return result
+
+        result = await self._get_remote(key, result_type)
+        if result is not None:
+            self.stats["redis_hits"] += 1
+            self._set_local(key, result)
+            return result
+
+        self.stats["misses"] += 1
+        result = await compute()
+        self._set_local(key, result)
+        await self._set_remote(key, result)
+        return result
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["redis_hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "redis_enabled": self.redis_client is not None,
+            "hit_ratio": (self.stats["hits"] + self.stats["redis_hits"]) / lookups if lookups else 0.0
+        }
+
+    def _get_local(self, key: str) -> Optional[BaseModel]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.stats["expirations"] += 1
+            return None
+        self._entries.move_to_end(key)
+        return result.model_copy(deep=True)
+
+    def _set_local(self, key: str, result: BaseModel) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, result.model_copy(deep=True))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    async def _get_remote(self, key: str, result_type: Type[BaseModel]) -> Optional[BaseModel]:
+        if self.redis_client is None:
+            return None
+        try:
+            payload = await self.redis_client.get(f"{self.key_prefix}:{key}")
+        except Exception as e:
+            self.stats["redis_errors"] += 1
+            logger.warning(f"Redis cache read failed: {str(e)}")
+            return None
+        if payload is None:
+            return None
+        try:
+            return result_type.model_validate_json(payload)
+        except ValidationError as e:
+            # Corrupt or written by an older schema: recompute and drop it
+            self.stats["redis_errors"] += 1
+            logger.warning(f"Discarding unreadable Redis cache entry: {str(e)}")
+            try:
+                await self.redis_client.delete(f"{self.key_prefix}:{key}")
+            except Exception as e:
+                logger.warning(f"Redis cache delete failed: {str(e)}")
+            return None
+
+    async def _set_remote(self, key: str, result: BaseModel) -> None:
+        if self.redis_client is None:
+            return
+        try:
+            await self.redis_client.set(
+                f"{self.key_prefix}:{key}",
+                result.model_dump_json(),
+                ex=self.ttl
+            )
+        except Exception as e:
+            self.stats["redis_errors"] += 1
+            logger.warning(f"Redis cache write failed: {str(e)}")
+
+def cached(namespace: str, result_type: Type[BaseModel]):
+    """
+    Cache an async service method on its canonicalized arguments. The owning
+    object exposes the cache as ``self.cache``; ``None`` disables caching.
+    """
+    def decorator(method):
+        @wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            cache = getattr(self, "cache", None)
+            if cache is None:
+                return await method(self, *args, **kwargs)
+            return await cache.get_or_compute(
+                canonical_key(namespace, *args, **kwargs),
+                result_type,
+                lambda: method(self, *args, **kwargs)
+            )
+        return wrapper
+    return decorator
@@ -1,24 +1,90 @@
-from typing import Dict, Any, List
+import asyncio
+import time
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Awaitable
 import numpy as np
 from ..engines.economic_engine import EconomicEngine
 from ..engines.quality_engine import QualityEngine
 from ..engines.environmental_engine import EnvironmentalEngine
 from ..engines.tradeoff_engine import TradeoffEngine
 from ..engines.transportation_engine import TransportationEngine
-from ..schemas.economic import SupplierCostInput, EconomicScoreOutput, OptimizationResult
+from ..engines.optimization_engine import OptimizationEngine
+from ..schemas.economic import (
+    SupplierCostInput,
+    EconomicScoreOutput,
+    OptimizationResult,
+    SupplierCostBatchInput,
+    EconomicBatchOutput
+)
 from ..schemas.quality import QualityInput, QualityAssessment
 from ..schemas.environmental import EnvironmentalInput, EnvironmentalAssessment
-from ..schemas.transportation import TransportationInput, TransportationAssessment
-from ..schemas.tradeoff import TradeoffInput, TradeoffAnalysis, OptimizationPreferences
-from ..exceptions import CalculationError, ValidationError, ServiceError
+from ..schemas.transportation import (
+    TransportationInput,
+    TransportationAssessment,
+    TransportationBatchInput,
+    TransportationBatchOutput,
+    TransportMode
+)
+from ..schemas.tradeoff import (
+    TradeoffInput,
+    TradeoffAnalysis,
+    OptimizationPreferences,
+    MultiSupplierTradeoffInput,
+    ParetoAnalysis
+)
+from ..schemas.scorecard import SupplierScorecardInput, SupplierScorecard
+from ..exceptions import CalculationError, ValidationError, ServiceError, ConfigurationError
+from .cache import ResultCache, cached
+from .metrics import timed_engine
+
+# Emission factors (kg CO2e per ton-km) for different transport modes
+# These are approximate values and should be updated with actual data
+TON_KM_EMISSION_FACTORS = MappingProxyType({
+    "truck": 0.162,  # kg CO2e per ton-km
+    "train": 0.041,  # kg CO2e per ton-km
+    "ship": 0.017,   # kg CO2e per ton-km
+    "airplane": 0.602  # kg CO2e per ton-km
+})
 
 class CalculationService:
-    def __init__(self):
+    def __init__(self, cache: Optional[ResultCache] = None):
+        self.cache = cache
         self.economic_engine = EconomicEngine()
         self.quality_engine = QualityEngine()
         self.environmental_engine = EnvironmentalEngine()
         self.tradeoff_engine = TradeoffEngine()
         self.transportation_engine = TransportationEngine()
+        self.optimization_engine = OptimizationEngine()
+    
+    async def warm_up(self) -> None:
+        """
+        Run each engine once on a minimal payload so the first real request
+        does not pay for lazy imports, schema compilation or solver discovery.
+        """
+        if not self.optimization_engine.solver_available():
+            raise ConfigurationError("CBC solver is not available")
+        await self.economic_engine.calculate_economic_scores_batch(
+            SupplierCostBatchInput(
+                supplier_id=[0],
+                material_cost=[1.0],
+                transportation_cost=[1.0],
+                tax_rate=[0.0],
+                capacity=[1.0],
+                labor_cost=[1.0],
+                overhead_cost=[1.0],
+                volume=[1.0],
+                lead_time=[1]
+            )
+        )
+        await self.transportation_engine.calculate_transportation_emissions(
+            TransportationInput(
+                distance=1.0,
+                volume=1.0,
+                transport_mode=TransportMode.TRAIN,
+                load_factor=1.0,
+                supplier_id="warm-up"
+            )
+        )
     
     async def calculate_economic(self, data: Dict[str, Any]) -> Dict[str, Any]:
         try:
@@ -48,6 +114,8 @@ class CalculationService:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    @cached("economic_score", EconomicScoreOutput)
+    @timed_engine("EconomicEngine")
     async def calculate_economic_score(
         self,
         data: SupplierCostInput
@@ -97,75 +165,31 @@ class CalculationService:
         except Exception as e:
             raise CalculationError(f"Error calculating economic score: {str(e)}")
 
+    async def calculate_economic_scores_batch(
+        self,
+        data: SupplierCostBatchInput
+    ) -> EconomicBatchOutput:
+        return await self.economic_engine.calculate_economic_scores_batch(data)
+
     async def optimize_sourcing(
         self,
-        data: List[SupplierCostInput]
+        data: List[SupplierCostInput],
+        demand: Optional[float] = None,
+        max_lead_time: Optional[int] = None,
+        strategy: str = "solver"
     ) -> OptimizationResult:
-        try:
-            if not data:
-                raise ValidationError("No supplier data provided")
-            
-            # Validate each supplier's data
-            for supplier in data:
-                if supplier.volume <= 0:
-                    raise ValidationError(f"Invalid volume for supplier {supplier.supplier_id}")
-                if supplier.capacity <= 0:
-                    raise ValidationError(f"Invalid capacity for supplier {supplier.supplier_id}")
-            
-            # Simple optimization example
-            optimal_allocation = {}
-            total_cost = 0
-            current_capacity = 0
-            
-            # Sort suppliers by cost efficiency
-            sorted_suppliers = sorted(
-                data,
-                key=lambda x: (x.material_cost + x.transportation_cost) / x.capacity
-            )
-            
-            for supplier in sorted_suppliers:
-                if current_capacity < supplier.capacity:
-                    allocation = min(
-                        supplier.capacity - current_capacity,
-                        supplier.volume
-                    )
-                    optimal_allocation[supplier.supplier_id] = allocation
-                    total_cost += allocation * (
-                        supplier.material_cost + 
-                        supplier.transportation_cost
-                    )
-                    current_capacity += allocation
-            
-            # Calculate potential savings
-            current_cost = sum(
-                s.volume * (s.material_cost + s.transportation_cost)
-                for s in data
-            )
-            savings_potential = current_cost - total_cost
-            
-            return OptimizationResult(
-                optimal_allocation=optimal_allocation,
-                total_cost=total_cost,
-                savings_potential=savings_potential,
-                optimal_suppliers=[
-                    {
-                        "supplier_id": s.supplier_id,
-                        "allocation": optimal_allocation.get(s.supplier_id, 0),
-                        "cost_efficiency": (s.material_cost + s.transportation_cost) / s.capacity
-                    }
-                    for s in sorted_suppliers
-                ],
-                optimization_details={
-                    "total_capacity_utilized": current_capacity,
-                    "number_of_suppliers": len(optimal_allocation),
-                    "average_cost_per_unit": total_cost / current_capacity if current_capacity > 0 else 0
-                }
-            )
-        except ValidationError as e:
-            raise e
-        except Exception as e:
-            raise CalculationError(f"Error optimizing sourcing: {str(e)}")
+        if strategy == "greedy":
+            return await self.optimization_engine.optimize_sourcing_greedy(data)
+        if strategy != "solver":
+            raise ValidationError(f"Unknown optimization strategy: {strategy}")
+        return await self.optimization_engine.optimize_sourcing(
+            data,
+            demand=demand,
+            max_lead_time=max_lead_time
+        )
 
+    @cached("quality", QualityAssessment)
+    @timed_engine("QualityEngine")
     async def assess_quality(
         self,
         data: QualityInput
@@ -280,6 +304,8 @@ class CalculationService:
                 recommendations.append(f"Improve {metric} to meet standards")
         return recommendations
 
+    @cached("environmental", EnvironmentalAssessment)
+    @timed_engine("EnvironmentalEngine")
     async def assess_environmental_impact(
         self,
         data: EnvironmentalInput
@@ -356,6 +382,8 @@ class CalculationService:
         except Exception as e:
             raise CalculationError(f"Error assessing environmental impact: {str(e)}")
 
+    @cached("tradeoff", TradeoffAnalysis)
+    @timed_engine("TradeoffEngine")
     async def analyze_tradeoffs(
         self,
         data: TradeoffInput,
@@ -421,6 +449,12 @@ class CalculationService:
         except Exception as e:
             raise CalculationError(f"Error analyzing tradeoffs: {str(e)}")
 
+    async def analyze_pareto_frontier(
+        self,
+        data: MultiSupplierTradeoffInput
+    ) -> ParetoAnalysis:
+        return await self.tradeoff_engine.analyze_pareto_frontier(data)
+
     def _calculate_sustainability_score(
         self,
         energy_consumption: float,
@@ -635,21 +669,12 @@ class CalculationService:
         Returns:
             float: Carbon emissions in kg CO2e
         """
-        # Emission factors (kg CO2e per ton-km) for different transport modes
-        # These are approximate values and should be updated with actual data
-        EMISSION_FACTORS = {
-            "truck": 0.162,  # kg CO2e per ton-km
-            "train": 0.041,  # kg CO2e per ton-km
-            "ship": 0.017,   # kg CO2e per ton-km
-            "airplane": 0.602  # kg CO2e per ton-km
-        }
-        
         # Convert volume to weight (assuming average density of 1 ton per cubic meter)
         # This is a simplification - in practice, you would use actual weight
         weight = volume  # in tons
         
         # Get emission factor for the transport mode
-        emission_factor = EMISSION_FACTORS.get(transport_mode.lower(), EMISSION_FACTORS["truck"])
+        emission_factor = TON_KM_EMISSION_FACTORS.get(transport_mode.lower(), TON_KM_EMISSION_FACTORS["truck"])
         
         # Calculate emissions
         emissions = distance * weight * emission_factor
@@ -663,6 +688,7 @@ class CalculationService:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    @cached("transportation", TransportationAssessment)
     async def calculate_transportation_emissions(
         self,
         data: TransportationInput
@@ -670,4 +696,76 @@ class CalculationService:
         try:
             return await self.transportation_engine.calculate_transportation_emissions(data)
         except Exception as e:
-            raise CalculationError(f"Error calculating transportation emissions: {str(e)}") 
\ No newline at end of file
+            raise CalculationError(f"Error calculating transportation emissions: {str(e)}")
+
+    async def calculate_transportation_emissions_batch(
+        self,
+        data: TransportationBatchInput
+    ) -> TransportationBatchOutput:
+        return await self.transportation_engine.calculate_transportation_emissions_batch(data)
+
+    async def build_supplier_scorecard(
+        self,
+        data: SupplierScorecardInput
+    ) -> SupplierScorecard:
+        """
+        Run the economic, quality, environmental and transportation engines
+        concurrently, then feed their scores into the tradeoff engine.
+        """
+        start_time = time.perf_counter()
+        timings = {}
+
+        engine_calls = [
+            self._timed("economic", self.economic_engine.calculate_economic_score(data.economic), timings),
+            self._timed("quality", self.quality_engine.assess_quality(data.quality), timings),
+            self._timed("environmental", self.environmental_engine.assess_environmental_impact(data.environmental), timings),
+        ]
+        if data.transportation is not None:
+            engine_calls.append(self._timed(
+                "transportation",
+                self.transportation_engine.calculate_transportation_emissions(data.transportation),
+                timings
+            ))
+
+        results = await asyncio.gather(*engine_calls)
+        economic, quality, environmental = results[:3]
+        transportation = results[3] if data.transportation is not None else None
+
+        tradeoff = await self._timed(
+            "tradeoff",
+            self.tradeoff_engine.analyze_tradeoffs(
+                TradeoffInput(
+                    supplier_id=data.supplier_id,
+                    economic_score=economic.score,
+                    quality_score=quality.quality_score,
+                    environmental_score=environmental.environmental_score,
+                    historical_performance=data.historical_performance,
+                    risk_factors=data.risk_factors
+                ),
+                data.preferences
+            ),
+            timings
+        )
+        timings["total"] = (time.perf_counter() - start_time) * 1000
+
+        return SupplierScorecard(
+            supplier_id=data.supplier_id,
+            economic=economic,
+            quality=quality,
+            environmental=environmental,
+            transportation=transportation,
+            tradeoff=tradeoff,
+            timings_ms=timings
+        )
+
+    async def _timed(
+        self,
+        name: str,
+        call: Awaitable[Any],
+        timings: Dict[str, float]
+    ) -> Any:
+        start_time = time.perf_counter()
+        try:
+            return await call
+        finally:
+            timings[name] = (time.perf_counter() - start_time) * 1000
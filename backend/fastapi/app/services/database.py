@@ -0,0 +1,87 @@
+"""
+Read-only access to the Django-managed database.
+
+Only the columns the analytics read are declared, as SQLAlchemy Core tables;
+Django owns the schema and migrations. One pooled async engine is shared per
+process and disposed on application shutdown.
+"""
+from typing import Optional
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+    Text,
+    Uuid
+)
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from ..config import settings
+from ..exceptions import ConfigurationError
+
+metadata = MetaData()
+
+suppliers = Table(
+    "suppliers_supplier", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String(200)),
+    Column("carbon_footprint", Numeric(10, 2)),
+    Column("renewable_energy_usage", Numeric(5, 2)),
+    Column("waste_management_policy", Text),
+    Column("sustainability_goals", Text),
+    Column("environmental_certification", String(100)),
+)
+
+orders = Table(
+    "suppliers_order", metadata,
+    Column("order_id", Uuid, primary_key=True),
+    Column("supplier_id", Integer, ForeignKey("suppliers_supplier.id")),
+    Column("order_date", DateTime(timezone=True)),
+    Column("expected_delivery_date", Date),
+    Column("actual_delivery_date", Date),
+    Column("status", String(20)),
+    Column("total_amount", Numeric(12, 2)),
+)
+
+transportation_emissions = Table(
+    "suppliers_transportationemission", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("supplier_id", Integer, ForeignKey("suppliers_supplier.id")),
+    Column("distance", Float),
+    Column("transport_mode", String(20)),
+    Column("return_trip", Boolean),
+    Column("total_emissions", Float),
+    Column("transport_efficiency_score", Float),
+    Column("created_at", DateTime(timezone=True)),
+)
+
+_engine: Optional[AsyncEngine] = None
+
+def get_engine() -> AsyncEngine:
+    """Return the process-wide engine, creating its pool on first use."""
+    global _engine
+    if _engine is None:
+        if not settings.DATABASE_URL:
+            raise ConfigurationError("DATABASE_URL is not configured")
+        options = {}
+        if not settings.DATABASE_URL.startswith("sqlite"):
+            options = {
+                "pool_size": settings.DB_POOL_SIZE,
+                "max_overflow": settings.DB_MAX_OVERFLOW,
+                "pool_timeout": settings.DB_POOL_TIMEOUT,
+                "pool_recycle": settings.DB_POOL_RECYCLE,
+            }
+        _engine = create_async_engine(settings.DATABASE_URL, pool_pre_ping=True, **options)
+    return _engine
+
+async def dispose_engine() -> None:
+    global _engine
+    if _engine is not None:
+        await _engine.dispose()
+        _engine = None
@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Mapping, Optional
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+from ..schemas.suppliers import SupplierAnalyticsResponse, EnvironmentalImpactResponse
+from ..exceptions import NotFoundError
+from .cache import ResultCache, cached
+from .database import get_engine, suppliers, orders, transportation_emissions
+
+# Window of transport emissions counted into the annual carbon footprint
+FOOTPRINT_WINDOW = timedelta(days=365)
+
+class SupplierAnalyticsService:
+    """
+    Supplier analytics aggregated in the database, one round trip per supplier.
+    Results are cached per supplier for ``ANALYTICS_CACHE_TTL`` seconds.
+    """
+
+    def __init__(
+        self,
+        engine_factory: Callable[[], AsyncEngine] = get_engine,
+        cache: Optional[ResultCache] = None
+    ):
+        self._engine_factory = engine_factory
+        self.cache = cache
+
+    @cached("supplier_analytics", SupplierAnalyticsResponse)
+    async def get_supplier_analytics(self, supplier_id: int) -> SupplierAnalyticsResponse:
+        facts = await self._supplier_facts(supplier_id)
+        total_distance = facts["total_distance"] or 0
+        return SupplierAnalyticsResponse(
+            total_orders=facts["total_orders"] or 0,
+            average_order_value=float(facts["average_order_value"] or 0),
+            on_time_delivery_rate=_ratio(facts["on_time_orders"], facts["delivered_orders"]),
+            environmental_score=(facts["average_efficiency"] or 0) / 100,
+            sustainability_metrics={
+                "shipment_count": facts["shipment_count"] or 0,
+                "total_emissions": facts["total_emissions"] or 0.0,
+                "emissions_per_km": (facts["total_emissions"] or 0) / total_distance if total_distance else 0.0,
+                "renewable_energy_usage": float(facts["renewable_energy_usage"] or 0)
+            }
+        )
+
+    @cached("supplier_environmental_impact", EnvironmentalImpactResponse)
+    async def get_environmental_impact(self, supplier_id: int) -> EnvironmentalImpactResponse:
+        facts = await self._supplier_facts(supplier_id)
+        renewable = float(facts["renewable_energy_usage"] or 0)
+        return EnvironmentalImpactResponse(
+            carbon_footprint=float(facts["carbon_footprint"] or 0) + (facts["recent_emissions"] or 0) / 1000,
+            renewable_energy_usage=renewable,
+            waste_management_score=1.0 if (facts["waste_management_policy"] or "").strip() else 0.0,
+            sustainability_goals_progress={
+                "renewable_energy": renewable / 100,
+                "transport_efficiency": (facts["average_efficiency"] or 0) / 100
+            }
+        )
+
+    async def _supplier_facts(self, supplier_id: int) -> Mapping[str, Any]:
+        """Supplier columns plus order and emission aggregates in one statement."""
+        delivered = and_(
+            orders.c.actual_delivery_date.is_not(None),
+            orders.c.status != "cancelled"
+        )
+        order_stats = (
+            select(
+                orders.c.supplier_id,
+                func.count().label("total_orders"),
+                func.avg(orders.c.total_amount).filter(orders.c.status != "cancelled").label("average_order_value"),
+                func.count().filter(delivered).label("delivered_orders"),
+                func.count().filter(
+                    and_(delivered, orders.c.actual_delivery_date <= orders.c.expected_delivery_date)
+                ).label("on_time_orders")
+            )
+            .where(orders.c.supplier_id == supplier_id)
+            .group_by(orders.c.supplier_id)
+            .subquery()
+        )
+        emissions = transportation_emissions.c
+        emission_stats = (
+            select(
+                emissions.supplier_id,
+                func.count().label("shipment_count"),
+                func.sum(emissions.total_emissions).label("total_emissions"),
+                func.sum(emissions.distance).label("total_distance"),
+                func.avg(emissions.transport_efficiency_score).label("average_efficiency"),
+                func.sum(emissions.total_emissions).filter(
+                    emissions.created_at >= datetime.now(timezone.utc) - FOOTPRINT_WINDOW
+                ).label("recent_emissions")
+            )
+            .where(emissions.supplier_id == supplier_id)
+            .group_by(emissions.supplier_id)
+            .subquery()
+        )
+        statement = (
+            select(
+                suppliers.c.carbon_footprint,
+                suppliers.c.renewable_energy_usage,
+                suppliers.c.waste_management_policy,
+                *(column for column in order_stats.c if column.name != "supplier_id"),
+                *(column for column in emission_stats.c if column.name != "supplier_id")
+            )
+            .select_from(
+                suppliers
+                .outerjoin(order_stats, order_stats.c.supplier_id == suppliers.c.id)
+                .outerjoin(emission_stats, emission_stats.c.supplier_id == suppliers.c.id)
+            )
+            .where(suppliers.c.id == supplier_id)
+        )
+
+        async with self._engine_factory().connect() as connection:
+            row = (await connection.execute(statement)).mappings().first()
+        if row is None:
+            raise NotFoundError(f"Supplier {supplier_id} not found")
+        return row
+
+def _ratio(numerator: Optional[int], denominator: Optional[int]) -> float:
+    return numerator / denominator if denominator else 0.0
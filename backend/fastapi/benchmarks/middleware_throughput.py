@@ -0,0 +1,83 @@
+"""
+Requests/sec through the logging and auth middleware on a trivial endpoint,
+comparing the previous BaseHTTPMiddleware implementations with the pure ASGI
+ones. Runs in-process over httpx's ASGI transport, so the numbers measure
+middleware overhead rather than network or server cost.
+
+    python -m benchmarks.middleware_throughput [requests] [concurrency]
+"""
+import asyncio
+import logging
+import sys
+import time
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from app.middleware.auth import AuthMiddleware
+from app.middleware.logging import LoggingMiddleware
+
+API_KEY = "benchmark-key"
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        logging.getLogger("benchmark").info(f"Request: {request.method} {request.url.path}")
+        response = await call_next(request)
+        process_time = time.time() - start_time
+        logging.getLogger("benchmark").info(f"Response: {response.status_code} - Processed in {process_time:.2f}s")
+        return response
+
+class LegacyAuthMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        if request.url.path in ["/docs", "/redoc", "/openapi.json", "/health", "/health/ready", "/metrics"]:
+            return await call_next(request)
+        api_key = request.headers.get("X-API-Key")
+        if api_key != API_KEY:
+            return JSONResponse({"detail": "Invalid API key"}, status_code=401)
+        return await call_next(request)
+
+def build_app(legacy: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    if legacy:
+        app.add_middleware(LegacyLoggingMiddleware)
+        app.add_middleware(LegacyAuthMiddleware)
+    else:
+        app.add_middleware(LoggingMiddleware)
+        app.add_middleware(AuthMiddleware, api_key=API_KEY)
+    return app
+
+async def run(app: FastAPI, total: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers={"X-API-Key": API_KEY}) as client:
+        remaining = iter(range(total))
+
+        async def worker():
+            for _ in remaining:
+                response = await client.get("/ping")
+                assert response.status_code == 200
+
+        # Warm up routing and JSON encoding before timing
+        await asyncio.gather(*(client.get("/ping") for _ in range(concurrency)))
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return total / (time.perf_counter() - start)
+
+async def main(total: int, concurrency: int) -> None:
+    # Keep log I/O out of the measurement; both variants still format their messages
+    logging.disable(logging.INFO)
+    results = {}
+    for name, legacy in (("BaseHTTPMiddleware", True), ("pure ASGI", False)):
+        results[name] = await run(build_app(legacy), total, concurrency)
+        print(f"{name:>20}: {results[name]:,.0f} req/s")
+    print(f"{'speedup':>20}: {results['pure ASGI'] / results['BaseHTTPMiddleware']:.2f}x")
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    asyncio.run(main(total, concurrency))
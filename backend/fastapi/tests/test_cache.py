@@ -0,0 +1,114 @@
+import pytest
+from app.services.cache import ResultCache, canonical_key
+from app.services.calculation_service import CalculationService
+from app.schemas.economic import SupplierCostInput
+from app.exceptions import ValidationError
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio client."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    async def delete(self, key):
+        self.store.pop(key, None)
+
+def make_supplier(**overrides):
+    data = {
+        "supplier_id": 1,
+        "material_cost": 1000,
+        "transportation_cost": 200,
+        "labor_cost": 300,
+        "overhead_cost": 150,
+        "tax_rate": 0.1,
+        "capacity": 1000,
+        "volume": 800,
+        "lead_time": 5
+    }
+    data.update(overrides)
+    return SupplierCostInput(**data)
+
+def test_canonical_key_ignores_key_order_and_float_noise():
+    assert canonical_key("ns", {"a": 1, "b": 0.1 + 0.2}) == canonical_key("ns", {"b": 0.3, "a": 1})
+    assert canonical_key("ns", {"a": -0.0}) == canonical_key("ns", {"a": 0.0})
+    assert canonical_key("ns", {"a": 1}) != canonical_key("other", {"a": 1})
+
+@pytest.mark.asyncio
+async def test_repeated_request_is_served_from_cache():
+    service = CalculationService(cache=ResultCache())
+    first = await service.calculate_economic_score(make_supplier())
+    second = await service.calculate_economic_score(make_supplier(material_cost=1000.0))
+
+    assert second == first
+    assert service.cache.stats["hits"] == 1
+    assert service.cache.stats["misses"] == 1
+
+@pytest.mark.asyncio
+async def test_lru_eviction_and_ttl_expiry():
+    cache = ResultCache(max_entries=2)
+    service = CalculationService(cache=cache)
+    for supplier_id in (1, 2, 3):
+        await service.calculate_economic_score(make_supplier(supplier_id=supplier_id))
+
+    assert cache.stats["evictions"] == 1
+    assert cache.snapshot()["size"] == 2
+
+    cache.ttl = 0
+    cache.clear()
+    await service.calculate_economic_score(make_supplier())
+    await service.calculate_economic_score(make_supplier())
+    assert cache.stats["expirations"] == 1
+
+@pytest.mark.asyncio
+async def test_redis_tier_is_shared_between_processes():
+    redis = FakeRedis()
+    first = CalculationService(cache=ResultCache(redis_client=redis))
+    second = CalculationService(cache=ResultCache(redis_client=redis))
+
+    expected = await first.calculate_economic_score(make_supplier())
+    result = await second.calculate_economic_score(make_supplier())
+
+    assert result == expected
+    assert len(redis.store) == 1
+    assert second.cache.stats["redis_hits"] == 1
+    assert second.cache.stats["misses"] == 0
+
+@pytest.mark.asyncio
+async def test_callers_get_their_own_copy():
+    service = CalculationService(cache=ResultCache())
+    first = await service.calculate_economic_score(make_supplier())
+    expected = first.model_copy(deep=True)
+    first.supplier_id = 999
+
+    assert await service.calculate_economic_score(make_supplier()) == expected
+
+@pytest.mark.asyncio
+async def test_unreadable_redis_entry_is_a_miss():
+    redis = FakeRedis()
+    service = CalculationService(cache=ResultCache(redis_client=redis))
+    expected = await service.calculate_economic_score(make_supplier())
+    key, = redis.store
+    redis.store[key] = b'{"schema": "drifted"}'
+
+    other = CalculationService(cache=ResultCache(redis_client=redis))
+    assert await other.calculate_economic_score(make_supplier()) == expected
+    assert other.cache.stats["misses"] == 1
+    # Recomputed and written back in the current schema
+    assert redis.store[key] != b'{"schema": "drifted"}'
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached():
+    cache = ResultCache()
+    service = CalculationService(cache=cache)
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            await service.calculate_economic_score(make_supplier().model_copy(update={"volume": 0}))
+
+    assert cache.stats["misses"] == 2
+    assert cache.snapshot()["size"] == 0
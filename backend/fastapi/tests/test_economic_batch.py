@@ -0,0 +1,68 @@
+import pytest
+from app.engines.economic_engine import EconomicEngine
+from app.schemas.economic import SupplierCostInput, SupplierCostBatchInput
+from app.exceptions import ValidationError
+
+@pytest.fixture
+def economic_engine():
+    return EconomicEngine()
+
+@pytest.fixture
+def batch_input():
+    return {
+        "supplier_id": [1, 2, 3],
+        "material_cost": [1000, 900, 1100],
+        "transportation_cost": [200, 250, 180],
+        "labor_cost": [300, 280, 320],
+        "overhead_cost": [150, 140, 160],
+        "tax_rate": [0.1, 0.1, 0.15],
+        "capacity": [1000, 1200, 0],  # Third row has invalid capacity
+        "volume": [800, 1000, 900],
+        "lead_time": [5, 4, 6]
+    }
+
+@pytest.mark.asyncio
+async def test_batch_matches_single_row_scoring(economic_engine, batch_input):
+    result = await economic_engine.calculate_economic_scores_batch(
+        SupplierCostBatchInput(**batch_input)
+    )
+
+    assert result.total_rows == 3
+    assert result.processed_rows == 2
+    for row in result.results:
+        supplier = SupplierCostInput(
+            **{key: values[row.index] for key, values in batch_input.items()}
+        )
+        single = await economic_engine.calculate_economic_score(supplier)
+        assert row.supplier_id == single.supplier_id
+        assert row.score == pytest.approx(single.score)
+        assert row.total_cost == pytest.approx(single.total_cost)
+        assert row.tax == pytest.approx(single.cost_breakdown["tax"])
+        assert row.cost_per_unit == pytest.approx(single.total_cost / supplier.volume)
+        assert row.recommendations == economic_engine._generate_recommendations(row.score)
+
+@pytest.mark.asyncio
+async def test_batch_reports_row_errors_without_aborting(economic_engine, batch_input):
+    batch_input["tax_rate"][0] = 1.5
+    result = await economic_engine.calculate_economic_scores_batch(
+        SupplierCostBatchInput(**batch_input)
+    )
+
+    assert [row.index for row in result.results] == [1]
+    assert [error.index for error in result.errors] == [0, 2]
+    assert result.errors[0].supplier_id == 1
+    assert "tax_rate must be between 0 and 1" in result.errors[0].errors
+    assert "Capacity must be greater than zero" in result.errors[1].errors
+
+def test_batch_rejects_ragged_columns(batch_input):
+    batch_input["volume"] = [800, 1000]
+    with pytest.raises(Exception):
+        SupplierCostBatchInput(**batch_input)
+
+@pytest.mark.asyncio
+async def test_batch_empty_input(economic_engine):
+    empty = {name: [] for name in SupplierCostBatchInput.model_fields}
+    with pytest.raises(ValidationError):
+        await economic_engine.calculate_economic_scores_batch(
+            SupplierCostBatchInput(**empty)
+        )
@@ -0,0 +1,26 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.dependencies import get_calculation_service
+from app.engines.transportation_engine import TransportationEngine
+from app.schemas.transportation import TransportMode
+
+def test_calculation_service_is_shared():
+    assert get_calculation_service() is get_calculation_service()
+
+def test_readiness_waits_for_warm_up():
+    app.state.ready = False
+    client = TestClient(app)
+    assert client.get("/health/ready").status_code == 503
+
+    with TestClient(app) as client:
+        response = client.get("/health/ready")
+        assert response.status_code == 200
+        assert response.json() == {"status": "ready"}
+        assert client.get("/health").status_code == 200
+
+def test_emission_factors_are_shared_and_immutable():
+    first, second = TransportationEngine(), TransportationEngine()
+    assert first.emission_factors is second.emission_factors
+    with pytest.raises(TypeError):
+        first.emission_factors["base_factors"][TransportMode.TRUCK] = 0
@@ -0,0 +1,54 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.config import settings
+from app.services.metrics import Histogram, ENGINE_LATENCY
+
+@pytest.fixture
+def client():
+    with TestClient(app) as client:
+        yield client
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("test_seconds", "Test histogram", ("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.5, "/a")
+    histogram.observe(5, "/a")
+
+    lines = histogram.render()
+    assert 'test_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{route="/a",le="1.0"} 2' in lines
+    assert 'test_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'test_seconds_count{route="/a"} 3' in lines
+
+def test_metrics_endpoint_reports_routes_and_engines(client):
+    response = client.post(
+        f"{settings.API_V1_STR}/economic/calculate-score",
+        json={
+            "supplier_id": 1,
+            "material_cost": 1000,
+            "transportation_cost": 200,
+            "labor_cost": 300,
+            "overhead_cost": 150,
+            "tax_rate": 0.1,
+            "capacity": 1000,
+            "volume": 800,
+            "lead_time": 5
+        },
+        headers={"X-API-Key": settings.API_KEY}
+    )
+    assert response.status_code == 200
+
+    # Scraping does not require the API key
+    metrics = client.get("/metrics")
+    assert metrics.status_code == 200
+    assert metrics.headers["content-type"].startswith("text/plain")
+
+    body = metrics.text
+    route = f"{settings.API_V1_STR}/economic/calculate-score"
+    assert f'scos_http_requests_total{{method="POST",route="{route}",status="200"}}' in body
+    assert f'scos_http_request_duration_seconds_count{{method="POST",route="{route}"}}' in body
+    assert 'scos_http_requests_in_progress{method="POST"} 0' in body
+    assert ("EconomicEngine", "calculate_economic_score") in ENGINE_LATENCY.values
+    # Warm-up ran the transportation engine through the lifespan hook
+    assert ("TransportationEngine", "calculate_transportation_emissions") in ENGINE_LATENCY.values
@@ -0,0 +1,52 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from app.middleware.auth import AuthMiddleware
+from app.middleware.logging import LoggingMiddleware
+
+API_KEY = "test-key"
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk-{i}\n"
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app.add_middleware(LoggingMiddleware)
+    app.add_middleware(AuthMiddleware, api_key=API_KEY)
+    return TestClient(app)
+
+def test_missing_api_key_is_rejected(client):
+    response = client.get("/ping")
+    assert response.status_code == 401
+    assert response.json() == {"detail": "API key is missing"}
+
+def test_invalid_api_key_is_rejected(client):
+    response = client.get("/ping", headers={"X-API-Key": "wrong"})
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Invalid API key"}
+
+def test_valid_api_key_and_skip_paths(client):
+    assert client.get("/ping", headers={"X-API-Key": API_KEY}).json() == {"status": "ok"}
+    assert client.get("/health").status_code == 200
+
+def test_streaming_response_passes_through(client, caplog):
+    with caplog.at_level("INFO", logger="app.middleware.logging"):
+        response = client.get("/stream", headers={"X-API-Key": API_KEY})
+
+    assert response.text == "chunk-0\nchunk-1\nchunk-2\n"
+    assert any(message.startswith("Response: 200") for message in caplog.messages)
@@ -0,0 +1,82 @@
+import pytest
+from app.engines.optimization_engine import OptimizationEngine
+from app.schemas.economic import SupplierCostInput
+from app.exceptions import ValidationError
+
+@pytest.fixture
+def optimization_engine():
+    return OptimizationEngine()
+
+def make_supplier(supplier_id, unit_cost, capacity, volume, lead_time=5, min_order_quantity=None):
+    return SupplierCostInput(
+        supplier_id=supplier_id,
+        material_cost=unit_cost * 0.8,
+        transportation_cost=unit_cost * 0.2,
+        labor_cost=300,
+        overhead_cost=150,
+        tax_rate=0.1,
+        capacity=capacity,
+        volume=volume,
+        lead_time=lead_time,
+        min_order_quantity=min_order_quantity
+    )
+
+@pytest.fixture
+def suppliers():
+    return [
+        make_supplier(1, unit_cost=10, capacity=500, volume=400),
+        make_supplier(2, unit_cost=8, capacity=2000, volume=300),
+        make_supplier(3, unit_cost=12, capacity=1000, volume=300, lead_time=10)
+    ]
+
+@pytest.mark.asyncio
+async def test_solver_allocates_demand_at_minimum_cost(optimization_engine, suppliers):
+    result = await optimization_engine.optimize_sourcing(suppliers)
+
+    # Cheapest supplier can cover the whole 1000 unit demand
+    assert result.optimal_allocation == {2: pytest.approx(1000)}
+    assert result.total_cost == pytest.approx(8000)
+    assert result.savings_potential == pytest.approx(4000 + 2400 + 3600 - 8000)
+    assert result.solver_stats["solver"] == "CBC"
+    assert result.solver_stats["solution_status"] == "Optimal Solution Found"
+    assert result.solver_stats["is_mip"] is False
+
+@pytest.mark.asyncio
+async def test_solver_is_no_worse_than_greedy(optimization_engine, suppliers):
+    solver = await optimization_engine.optimize_sourcing(suppliers)
+    greedy = await optimization_engine.optimize_sourcing_greedy(suppliers)
+
+    assert greedy.solver_stats["solver"] == "greedy"
+    assert solver.optimization_details["total_capacity_utilized"] >= greedy.optimization_details["total_capacity_utilized"]
+    assert solver.optimization_details["average_cost_per_unit"] <= greedy.optimization_details["average_cost_per_unit"]
+
+@pytest.mark.asyncio
+async def test_min_order_quantity_builds_a_mip(optimization_engine):
+    suppliers = [
+        make_supplier(1, unit_cost=8, capacity=1000, volume=100, min_order_quantity=500),
+        make_supplier(2, unit_cost=10, capacity=1000, volume=100)
+    ]
+    result = await optimization_engine.optimize_sourcing(suppliers, demand=200)
+
+    # Using the cheaper supplier would force 500 units, which costs more
+    assert result.solver_stats["is_mip"] is True
+    assert result.optimal_allocation == {2: pytest.approx(200)}
+
+@pytest.mark.asyncio
+async def test_lead_time_excludes_slow_suppliers(optimization_engine, suppliers):
+    suppliers[1] = make_supplier(2, unit_cost=8, capacity=2000, volume=300, lead_time=20)
+    result = await optimization_engine.optimize_sourcing(suppliers, demand=1200, max_lead_time=10)
+
+    assert 2 not in result.optimal_allocation
+    assert result.optimization_details["excluded_by_lead_time"] == 1
+    assert sum(result.optimal_allocation.values()) == pytest.approx(1200)
+
+@pytest.mark.asyncio
+async def test_insufficient_capacity(optimization_engine, suppliers):
+    with pytest.raises(ValidationError):
+        await optimization_engine.optimize_sourcing(suppliers, demand=10000)
+
+@pytest.mark.asyncio
+async def test_empty_input(optimization_engine):
+    with pytest.raises(ValidationError):
+        await optimization_engine.optimize_sourcing([])
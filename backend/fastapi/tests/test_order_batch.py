@@ -0,0 +1,69 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.config import settings
+from app.main import app
+
+HEADERS = {"X-API-Key": settings.API_KEY}
+
+def order(supplier_id, *items):
+    return {
+        "supplier_id": supplier_id,
+        "expected_delivery_date": "2024-03-01T00:00:00",
+        "items": [{"quantity": quantity, "unit_price": unit_price} for quantity, unit_price in items]
+    }
+
+@pytest.fixture
+def client():
+    with TestClient(app) as client:
+        yield client
+
+def test_batch_matches_single_order_calculation(client):
+    orders = [
+        order(1, (3, 0.1), ("2.50", "4.99")),
+        order(2, (150, 60)),
+        order(3),
+        order(4, (10000, 200), (1, 1))
+    ]
+
+    response = client.post("/api/orders/calculate/batch", json=orders, headers=HEADERS)
+
+    assert response.status_code == 200
+    entries = response.json()
+    assert [entry["index"] for entry in entries] == list(range(len(orders)))
+    assert all(entry["errors"] == [] for entry in entries)
+    results = [entry["result"] for entry in entries]
+    assert len(results) == len(orders)
+    for payload, result in zip(orders, results):
+        single = client.post("/api/orders/calculate", json=payload, headers=HEADERS).json()
+        assert result["total_amount"] == pytest.approx(single["total_amount"])
+        assert result["environmental_impact"] == pytest.approx(single["environmental_impact"])
+        assert result["recommended_actions"] == single["recommended_actions"]
+
+    assert results[0]["total_amount"] == pytest.approx(12.775)
+    assert results[1]["recommended_actions"] == []
+    assert results[2]["total_amount"] == 0
+    assert results[3]["recommended_actions"] == [
+        "Consider splitting order into smaller batches",
+        "Consider alternative transportation methods"
+    ]
+
+def test_batch_rejects_empty_and_oversized_payloads(client, monkeypatch):
+    assert client.post("/api/orders/calculate/batch", json=[], headers=HEADERS).status_code == 400
+
+    monkeypatch.setattr(settings, "MAX_ORDER_BATCH_SIZE", 2)
+    response = client.post("/api/orders/calculate/batch", json=[order(1, (1, 1))] * 3, headers=HEADERS)
+    assert response.status_code == 400
+
+def test_invalid_orders_do_not_fail_the_batch(client):
+    response = client.post("/api/orders/calculate/batch", json=[
+        order(1, (2, 3)),
+        order(2, ("abc", 1)),
+        {"supplier_id": "x", "items": []},
+        order(4, (1, 5))
+    ], headers=HEADERS)
+
+    assert response.status_code == 200
+    entries = response.json()
+    assert [entry["result"]["total_amount"] if entry["result"] else None for entry in entries] == [6, None, None, 5]
+    assert entries[1]["errors"] == ["items.0.quantity: must be a number"]
+    assert len(entries[2]["errors"]) == 2
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from app.engines.tradeoff_engine import TradeoffEngine
+from app.schemas.tradeoff import MultiSupplierTradeoffInput
+from app.exceptions import ValidationError
+
+@pytest.fixture
+def tradeoff_engine():
+    return TradeoffEngine()
+
+def brute_force_frontier(scores):
+    frontier = []
+    for i, point in enumerate(scores):
+        dominated = any(
+            np.all(other >= point) and np.any(other > point)
+            for other in scores
+        )
+        if not dominated:
+            frontier.append(i)
+    return frontier
+
+def test_frontier_matches_brute_force(tradeoff_engine):
+    rng = np.random.default_rng(42)
+    # Integer scores make ties and duplicate suppliers likely
+    scores = rng.integers(0, 15, size=(400, 3)).astype(float)
+    assert tradeoff_engine._pareto_frontier(scores) == brute_force_frontier(scores)
+
+@pytest.mark.asyncio
+async def test_pareto_analysis_with_explicit_weights(tradeoff_engine):
+    result = await tradeoff_engine.analyze_pareto_frontier(MultiSupplierTradeoffInput(
+        supplier_id=["A", "B", "C", "D"],
+        economic_score=[90, 60, 50, 95],
+        quality_score=[70, 90, 40, 60],
+        environmental_score=[60, 80, 30, 50],
+        weights=[
+            {"economic_weight": 1.0, "quality_weight": 0.0, "environmental_weight": 0.0},
+            {"economic_weight": 0.2, "quality_weight": 0.4, "environmental_weight": 0.4}
+        ]
+    ))
+
+    assert result.pareto_frontier == ["A", "B", "D"]
+    assert result.rankings[0].supplier_ids == ["D", "A", "B", "C"]
+    assert result.rankings[1].supplier_ids[0] == "B"
+    assert result.rankings[1].scores[0] == pytest.approx(0.2 * 60 + 0.4 * 90 + 0.4 * 80)
+
+@pytest.mark.asyncio
+async def test_generated_weight_sweep(tradeoff_engine):
+    result = await tradeoff_engine.analyze_pareto_frontier(MultiSupplierTradeoffInput(
+        supplier_id=["A", "B", "C"],
+        economic_score=[90, 60, 50],
+        quality_score=[70, 90, 40],
+        environmental_score=[60, 80, 30],
+        sweep_resolution=4,
+        top_k=2
+    ))
+
+    # A simplex grid with 4 steps has (4 + 1)(4 + 2) / 2 weight vectors
+    assert len(result.rankings) == 15
+    assert all(len(ranking.supplier_ids) == 2 for ranking in result.rankings)
+    assert all("C" not in ranking.supplier_ids for ranking in result.rankings)
+
+@pytest.mark.asyncio
+async def test_invalid_weights(tradeoff_engine):
+    with pytest.raises(ValidationError):
+        await tradeoff_engine.analyze_pareto_frontier(MultiSupplierTradeoffInput(
+            supplier_id=["A"],
+            economic_score=[90],
+            quality_score=[70],
+            environmental_score=[60],
+            weights=[{"economic_weight": 0.5, "quality_weight": 0.5, "environmental_weight": 0.5}]
+        ))
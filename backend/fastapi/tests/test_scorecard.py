@@ -0,0 +1,102 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.config import settings
+from app.services.calculation_service import CalculationService
+from app.schemas.scorecard import SupplierScorecardInput
+
+@pytest.fixture
+def scorecard_input():
+    return {
+        "supplier_id": "SUP001",
+        "economic": {
+            "supplier_id": 1,
+            "material_cost": 1000,
+            "transportation_cost": 200,
+            "labor_cost": 300,
+            "overhead_cost": 150,
+            "tax_rate": 0.1,
+            "capacity": 1000,
+            "volume": 800,
+            "lead_time": 5
+        },
+        "quality": {
+            "material_id": 1,
+            "measurements": {"tensile_strength": 500, "hardness": 38},
+            "standards": {"tensile_strength": 450, "hardness": 40},
+            "supplier_id": "SUP001",
+            "defect_rate": 2.5,
+            "customer_satisfaction": 85,
+            "compliance_score": 92,
+            "process_efficiency": 88,
+            "certification_status": ["ISO9001"],
+            "audit_history": []
+        },
+        "environmental": {
+            "supplier_id": "SUP001",
+            "energy_consumption": 500,
+            "water_usage": 40,
+            "waste_generated": 20,
+            "carbon_emissions": 30,
+            "recycling_rate": 60,
+            "renewable_energy_usage": 40
+        },
+        "transportation": {
+            "distance": 250,
+            "volume": 10,
+            "transport_mode": "truck",
+            "vehicle_type": "large_truck",
+            "fuel_type": "diesel",
+            "load_factor": 0.9,
+            "supplier_id": "SUP001"
+        },
+        "historical_performance": {"q1": 80, "q2": 85},
+        "risk_factors": {"financial_stability": 0.2, "geopolitical_risk": 0.6},
+        "preferences": {
+            "economic_weight": 0.4,
+            "quality_weight": 0.4,
+            "environmental_weight": 0.2,
+            "risk_tolerance": 0.5,
+            "optimization_goals": ["cost_reduction"]
+        }
+    }
+
+@pytest.mark.asyncio
+async def test_scorecard_pipes_engine_scores_into_tradeoff(scorecard_input):
+    service = CalculationService()
+    scorecard = await service.build_supplier_scorecard(SupplierScorecardInput(**scorecard_input))
+
+    expected = (
+        scorecard.economic.score * 0.4 +
+        scorecard.quality.quality_score * 0.4 +
+        scorecard.environmental.environmental_score * 0.2
+    )
+    assert scorecard.tradeoff.balanced_score == pytest.approx(expected)
+    assert scorecard.quality.quality_score == 50
+    assert scorecard.transportation is not None
+    assert set(scorecard.timings_ms) == {
+        "economic", "quality", "environmental", "transportation", "tradeoff", "total"
+    }
+
+@pytest.mark.asyncio
+async def test_scorecard_without_transportation(scorecard_input):
+    del scorecard_input["transportation"]
+    service = CalculationService()
+    scorecard = await service.build_supplier_scorecard(SupplierScorecardInput(**scorecard_input))
+
+    assert scorecard.transportation is None
+    assert "transportation" not in scorecard.timings_ms
+
+def test_scorecard_endpoint(scorecard_input):
+    with TestClient(app) as client:
+        response = client.post(
+            f"{settings.API_V1_STR}/scorecard/calculate",
+            json=scorecard_input,
+            headers={"X-API-Key": settings.API_KEY}
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["supplier_id"] == "SUP001"
+    assert "tradeoff" in data
+    assert "timings_ms" in data
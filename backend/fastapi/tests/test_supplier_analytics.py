@@ -0,0 +1,101 @@
+import uuid
+from datetime import date, datetime, timezone
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.main import app
+from app.config import settings
+from app.dependencies import get_supplier_analytics_service
+from app.exceptions import NotFoundError
+from app.services.cache import ResultCache
+from app.services.database import metadata, suppliers, orders, transportation_emissions
+from app.services.supplier_analytics import SupplierAnalyticsService
+
+pytest.importorskip("aiosqlite")
+
+@pytest.fixture
+def database(tmp_path):
+    path = tmp_path / "analytics.db"
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as connection:
+        metadata.create_all(connection)
+        connection.execute(insert(suppliers), [
+            {"id": 1, "name": "Supplier", "carbon_footprint": 12, "renewable_energy_usage": 40,
+             "waste_management_policy": "Sorted recycling"},
+            {"id": 2, "name": "Other", "carbon_footprint": None, "renewable_energy_usage": None,
+             "waste_management_policy": ""}
+        ])
+        connection.execute(insert(orders), [
+            {"order_id": uuid.uuid4(), "supplier_id": 1, "status": status, "total_amount": amount,
+             "expected_delivery_date": date(2024, 2, 1), "actual_delivery_date": delivered}
+            for status, amount, delivered in (
+                ("delivered", 100, date(2024, 1, 30)),
+                ("delivered", 300, date(2024, 2, 5)),
+                ("pending", 200, None),
+                ("cancelled", 1000, date(2024, 1, 1))
+            )
+        ])
+        connection.execute(insert(transportation_emissions), [
+            {"supplier_id": 1, "distance": 100, "transport_mode": "truck", "return_trip": False,
+             "total_emissions": emissions, "transport_efficiency_score": efficiency, "created_at": created_at}
+            for emissions, efficiency, created_at in (
+                (500.0, 60.0, datetime.now(timezone.utc)),
+                (1500.0, 80.0, datetime(2000, 1, 1, tzinfo=timezone.utc))
+            )
+        ])
+    engine.dispose()
+    return f"sqlite+aiosqlite:///{path}"
+
+def make_service(database, cache=None):
+    engine = create_async_engine(database)
+    return SupplierAnalyticsService(engine_factory=lambda: engine, cache=cache)
+
+@pytest.mark.asyncio
+async def test_analytics_are_aggregated_from_the_database(database):
+    service = make_service(database)
+    analytics = await service.get_supplier_analytics(1)
+
+    assert analytics.total_orders == 4
+    assert analytics.average_order_value == pytest.approx(200)
+    assert analytics.on_time_delivery_rate == 0.5
+    assert analytics.environmental_score == pytest.approx(0.7)
+    assert analytics.sustainability_metrics["emissions_per_km"] == pytest.approx(10)
+
+    impact = await service.get_environmental_impact(1)
+    # Declared 12 t plus the 500 kg shipped within the last year
+    assert impact.carbon_footprint == pytest.approx(12.5)
+    assert impact.waste_management_score == 1.0
+    assert impact.sustainability_goals_progress["renewable_energy"] == pytest.approx(0.4)
+
+@pytest.mark.asyncio
+async def test_supplier_without_activity_and_missing_supplier(database):
+    service = make_service(database)
+    analytics = await service.get_supplier_analytics(2)
+
+    assert analytics.total_orders == 0
+    assert analytics.on_time_delivery_rate == 0.0
+    assert analytics.sustainability_metrics["shipment_count"] == 0
+    with pytest.raises(NotFoundError):
+        await service.get_supplier_analytics(99)
+
+@pytest.mark.asyncio
+async def test_results_are_cached_per_supplier(database):
+    service = make_service(database, cache=ResultCache())
+    await service.get_supplier_analytics(1)
+    await service.get_supplier_analytics(1)
+    await service.get_supplier_analytics(2)
+
+    assert service.cache.stats["hits"] == 1
+    assert service.cache.stats["misses"] == 2
+
+def test_endpoints_return_404_for_unknown_supplier(database):
+    service = make_service(database)
+    app.dependency_overrides[get_supplier_analytics_service] = lambda: service
+    try:
+        with TestClient(app) as client:
+            headers = {"X-API-Key": settings.API_KEY}
+            assert client.get("/api/suppliers/1/analytics", headers=headers).json()["total_orders"] == 4
+            assert client.get("/api/suppliers/99/environmental-impact", headers=headers).status_code == 404
+    finally:
+        app.dependency_overrides.clear()
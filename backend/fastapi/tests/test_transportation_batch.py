@@ -0,0 +1,72 @@
+import pytest
+from app.engines.transportation_engine import TransportationEngine
+from app.schemas.transportation import TransportationInput, TransportationBatchInput
+from app.exceptions import ValidationError
+
+@pytest.fixture
+def transportation_engine():
+    return TransportationEngine()
+
+@pytest.fixture
+def batch_input():
+    return {
+        "supplier_id": ["SUP001", "SUP002", "SUP003", "SUP004"],
+        "distance": [250, 1200, 400, 80],
+        "volume": [10, 40, 5, 2],
+        "transport_mode": ["truck", "train", "truck", "ship"],
+        "vehicle_type": ["large_truck", None, None, None],  # Third leg is a truck without a vehicle type
+        "fuel_type": ["diesel", None, "petrol", None],
+        "load_factor": [0.9, 0.7, 0.5, 0.6],
+        "return_trip": [False, True, False, False]
+    }
+
+@pytest.mark.asyncio
+async def test_batch_matches_single_leg_calculation(transportation_engine, batch_input):
+    result = await transportation_engine.calculate_transportation_emissions_batch(
+        TransportationBatchInput(**batch_input)
+    )
+
+    assert result.valid == [True, True, False, True]
+    assert result.processed_rows == 3
+    for index, ok in enumerate(result.valid):
+        if not ok:
+            continue
+        single = await transportation_engine.calculate_transportation_emissions(TransportationInput(
+            **{key: values[index] for key, values in batch_input.items()}
+        ))
+        assert result.total_emissions[index] == pytest.approx(single.total_emissions)
+        assert result.emissions_per_km[index] == pytest.approx(single.emissions_per_km)
+        assert result.emissions_per_volume[index] == pytest.approx(single.emissions_per_volume)
+        assert result.transport_efficiency_score[index] == pytest.approx(single.transport_efficiency_score)
+
+@pytest.mark.asyncio
+async def test_batch_masks_invalid_legs(transportation_engine, batch_input):
+    batch_input["load_factor"][3] = 0
+    result = await transportation_engine.calculate_transportation_emissions_batch(
+        TransportationBatchInput(**batch_input)
+    )
+
+    assert result.valid == [True, True, False, False]
+    assert result.total_emissions[2] is None
+    assert result.errors[2] == ["Vehicle type is required for road transport"]
+    assert result.errors[3] == ["Load factor must be between 0 and 1"]
+    assert result.errors[0] == []
+
+@pytest.mark.asyncio
+async def test_batch_return_trip_defaults_to_false(transportation_engine, batch_input):
+    del batch_input["return_trip"]
+    result = await transportation_engine.calculate_transportation_emissions_batch(
+        TransportationBatchInput(**batch_input)
+    )
+    single = await transportation_engine.calculate_transportation_emissions(TransportationInput(
+        **{key: values[1] for key, values in batch_input.items()}
+    ))
+    assert result.total_emissions[1] == pytest.approx(single.total_emissions)
+
+@pytest.mark.asyncio
+async def test_batch_empty_input(transportation_engine):
+    empty = {name: [] for name in TransportationBatchInput.model_fields}
+    with pytest.raises(ValidationError):
+        await transportation_engine.calculate_transportation_emissions_batch(
+            TransportationBatchInput(**empty)
+        )